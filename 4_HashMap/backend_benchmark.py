@@ -0,0 +1,119 @@
+# ===============================
+# HashMap Backend Benchmark
+# ===============================
+#
+# Compares interchangeable HashMap backends that share the
+# __setitem__ / __getitem__ / remove API:
+#   - memory per entry of the table structure itself (keys and values are
+#     shared between backends and are not counted)
+#   - insertion and lookup throughput (successful and unsuccessful lookups)
+#   - 99th-percentile latency of a successful lookup (tail latency)
+#   - iteration time over items() after 90% of the keys have been removed
+#
+# Run with:
+#     python 4_HashMap/backend_benchmark.py
+
+import sys
+import time
+
+from compact_hashmap import CompactHashMap
+from cuckoo_hashmap import CuckooHashMap
+from hashmap import HashMap
+from robin_hood_hashmap import RobinHoodHashMap
+
+
+# ===============================
+# MEMORY MEASUREMENT
+# ===============================
+def chaining_table_bytes(hashmap):
+    """Bucket array + one list per bucket + one tuple and cached hash int per entry."""
+    total = sys.getsizeof(hashmap.arr)
+    for bucket in hashmap.arr:
+        total += sys.getsizeof(bucket)
+        for element in bucket:
+            total += sys.getsizeof(element) + sys.getsizeof(element[2])
+    return total
+
+
+def robin_hood_table_bytes(hashmap):
+    """Three flat parallel arrays, no per-entry objects."""
+    return sys.getsizeof(hashmap.hashes) + sys.getsizeof(hashmap.keys) + sys.getsizeof(hashmap.values)
+
+
+def compact_table_bytes(hashmap):
+    """Small typed index table + dense, insertion-ordered entries arrays."""
+    return (sys.getsizeof(hashmap.indices) + sys.getsizeof(hashmap.entry_hashes)
+            + sum(sys.getsizeof(code) for code in hashmap.entry_hashes)
+            + sys.getsizeof(hashmap.entry_keys) + sys.getsizeof(hashmap.entry_values))
+
+
+def cuckoo_table_bytes(hashmap):
+    """Flat parallel slot arrays (4 slots per bucket) plus the small stash."""
+    return (sys.getsizeof(hashmap.hashes) + sys.getsizeof(hashmap.keys)
+            + sys.getsizeof(hashmap.values) + sys.getsizeof(hashmap.stash))
+
+
+BACKENDS = {
+    "chaining": (lambda: HashMap(8), chaining_table_bytes),
+    "robin hood": (lambda: RobinHoodHashMap(8), robin_hood_table_bytes),
+    "compact": (lambda: CompactHashMap(8), compact_table_bytes),
+    "cuckoo": (lambda: CuckooHashMap(8), cuckoo_table_bytes),
+}
+
+
+# ===============================
+# BENCHMARK
+# ===============================
+def run_benchmark(n=200000):
+    keys = [f"user_{i:07d}" for i in range(n)]
+    missing = [f"ghost_{i:07d}" for i in range(n)]
+
+    print(f"{'backend':<14}{'bytes/entry':>12}{'insert/s':>12}{'hit/s':>12}{'miss/s':>12}"
+          f"{'hit p99 ns':>12}{'sparse iter ms':>16}")
+    for name, (factory, table_bytes) in BACKENDS.items():
+        hashmap = factory()
+
+        start = time.perf_counter()
+        for i, key in enumerate(keys):
+            hashmap[key] = i
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            hashmap[key]
+        hit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in missing:
+            try:
+                hashmap[key]
+            except KeyError:
+                pass
+        miss_time = time.perf_counter() - start
+
+        timings = []
+        for key in keys[::max(1, n // 20000)]:
+            t0 = time.perf_counter_ns()
+            hashmap[key]
+            timings.append(time.perf_counter_ns() - t0)
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99)]
+
+        bytes_per_entry = table_bytes(hashmap) / n
+
+        for key in keys[: n * 9 // 10]:
+            hashmap.remove(key)
+        start = time.perf_counter()
+        for _ in hashmap.items():
+            pass
+        iter_time = time.perf_counter() - start
+
+        print(f"{name:<14}{bytes_per_entry:>12.1f}{n / insert_time:>12,.0f}"
+              f"{n / hit_time:>12,.0f}{n / miss_time:>12,.0f}{p99:>12}{iter_time * 1000:>16.1f}")
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,695 @@
+# ===============================
+# Cache Implementation (TTL + LRU / LFU / W-TinyLFU eviction) on HashMap
+# ===============================
+
+import functools
+import heapq
+import sys
+import time
+
+from hashmap import HashMap, mixed_hash
+
+_MISSING = object()
+COMPACT_SLACK = 16  # Dead expiry-heap items tolerated on top of 2x the entry count
+
+
+class CacheEntry:
+    """
+    CacheEntry is one cached key-value pair, stored as the value in the HashMap.
+
+    It doubles as a node of the eviction policy's doubly linked lists, so moving
+    an entry (e.g. to the most-recently-used end) is O(1).
+
+    Attributes:
+        key (Hashable): The cache key.
+        value (Any): The cached value.
+        size (int): Cost of the entry against the byte budget.
+        expires_at (float | None): Clock time after which the entry is stale.
+        expiry_seq (int | None): Sequence number of the entry's live item in
+            the expiry heap; older items for the entry are dead.
+        prev, next (CacheEntry): Neighbours in the policy's linked list.
+        owner (Any): The list (or frequency node) the entry currently lives in.
+    """
+    __slots__ = ("key", "value", "size", "expires_at", "expiry_seq", "prev", "next", "owner")
+
+    def __init__(self, key=None, value=None, size=0, expires_at=None):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.expiry_seq = None
+        self.prev = self.next = None
+        self.owner = None
+
+
+class EntryList:
+    """
+    Circular doubly linked list with a sentinel node.
+
+    The front holds the most recently used entry, the back (sentinel.prev) the
+    least recently used one. All operations are O(1).
+    """
+    def __init__(self):
+        self.sentinel = CacheEntry()
+        self.sentinel.prev = self.sentinel.next = self.sentinel
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def push_front(self, entry):
+        first = self.sentinel.next
+        entry.prev, entry.next = self.sentinel, first
+        first.prev = self.sentinel.next = entry
+        entry.owner = self
+        self.length += 1
+
+    def unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = entry.owner = None
+        self.length -= 1
+
+    def move_to_front(self, entry):
+        self.unlink(entry)
+        self.push_front(entry)
+
+    def back(self, exclude=None):
+        """
+        Return the least recently used entry other than exclude, or None if
+        there is none.
+        """
+        entry = None if self.length == 0 else self.sentinel.prev
+        if entry is not None and entry is exclude:
+            entry = None if entry.prev is self.sentinel else entry.prev
+        return entry
+
+
+# ===============================
+# EVICTION POLICIES
+# ===============================
+# Every policy implements the same O(1) interface:
+#   on_insert(entry), on_access(entry), on_remove(entry),
+#   evict(exclude=None) -> the entry to drop next, never exclude (None if no
+#   other entry is left). The cache passes the entry it is inserting as
+#   exclude, so a new key is never evicted by its own set().
+
+class LRUPolicy:
+    """
+    Least Recently Used: evict the entry that was touched longest ago.
+
+    Complexity: O(1) for every operation (one doubly linked list).
+    """
+    def __init__(self, capacity=None):
+        self.entries = EntryList()
+
+    def on_insert(self, entry):
+        self.entries.push_front(entry)
+
+    def on_access(self, entry):
+        self.entries.move_to_front(entry)
+
+    def on_remove(self, entry):
+        self.entries.unlink(entry)
+
+    def evict(self, exclude=None):
+        return self.entries.back(exclude)
+
+
+class FrequencyNode:
+    """One node of the LFU frequency list: all entries used exactly `freq` times."""
+    def __init__(self, freq):
+        self.freq = freq
+        self.entries = EntryList()
+        self.prev = self.next = None
+
+
+class LFUPolicy:
+    """
+    Least Frequently Used: evict the entry with the fewest accesses, breaking
+    ties by recency.
+
+    Theory:
+        - Entries are grouped into FrequencyNodes kept in a doubly linked list
+          sorted by frequency (the O(1) LFU scheme of Shah, Mitra and Matani).
+        - An access moves the entry from node f to node f + 1, creating that
+          node right after f if needed, and drops f if it became empty.
+        - The victim is the least recently used entry of the first node.
+
+    Complexity: O(1) for every operation.
+    """
+    def __init__(self, capacity=None):
+        self.head = FrequencyNode(0)  # Sentinel of the frequency list
+        self.head.prev = self.head.next = self.head
+
+    def _node_after(self, node, freq):
+        if node.next is not self.head and node.next.freq == freq:
+            return node.next
+        new_node = FrequencyNode(freq)
+        new_node.prev, new_node.next = node, node.next
+        node.next.prev = node.next = new_node
+        return new_node
+
+    def _drop_if_empty(self, node):
+        if len(node.entries) == 0:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+    def on_insert(self, entry):
+        node = self._node_after(self.head, 1)
+        node.entries.push_front(entry)
+        entry.owner = node
+
+    def on_access(self, entry):
+        node = entry.owner
+        target = self._node_after(node, node.freq + 1)
+        node.entries.unlink(entry)
+        target.entries.push_front(entry)
+        entry.owner = target
+        self._drop_if_empty(node)
+
+    def on_remove(self, entry):
+        node = entry.owner
+        node.entries.unlink(entry)
+        self._drop_if_empty(node)
+
+    def evict(self, exclude=None):
+        node = self.head.next
+        while node is not self.head:
+            victim = node.entries.back(exclude)
+            if victim is not None:
+                return victim
+            node = node.next  # The first node held only exclude
+        return None
+
+
+class CountMinSketch:
+    """
+    Approximate frequency counter used by W-TinyLFU as its admission filter.
+
+    Theory:
+        - depth rows of width small counters; an item increments one counter per
+          row (chosen by a different hash per row), and its estimate is the
+          minimum of those counters. Collisions can only over-count.
+        - Counters saturate at 15 (4 bits in the original design), and every
+          sample_size increments all counters are halved ("aging"), so the
+          sketch follows changes in popularity.
+
+    Complexity: O(depth) per increment/estimate, O(width * depth) space.
+    """
+    def __init__(self, width, depth=4):
+        width = max(16, width)
+        self.width = width
+        self.depth = depth
+        self.table = [[0] * width for _ in range(depth)]
+        self.sample_size = 10 * width
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = mixed_hash(key)
+        low, high = h & 0xFFFFFFFF, h >> 32
+        return [(low + i * high) % self.width for i in range(self.depth)]  # Double hashing
+
+    def increment(self, key):
+        for row, idx in zip(self.table, self._indexes(key)):
+            if row[idx] < 15:
+                row[idx] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = [[count >> 1 for count in row] for row in self.table]
+            self.additions //= 2
+
+    def estimate(self, key):
+        return min(row[idx] for row, idx in zip(self.table, self._indexes(key)))
+
+
+class WTinyLFUPolicy:
+    """
+    Window TinyLFU: a small LRU window in front of a frequency-filtered main area.
+
+    Theory:
+        - New entries enter a window LRU (about 1% of the capacity), which
+          absorbs bursts of brand-new keys.
+        - The main area is a segmented LRU: `probation` for entries admitted
+          from the window, `protected` (80% of the main area) for entries hit
+          again while on probation.
+        - Admission: when the window overflows, its LRU entry (the candidate)
+          leaves it. If the main area has room, the candidate joins probation.
+          Otherwise it competes with the main area's victim (the probation LRU
+          entry, or the protected one if probation is empty): the one with the
+          higher CountMinSketch frequency estimate stays in the main area, and
+          the loser (the candidate on a tie) is marked rejected and is the
+          next entry evict() returns. One-hit wonders therefore never push
+          popular entries out, and a scan of new keys only churns the window.
+        - If the cache must evict without a pending rejection (a byte budget,
+          or entries removed in the meantime), the window LRU entry and the
+          main victim compete in the same way.
+
+    Complexity: O(1) per operation (plus O(depth) sketch work).
+    """
+    def __init__(self, capacity=None):
+        capacity = capacity or 1024
+        self.window_cap = max(1, capacity // 100)
+        self.main_cap = max(1, capacity - self.window_cap)
+        self.protected_cap = max(1, self.main_cap * 4 // 5)
+        self.window = EntryList()
+        self.probation = EntryList()
+        self.protected = EntryList()
+        self.rejected = EntryList()  # Lost admission; evicted first
+        self.sketch = CountMinSketch(capacity)
+
+    def _main_victim(self, exclude=None):
+        return self.probation.back(exclude) or self.protected.back(exclude)
+
+    def _loser(self, candidate, victim):
+        """Of a window candidate and a main-area victim, the one to evict."""
+        if candidate is None or victim is None:
+            return candidate or victim
+        if self.sketch.estimate(candidate.key) > self.sketch.estimate(victim.key):
+            return victim
+        return candidate
+
+    def on_insert(self, entry):
+        self.sketch.increment(entry.key)
+        self.window.push_front(entry)
+        if len(self.window) <= self.window_cap:
+            return
+        candidate = self.window.back()
+        self.window.unlink(candidate)
+        self.probation.push_front(candidate)
+        if len(self.probation) + len(self.protected) > self.main_cap:
+            loser = self._loser(candidate, self._main_victim(exclude=candidate))
+            loser.owner.unlink(loser)
+            self.rejected.push_front(loser)
+
+    def on_access(self, entry):
+        self.sketch.increment(entry.key)
+        owner = entry.owner
+        if owner is self.probation:
+            self.probation.unlink(entry)
+            self.protected.push_front(entry)
+            if len(self.protected) > self.protected_cap:
+                demoted = self.protected.back()
+                self.protected.unlink(demoted)
+                self.probation.push_front(demoted)
+        elif owner is self.rejected:
+            # Read again before it was evicted: back to the window
+            self.rejected.unlink(entry)
+            self.window.push_front(entry)
+        else:
+            owner.move_to_front(entry)
+
+    def on_remove(self, entry):
+        entry.owner.unlink(entry)
+
+    def evict(self, exclude=None):
+        rejected = self.rejected.back(exclude)
+        if rejected is not None:
+            return rejected
+        return self._loser(self.window.back(exclude), self._main_victim(exclude))
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "w-tinylfu": WTinyLFUPolicy,
+}
+
+
+# ===============================
+# CACHE
+# ===============================
+class Cache:
+    """
+    Bounded cache built on HashMap with TTL expiry and pluggable eviction.
+
+    Theory:
+        - A HashMap maps each key to its CacheEntry, giving O(1) lookups.
+        - The eviction policy (LRU, LFU or W-TinyLFU) keeps its own O(1)
+          bookkeeping through the entries' linked-list pointers.
+        - Capacity can be bounded by entry count (max_entries), by total size
+          (max_bytes, measured with the sizeof function), or both. After every
+          insert, other entries are evicted until both bounds hold again; the
+          entry just set is only dropped if it alone exceeds max_bytes.
+        - TTL expiry is lazy: an expired entry is dropped when it is read. In
+          addition, expiry times are kept in a min-heap, and every
+          sweep_interval seconds the cache pops and removes everything that has
+          expired, so entries that are never read again do not linger.
+        - Replacing or removing an entry leaves its old heap item behind as a
+          dead item (its sequence number no longer matches the entry). Once the
+          heap holds more than twice as many items as there are entries, it is
+          compacted down to the live items, so dead items (and the values they
+          reference) cannot outgrow the max_entries / max_bytes bounds.
+        - Hit, miss, eviction and expiration counters are kept for tuning.
+
+    Real-world Usage:
+        - Caching API responses, database rows and rendered pages.
+        - Memoizing expensive pure functions (see memoize below).
+
+    Complexity Overview:
+        - get / set / remove: O(1) average (amortized O(log n) for TTL heap pushes
+          and compaction)
+        - sweep: O(k log n) for k expired entries
+        - Space Complexity: O(n)
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None, policy="lru",
+                 sizeof=sys.getsizeof, sweep_interval=60.0, clock=time.monotonic):
+        """
+        Initialize the Cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries.
+            max_bytes (int, optional): Maximum total size, as measured by sizeof.
+            ttl (float, optional): Default time-to-live in seconds. None = no expiry.
+            policy (str, optional): "lru", "lfu" or "w-tinylfu". Defaults to "lru".
+            sizeof (Callable, optional): Returns the size of a value. Defaults to
+                sys.getsizeof.
+            sweep_interval (float, optional): Seconds between automatic expiry
+                sweeps. None disables them. Defaults to 60.
+            clock (Callable, optional): Time source. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the policy name is unknown.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"unknown eviction policy '{policy}', expected one of {list(POLICIES)}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+        self.map = HashMap(16)
+        self.policy = POLICIES[policy](max_entries)
+        self.total_bytes = 0
+        self.expiry_heap = []  # (expires_at, sequence, entry)
+        self.sequence = 0
+        self.next_sweep = clock() + sweep_interval if sweep_interval is not None else None
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        """Return the number of entries (expired but unswept entries included)."""
+        return len(self.map)
+
+    def __contains__(self, key):
+        """Return True if key is cached and not expired. Does not count as a hit or miss."""
+        entry = self.map.get(key)
+        return entry is not None and not self._expired(entry, self.clock())
+
+    def _expired(self, entry, now):
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _drop(self, entry):
+        entry.expiry_seq = None  # Its heap item, if any, is now dead
+        self.map.remove(entry.key)
+        self.policy.on_remove(entry)
+        self.total_bytes -= entry.size
+
+    def _maybe_sweep(self, now):
+        if self.next_sweep is not None and now >= self.next_sweep:
+            self.sweep(now)
+
+    # ===============================
+    # READ METHODS
+    # ===============================
+    def get(self, key, default=None):
+        """
+        Return the cached value for key, or default on a miss or expired entry.
+
+        Time Complexity:
+            - O(1) average.
+        """
+        now = self.clock()
+        self._maybe_sweep(now)
+        entry = self.map.get(key)
+        if entry is not None and self._expired(entry, now):
+            self._drop(entry)  # Lazy expiry
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.policy.on_access(entry)
+        return entry.value
+
+    def __getitem__(self, key):
+        """
+        Return the cached value for key.
+
+        Raises:
+            KeyError: If key is missing or expired.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"key '{key}' not found")
+        return value
+
+    # ===============================
+    # WRITE METHODS
+    # ===============================
+    def set(self, key, value, ttl=_MISSING):
+        """
+        Insert or replace a cached value, then evict until within budget.
+        Replacing counts as an access for the eviction policy.
+
+        Time Complexity:
+            - O(1) average, plus O(log n) when the entry has a TTL.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (float, optional): Time-to-live for this entry; defaults to the
+                cache-wide ttl. None means the entry never expires.
+        """
+        now = self.clock()
+        self._maybe_sweep(now)
+        ttl = self.ttl if ttl is _MISSING else ttl
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = None if ttl is None else now + ttl
+
+        entry = self.map.get(key)
+        if entry is not None:
+            # Replace in place so the policy keeps the entry's recency/frequency
+            self.total_bytes += size - entry.size
+            entry.value, entry.size, entry.expires_at = value, size, expires_at
+            self.policy.on_access(entry)
+        else:
+            entry = CacheEntry(key, value, size, expires_at)
+            self.map[key] = entry
+            self.policy.on_insert(entry)
+            self.total_bytes += size
+        if entry.expires_at is not None:
+            self.sequence += 1
+            entry.expiry_seq = self.sequence
+            heapq.heappush(self.expiry_heap, (entry.expires_at, self.sequence, entry))
+            if len(self.expiry_heap) > 2 * len(self.map) + COMPACT_SLACK:
+                self._compact_heap()
+        else:
+            entry.expiry_seq = None
+
+        while ((self.max_entries is not None and len(self.map) > self.max_entries)
+               or (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            # Never the entry just set, unless it alone exceeds the budget
+            victim = self.policy.evict(exclude=entry) or entry
+            self._drop(victim)
+            self.evictions += 1
+            if victim is entry:
+                break
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def remove(self, key):
+        """
+        Delete a cached key.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        entry = self.map.get(key)
+        if entry is None:
+            return False
+        self._drop(entry)
+        return True
+
+    def clear(self):
+        """Remove every entry (statistics are kept)."""
+        for key in list(self.map.keys()):
+            self._drop(self.map[key])
+        self.expiry_heap = []
+
+    # ===============================
+    # EXPIRY SWEEP
+    # ===============================
+    def _compact_heap(self):
+        """Rebuild the expiry heap from its live items only. O(n)."""
+        self.expiry_heap = [item for item in self.expiry_heap if item[2].expiry_seq == item[1]]
+        heapq.heapify(self.expiry_heap)
+
+    def sweep(self, now=None):
+        """
+        Remove every expired entry.
+
+        Dead heap items (for entries that were removed, or set again, in the
+        meantime) are recognised and skipped.
+
+        Time Complexity:
+            - O(k log n), where k is the number of heap items popped.
+
+        Returns:
+            int: Number of entries that expired.
+        """
+        now = self.clock() if now is None else now
+        heap = self.expiry_heap
+        expired = 0
+        while heap and heap[0][0] <= now:
+            _, seq, entry = heapq.heappop(heap)
+            if entry.expiry_seq == seq:
+                self._drop(entry)
+                expired += 1
+        self.expirations += expired
+        if self.sweep_interval is not None:
+            self.next_sweep = now + self.sweep_interval
+        return expired
+
+    # ===============================
+    # STATISTICS
+    # ===============================
+    def stats(self):
+        """
+        Return hit/miss/eviction/expiration counters and current usage.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, expirations, entries, bytes.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self.map),
+            "bytes": self.total_bytes,
+        }
+
+
+# ===============================
+# MEMOIZE DECORATOR
+# ===============================
+def memoize(max_entries=128, ttl=None, policy="lru", max_bytes=None, typed=False):
+    """
+    Decorator that caches a function's results in a Cache.
+
+    Arguments must be hashable. The cache is available as `func.cache`, e.g.
+    `func.cache.stats()`.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached results. Defaults to 128.
+        ttl (float, optional): Time-to-live of each result in seconds.
+        policy (str, optional): Eviction policy. Defaults to "lru".
+        max_bytes (int, optional): Byte budget for cached results.
+        typed (bool, optional): Cache f(1) and f(1.0) separately. Defaults to False.
+
+    Example:
+        @memoize(max_entries=1000, ttl=300)
+        def fetch_profile(user_id):
+            ...
+    """
+    def decorator(func):
+        cache = Cache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, policy=policy)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_MISSING,) + tuple(sorted(kwargs.items()))
+            if typed:
+                key += tuple(type(arg) for arg in args)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    # LRU with a 3-entry bound
+    lru = Cache(max_entries=3, policy="lru")
+    for manga in ["Vagabond", "Berserk", "Monster"]:
+        lru[manga] = f"{manga} details"
+    lru.get("Vagabond")            # Vagabond becomes most recently used
+    lru["Pluto"] = "Pluto details"  # Evicts Berserk (least recently used)
+    print("LRU keeps Berserk?", "Berserk" in lru, "| keeps Vagabond?", "Vagabond" in lru)
+
+    # LFU: the most frequently read entry survives
+    lfu = Cache(max_entries=2, policy="lfu")
+    lfu["a"], lfu["b"] = 1, 2
+    for _ in range(3):
+        lfu.get("a")
+    lfu.get("b")
+    lfu["c"] = 3                   # Evicts "b" (used least often), never the new "c"
+    print("LFU keeps a?", "a" in lfu, "| keeps b?", "b" in lfu, "| c cached right after set?", "c" in lfu)
+
+    # Every policy keeps the key it just stored, even when older keys are hotter
+    readable = {}
+    for policy in POLICIES:
+        cache = Cache(max_entries=2, policy=policy)
+        cache["a"], cache["b"] = 1, 2
+        for _ in range(5):
+            cache.get("a"), cache.get("b")
+        cache["c"] = 3
+        readable[policy] = cache.get("c") == 3
+    print("New key readable right after set:", readable)
+
+    # W-TinyLFU admission: a key seen once does not displace a hot one...
+    tiny = Cache(max_entries=2, policy="w-tinylfu")
+    tiny["hot"] = "hot value"
+    for _ in range(5):
+        tiny.get("hot")
+    tiny["once"] = "read once"     # Enters the window
+    tiny["next"] = "next value"    # "once" leaves the window and loses to "hot"
+    print("W-TinyLFU keeps hot?", "hot" in tiny, "| admits once?", "once" in tiny)
+
+    # ...and frequently used keys survive a scan of 1,000 new keys, unlike LRU
+    for policy in ("lru", "w-tinylfu"):
+        scanned = Cache(max_entries=100, policy=policy)
+        for round_ in range(5):
+            for i in range(50):
+                scanned[f"hot-{i}"] = i
+                scanned.get(f"hot-{i}")
+        for i in range(1000):
+            scanned[f"scan-{i}"] = i
+        survivors = sum(f"hot-{i}" in scanned for i in range(50))
+        print(f"{policy}: {survivors}/50 hot keys survive the scan")
+
+    # TTL with a fake clock
+    now = [0.0]
+    ttl_cache = Cache(ttl=10, clock=lambda: now[0], sweep_interval=5)
+    ttl_cache["token"] = "abc123"
+    ttl_cache.set("session", "xyz", ttl=30)
+    now[0] = 12.0
+    print("Token after 12s:", ttl_cache.get("token"), "| session:", ttl_cache.get("session"))
+
+    # Byte budget
+    sized = Cache(max_bytes=200, sizeof=len)
+    sized["page1"] = "x" * 120
+    sized["page2"] = "y" * 120      # Total 240 > 200: page1 is evicted
+    print("Byte-bounded cache keys:", list(sized.map.keys()), "bytes:", sized.total_bytes)
+
+    # Memoized function
+    @memoize(max_entries=100, policy="w-tinylfu")
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print("fibonacci(80) =", fibonacci(80))
+    print("Stats:", fibonacci.cache.stats())
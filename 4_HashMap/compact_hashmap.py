@@ -0,0 +1,327 @@
+# ===============================
+# Compact (Insertion-Ordered) Hash Map Implementation
+# ===============================
+
+from array import array
+
+from hashmap import MASK_64, mixed_hash
+
+EMPTY = -1    # Index slot never used
+DUMMY = -2    # Index slot whose entry was deleted (keeps probe chains intact)
+_DELETED = object()  # Marks a dead entry in the dense entries arrays
+
+
+def _index_typecode(capacity):
+    """Pick the smallest signed integer type able to address `capacity` entries."""
+    if capacity <= 0x7F:
+        return "b"
+    if capacity <= 0x7FFF:
+        return "h"
+    if capacity <= 0x7FFFFFFF:
+        return "i"
+    return "q"
+
+
+class CompactHashMap:
+    """
+    HashMap implementation with CPython's compact dict layout.
+
+    Theory:
+        - The table is split in two parts:
+            1. indices: a sparse open-addressing table of small integers
+               (1, 2, 4 or 8 bytes each, chosen from the capacity). Each slot holds
+               EMPTY, DUMMY or the position of an entry in the dense arrays.
+            2. entries: dense, insertion-ordered parallel arrays of hash codes,
+               keys and values. New entries are always appended at the end.
+        - Only the tiny indices table is sparse; the large entries arrays hold
+          at most 2/3 of the capacity, so sparse maps waste very little memory.
+        - Iteration walks the dense entries arrays, so it costs O(n) no matter
+          how large the capacity is, and entries come out in insertion order.
+        - Probing follows CPython: i = (5 * i + perturb + 1) & mask, with perturb
+          starting at the hash code and shifted right by 5 each step, so every
+          bit of the hash code eventually takes part in choosing a slot.
+        - A deleted entry leaves a hole in the entries arrays; holes are squeezed
+          out on resize, or as soon as they outnumber the live entries.
+
+    Real-world Usage:
+        - Python's own dict (since 3.6) uses exactly this layout.
+        - Ordered configuration maps, JSON objects, and LRU-style ordered caches.
+
+    Complexity Overview:
+        - Average Case:
+            Insert: O(1) (amortized, including resizing)
+            Search: O(1)
+            Delete: O(1) (amortized, including compaction)
+        - Worst Case:
+            Insert: O(n)
+            Search: O(n)
+            Delete: O(n)
+        - Iteration: O(n), independent of capacity.
+        - Space Complexity: O(n) entries + one small integer per index slot.
+    """
+
+    def __init__(self, size=8, hash_func=mixed_hash):
+        """
+        Initialize the CompactHashMap.
+
+        Args:
+            size (int, optional): Minimum initial number of index slots (rounded
+                up to a power of two). Defaults to 8.
+            hash_func (Callable, optional): Maps a key to an integer hash code.
+                Defaults to mixed_hash.
+        """
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self.hash_func = hash_func
+        self.count = 0
+        self.entry_hashes = []
+        self.entry_keys = []
+        self.entry_values = []
+        self._build_indices(capacity)
+
+    def _build_indices(self, capacity):
+        self.MAX_SIZE = capacity
+        self.mask = capacity - 1
+        self.usable = (capacity * 2) // 3  # Entries allowed before resizing
+        self.indices = array(_index_typecode(capacity), [EMPTY]) * capacity
+        for pos, code in enumerate(self.entry_hashes):
+            self.indices[self._free_slot(code)] = pos
+
+    def __len__(self):
+        """Return the number of key-value pairs stored in the map."""
+        return self.count
+
+    def get_hash(self, key):
+        """Return the home index slot of a key within [0, MAX_SIZE-1]."""
+        return (self.hash_func(key) & MASK_64) & self.mask
+
+    def _free_slot(self, code):
+        """Return the first EMPTY index slot on the probe sequence of code."""
+        indices, mask = self.indices, self.mask
+        perturb = code
+        idx = code & mask
+        while indices[idx] != EMPTY:
+            perturb >>= 5
+            idx = (idx * 5 + perturb + 1) & mask
+        return idx
+
+    def _lookup(self, key, code):
+        """
+        Walk the probe sequence of key.
+
+        Returns:
+            tuple: (index slot, entry position). The entry position is -1 when
+            the key is absent; the index slot is then the slot to insert into.
+        """
+        indices, mask = self.indices, self.mask
+        entry_hashes, entry_keys = self.entry_hashes, self.entry_keys
+        perturb = code
+        idx = code & mask
+        first_dummy = -1
+        while True:
+            pos = indices[idx]
+            if pos == EMPTY:
+                return (first_dummy if first_dummy >= 0 else idx), -1
+            if pos == DUMMY:
+                if first_dummy < 0:
+                    first_dummy = idx
+            elif entry_hashes[pos] == code and entry_keys[pos] == key:
+                return idx, pos
+            perturb >>= 5
+            idx = (idx * 5 + perturb + 1) & mask
+
+    # ===============================
+    # INSERTION METHOD
+    # ===============================
+    def __setitem__(self, key, val):
+        """
+        Insert or update a key-value pair. New keys are appended to the dense
+        entries arrays, preserving insertion order.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        Space Complexity:
+            - O(1) (amortized O(n) when the table is resized)
+        """
+        code = self.hash_func(key) & MASK_64
+        idx, pos = self._lookup(key, code)
+        if pos >= 0:
+            self.entry_values[pos] = val  # Update existing key
+            return
+
+        if len(self.entry_hashes) >= self.usable:
+            self._resize(self.count * 3)
+            idx = self._free_slot(code)
+
+        self.indices[idx] = len(self.entry_hashes)
+        self.entry_hashes.append(code)
+        self.entry_keys.append(key)
+        self.entry_values.append(val)
+        self.count += 1
+
+    # ===============================
+    # SEARCH METHODS
+    # ===============================
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        pos = self._lookup(key, self.hash_func(key) & MASK_64)[1]
+        if pos < 0:
+            raise KeyError(f"key '{key}' not found")
+        return self.entry_values[pos]
+
+    def __contains__(self, key):
+        return self._lookup(key, self.hash_func(key) & MASK_64)[1] >= 0
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if the key is absent."""
+        pos = self._lookup(key, self.hash_func(key) & MASK_64)[1]
+        return self.entry_values[pos] if pos >= 0 else default
+
+    # ===============================
+    # DELETION METHOD
+    # ===============================
+    def remove(self, key):
+        """
+        Delete a key. Its index slot becomes DUMMY and its entry becomes a hole
+        that is squeezed out on the next compaction.
+
+        Time Complexity:
+            - Average Case: O(1) (amortized)
+            - Worst Case: O(n)
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        idx, pos = self._lookup(key, self.hash_func(key) & MASK_64)
+        if pos < 0:
+            return False
+        self.indices[idx] = DUMMY
+        self.entry_keys[pos] = _DELETED
+        self.entry_values[pos] = None
+        self.count -= 1
+
+        # Keep iteration O(n): compact once holes outnumber live entries
+        if len(self.entry_hashes) - self.count > max(self.count, 8):
+            self._resize(self.count * 3)
+        return True
+
+    def _resize(self, min_slots):
+        """Drop deleted entries and rebuild the index table with >= min_slots slots."""
+        live = [pos for pos, key in enumerate(self.entry_keys) if key is not _DELETED]
+        self.entry_hashes = [self.entry_hashes[pos] for pos in live]
+        self.entry_keys = [self.entry_keys[pos] for pos in live]
+        self.entry_values = [self.entry_values[pos] for pos in live]
+        capacity = 8
+        while capacity < min_slots:
+            capacity *= 2
+        self._build_indices(capacity)
+
+    # ===============================
+    # ITERATION VIEWS
+    # ===============================
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        """Return a lazy, insertion-ordered view of the keys."""
+        return KeysView(self)
+
+    def values(self):
+        """Return a lazy, insertion-ordered view of the values."""
+        return ValuesView(self)
+
+    def items(self):
+        """Return a lazy, insertion-ordered view of the (key, value) pairs."""
+        return ItemsView(self)
+
+
+class _MapView:
+    """
+    Base class of the lazy views returned by keys(), values() and items().
+
+    A view stores only a reference to its map, so creating one is O(1) and it
+    always reflects the current contents. Iterating walks the dense entries
+    arrays and skips holes, which costs O(n) independent of the capacity.
+    Changing the map's size while iterating raises RuntimeError, like dict.
+    """
+    def __init__(self, hashmap):
+        self._map = hashmap
+
+    def __len__(self):
+        return self._map.count
+
+    def _live_positions(self):
+        hashmap = self._map
+        entry_keys = hashmap.entry_keys
+        size = hashmap.count
+        for pos in range(len(entry_keys)):
+            if hashmap.entry_keys is not entry_keys or hashmap.count != size:
+                raise RuntimeError("CompactHashMap changed size during iteration")
+            if entry_keys[pos] is not _DELETED:
+                yield pos
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+
+class KeysView(_MapView):
+    def __iter__(self):
+        entry_keys = self._map.entry_keys
+        for pos in self._live_positions():
+            yield entry_keys[pos]
+
+    def __contains__(self, key):
+        return key in self._map
+
+
+class ValuesView(_MapView):
+    def __iter__(self):
+        entry_values = self._map.entry_values
+        for pos in self._live_positions():
+            yield entry_values[pos]
+
+
+class ItemsView(_MapView):
+    def __iter__(self):
+        entry_keys, entry_values = self._map.entry_keys, self._map.entry_values
+        for pos in self._live_positions():
+            yield entry_keys[pos], entry_values[pos]
+
+    def __contains__(self, item):
+        key, val = item
+        pos = self._map._lookup(key, self._map.hash_func(key) & MASK_64)[1]
+        return pos >= 0 and self._map.entry_values[pos] == val
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    hashmap = CompactHashMap()
+    hashmap["title"] = "Vagabond"
+    hashmap["author"] = "Takehiko Inoue"
+    hashmap["year"] = 1998
+    hashmap["paper"] = "Weekly Morning Magazine"
+
+    print("Manga Title:", hashmap["title"])
+    print("Index table:", hashmap.indices.tolist())
+    print("Entry keys:", hashmap.entry_keys)
+
+    hashmap.remove("author")
+    hashmap["author"] = "Inoue Takehiko"  # Re-inserted keys move to the end
+
+    print("Keys:", list(hashmap.keys()))
+    print("Values:", list(hashmap.values()))
+    print("Items:", list(hashmap.items()))
+    print("'year' in keys:", "year" in hashmap.keys())
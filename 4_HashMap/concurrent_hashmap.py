@@ -0,0 +1,284 @@
+# ===============================
+# Concurrent (Lock-Striped) Hash Map Implementation
+# ===============================
+
+import threading
+
+from hashmap import mixed_hash
+
+
+class ConcurrentHashMap:
+    """
+    Thread-safe HashMap using Separate Chaining with lock striping.
+
+    Theory:
+        - A single global lock serializes every writer. Lock striping instead
+          splits the buckets into `stripes` groups, each guarded by its own lock,
+          so writers touching different stripes never wait for each other.
+        - The number of buckets is always a multiple of the number of stripes,
+          so `code % MAX_SIZE % stripes == code % stripes`: a key belongs to the
+          same stripe before and after a resize.
+        - Buckets are immutable tuples of (key, value, hash_code) entries. A writer
+          builds a new tuple and stores it with a single reference assignment
+          (copy-on-write), so readers never see a half-updated bucket and can
+          read without taking any lock.
+        - Resizing acquires every stripe lock in a fixed order (no deadlock),
+          builds the new bucket array off to the side, then publishes it with one
+          assignment. Readers that still hold the old array see a consistent
+          snapshot of the moment they started.
+        - compute_if_absent, setdefault and merge run their read-modify-write
+          under the key's stripe lock, so they are atomic.
+
+    Real-world Usage:
+        - Shared caches, session stores and counters in multi-threaded servers.
+        - Java's ConcurrentHashMap (JDK 7) used exactly this segment design.
+
+    Complexity Overview:
+        - Average Case:
+            Insert/Update: O(1 + bucket length), copy-on-write of one bucket
+            Search: O(1), lock-free
+            Delete: O(1 + bucket length)
+        - Resize: O(n + m), blocks writers but not readers.
+        - Space Complexity: O(n + m + stripes).
+    """
+
+    def __init__(self, size=16, stripes=16, hash_func=mixed_hash, max_load_factor=0.75):
+        """
+        Initialize the ConcurrentHashMap.
+
+        Args:
+            size (int, optional): Minimum initial number of buckets. Defaults to 16.
+            stripes (int, optional): Number of locks. Defaults to 16.
+            hash_func (Callable, optional): Maps a key to an integer hash code.
+                Defaults to mixed_hash.
+            max_load_factor (float, optional): Load factor above which the table
+                doubles in size. Defaults to 0.75.
+        """
+        self.stripes = stripes
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.counts = [0] * stripes  # Entries per stripe, guarded by that stripe's lock
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.MAX_SIZE = max(stripes, -(-size // stripes) * stripes)
+        self.arr = [()] * self.MAX_SIZE
+
+    def __len__(self):
+        """Return the number of key-value pairs (a moment-in-time estimate under writes)."""
+        return sum(self.counts)
+
+    def get_hash(self, key):
+        """Return the bucket index of a key within [0, MAX_SIZE-1]."""
+        return self.hash_func(key) % self.MAX_SIZE
+
+    # ===============================
+    # LOCK-FREE READ METHODS
+    # ===============================
+    def _find(self, key, code):
+        arr = self.arr  # One consistent snapshot of the bucket array
+        for element in arr[code % len(arr)]:
+            if element[2] == code and element[0] == key:
+                return element
+        return None
+
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with a given key without locking.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        element = self._find(key, self.hash_func(key))
+        if element is None:
+            raise KeyError(f"key '{key}' not found")
+        return element[1]
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is absent. Lock-free."""
+        element = self._find(key, self.hash_func(key))
+        return default if element is None else element[1]
+
+    def __contains__(self, key):
+        return self._find(key, self.hash_func(key)) is not None
+
+    def items(self):
+        """Return a list of (key, value) pairs from one snapshot of the bucket array."""
+        return [(element[0], element[1]) for bucket in self.arr for element in bucket]
+
+    # ===============================
+    # LOCKED WRITE HELPERS
+    # ===============================
+    def _put_locked(self, stripe, key, val, code):
+        """
+        Insert or replace key in its bucket. The caller holds the stripe lock.
+
+        Returns:
+            bool: True if a new key was added.
+        """
+        arr = self.arr
+        idx = code % len(arr)
+        bucket = arr[idx]
+        for pos, element in enumerate(bucket):
+            if element[2] == code and element[0] == key:
+                arr[idx] = bucket[:pos] + ((key, val, code),) + bucket[pos + 1:]
+                return False
+        arr[idx] = bucket + ((key, val, code),)
+        self.counts[stripe] += 1
+        return True
+
+    def _needs_resize(self, stripe):
+        return self.counts[stripe] > (self.MAX_SIZE // self.stripes) * self.max_load_factor
+
+    def _resize(self, stripe):
+        """Double the bucket array while holding every stripe lock."""
+        for lock in self.locks:  # Always acquired in the same order
+            lock.acquire()
+        try:
+            if not self._needs_resize(stripe):
+                return  # Another thread already resized
+            new_size = self.MAX_SIZE * 2
+            new_arr = [[] for _ in range(new_size)]
+            for bucket in self.arr:
+                for element in bucket:
+                    new_arr[element[2] % new_size].append(element)
+            self.arr = [tuple(bucket) for bucket in new_arr]  # Publish atomically
+            self.MAX_SIZE = new_size
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+    # ===============================
+    # WRITE METHODS
+    # ===============================
+    def __setitem__(self, key, val):
+        """
+        Insert or update a key-value pair under the key's stripe lock.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        """
+        code = self.hash_func(key)
+        stripe = code % self.stripes
+        with self.locks[stripe]:
+            added = self._put_locked(stripe, key, val, code)
+            grow = added and self._needs_resize(stripe)
+        if grow:
+            self._resize(stripe)
+
+    def remove(self, key):
+        """
+        Delete a key under its stripe lock.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        code = self.hash_func(key)
+        stripe = code % self.stripes
+        with self.locks[stripe]:
+            arr = self.arr
+            idx = code % len(arr)
+            bucket = arr[idx]
+            for pos, element in enumerate(bucket):
+                if element[2] == code and element[0] == key:
+                    arr[idx] = bucket[:pos] + bucket[pos + 1:]
+                    self.counts[stripe] -= 1
+                    return True
+        return False
+
+    # ===============================
+    # ATOMIC COMPOUND METHODS
+    # ===============================
+    def compute_if_absent(self, key, func):
+        """
+        Return the value of key, computing and storing func(key) if it is absent.
+
+        The fast path is a lock-free read. On a miss, the stripe lock is taken
+        and the key re-checked, so func runs at most once per key even when
+        several threads race on it.
+
+        Args:
+            key (Hashable): The key to look up.
+            func (Callable): Called with key to produce the missing value.
+
+        Returns:
+            Any: The existing or newly computed value.
+        """
+        code = self.hash_func(key)
+        element = self._find(key, code)
+        if element is not None:
+            return element[1]
+
+        stripe = code % self.stripes
+        with self.locks[stripe]:
+            element = self._find(key, code)
+            if element is not None:
+                return element[1]
+            val = func(key)
+            self._put_locked(stripe, key, val, code)
+            grow = self._needs_resize(stripe)
+        if grow:
+            self._resize(stripe)
+        return val
+
+    def setdefault(self, key, default=None):
+        """Atomically insert key with default if absent; return the stored value."""
+        return self.compute_if_absent(key, lambda _: default)
+
+    def merge(self, key, val, func):
+        """
+        Atomically combine val into the value stored under key.
+
+        - Absent key: val is stored.
+        - Present key: func(old_value, val) is stored; if it returns None the key
+          is removed instead.
+
+        Example:
+            counts.merge(word, 1, operator.add)  # Thread-safe counter
+
+        Returns:
+            Any: The new value, or None if the key was removed.
+        """
+        code = self.hash_func(key)
+        stripe = code % self.stripes
+        with self.locks[stripe]:
+            element = self._find(key, code)
+            new_val = val if element is None else func(element[1], val)
+            if new_val is None:
+                grow = False
+                if element is None:
+                    return None
+                arr = self.arr
+                idx = code % len(arr)
+                arr[idx] = tuple(e for e in arr[idx] if not (e[2] == code and e[0] == key))
+                self.counts[stripe] -= 1
+            else:
+                grow = self._put_locked(stripe, key, new_val, code) and self._needs_resize(stripe)
+        if grow:
+            self._resize(stripe)
+        return new_val
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import operator
+
+    word_counts = ConcurrentHashMap(stripes=8)
+    text = "the quick brown fox jumps over the lazy dog the end".split()
+
+    def count_words(words):
+        for word in words:
+            word_counts.merge(word, 1, operator.add)
+
+    threads = [threading.Thread(target=count_words, args=(text,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print("Count of 'the' (3 per thread x 4 threads):", word_counts["the"])
+    print("Distinct words:", len(word_counts))
+    print("setdefault('cat', 0):", word_counts.setdefault("cat", 0))
+    print("compute_if_absent('fox', len):", word_counts.compute_if_absent("fox", len))
+    print("Buckets:", word_counts.MAX_SIZE, "Stripes:", word_counts.stripes)
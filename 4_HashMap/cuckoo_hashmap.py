@@ -0,0 +1,282 @@
+# ===============================
+# Cuckoo Hash Map Implementation
+# ===============================
+
+import random
+from array import array
+
+from hashmap import MASK_64, mixed_hash
+
+SLOTS_PER_BUCKET = 4
+
+
+def _second_hash(code, seed):
+    """Derive an independent second hash from the first hash code and a seed."""
+    h = (code ^ seed) & MASK_64
+    h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & MASK_64
+    h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & MASK_64
+    return h ^ (h >> 33)
+
+
+class CuckooHashMap:
+    """
+    HashMap implementation using bucketized Cuckoo Hashing with a stash.
+
+    Theory:
+        - Every key has exactly two candidate buckets, chosen by two hash
+          functions, and each bucket has 4 slots. A key is always stored in one
+          of its two buckets (or in the tiny stash), so a lookup inspects at most
+          2 buckets = 8 slots plus the stash: O(1) in the worst case, whatever the
+          key distribution.
+        - Insertion: if either bucket has a free slot, the key goes there.
+          Otherwise a random resident is kicked out of one of the buckets and
+          moved to its own alternate bucket, possibly kicking another key, and so
+          on ("cuckoo" eviction), for at most max_kicks steps.
+        - If the kick chain is too long (a cycle), the homeless entry goes into a
+          small stash. When the stash is full, the table is rebuilt with a new
+          seed for the second hash function and twice the buckets.
+        - With 4-way buckets, load factors above 90% are reachable.
+        - The O(1) bound assumes a hash function that gives distinct keys
+          distinct codes; if more than 8 keys share one code, no table size can
+          separate them and the surplus stays in the stash.
+        - Slots live in flat parallel arrays (hashes, keys, values) like
+          RobinHoodHashMap; hash code 0 marks an empty slot.
+
+    Real-world Usage:
+        - Network switches and routers (exact-match tables in hardware).
+        - Latency-critical read-heavy lookups; cuckoo filters; MemC3.
+
+    Complexity Overview:
+        - Search: O(1) worst case (2 buckets + stash).
+        - Delete: O(1) worst case.
+        - Insert: O(1) amortized expected; a single insert may kick up to
+          max_kicks entries or trigger an O(n) rebuild.
+        - Space Complexity: O(capacity), three machine words per slot.
+    """
+
+    def __init__(self, size=8, hash_func=mixed_hash, max_load_factor=0.9, max_kicks=500, stash_size=4):
+        """
+        Initialize the CuckooHashMap.
+
+        Args:
+            size (int, optional): Minimum initial number of slots. Defaults to 8.
+            hash_func (Callable, optional): Maps a key to an integer hash code.
+                Defaults to mixed_hash.
+            max_load_factor (float, optional): Load factor that triggers growth.
+            max_kicks (int, optional): Longest eviction chain before using the stash.
+            stash_size (int, optional): Entries the stash can hold.
+        """
+        num_buckets = 2
+        while num_buckets * SLOTS_PER_BUCKET < size:
+            num_buckets *= 2
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.max_kicks = max_kicks
+        self.stash_size = stash_size
+        self.rng = random.Random(0)
+        self.count = 0
+        self._allocate(num_buckets, self.rng.getrandbits(64))
+
+    def _allocate(self, num_buckets, seed):
+        self.num_buckets = num_buckets
+        self.MAX_SIZE = num_buckets * SLOTS_PER_BUCKET
+        self.mask = num_buckets - 1
+        self.seed = seed
+        self.hashes = array("Q", bytes(8 * self.MAX_SIZE))  # 0 = empty slot
+        self.keys = [None] * self.MAX_SIZE
+        self.values = [None] * self.MAX_SIZE
+        self.stash = []  # [code, key, value] lists
+
+    def __len__(self):
+        return self.count
+
+    def _hash_code(self, key):
+        return (self.hash_func(key) & MASK_64) or 1
+
+    def buckets_of(self, code):
+        """Return the two candidate bucket indices of a hash code."""
+        return code & self.mask, _second_hash(code, self.seed) & self.mask
+
+    def _find(self, key, code):
+        """
+        Return the slot index of key, -2 - stash position if it is stashed,
+        or -1 if it is absent. Probes at most two buckets plus the stash.
+        """
+        hashes, keys = self.hashes, self.keys
+        for bucket in self.buckets_of(code):
+            start = bucket * SLOTS_PER_BUCKET
+            for slot in range(start, start + SLOTS_PER_BUCKET):
+                if hashes[slot] == code and keys[slot] == key:
+                    return slot
+        for pos, item in enumerate(self.stash):
+            if item[0] == code and item[1] == key:
+                return -2 - pos
+        return -1
+
+    # ===============================
+    # SEARCH METHODS
+    # ===============================
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Time Complexity:
+            - O(1) worst case: 2 buckets x 4 slots + the stash.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        slot = self._find(key, self._hash_code(key))
+        if slot >= 0:
+            return self.values[slot]
+        if slot == -1:
+            raise KeyError(f"key '{key}' not found")
+        return self.stash[-2 - slot][2]
+
+    def __contains__(self, key):
+        return self._find(key, self._hash_code(key)) != -1
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is absent. O(1) worst case."""
+        slot = self._find(key, self._hash_code(key))
+        if slot >= 0:
+            return self.values[slot]
+        return default if slot == -1 else self.stash[-2 - slot][2]
+
+    # ===============================
+    # INSERTION METHODS
+    # ===============================
+    def __setitem__(self, key, val):
+        """
+        Insert or update a key-value pair.
+
+        Time Complexity:
+            - O(1) amortized expected; bounded by max_kicks per attempt.
+        """
+        code = self._hash_code(key)
+        slot = self._find(key, code)
+        if slot >= 0:
+            self.values[slot] = val
+            return
+        if slot < -1:
+            self.stash[-2 - slot][2] = val
+            return
+
+        if self.count + 1 > self.MAX_SIZE * self.max_load_factor:
+            self._rebuild(self.num_buckets * 2)
+        self.count += 1
+        while not self._place(code, key, val):
+            # Stash overflow: grow with a fresh seed and retry the homeless entry
+            code, key, val = self.stash.pop()
+            self._rebuild(self.num_buckets * 2)
+
+    def _free_slot(self, bucket):
+        start = bucket * SLOTS_PER_BUCKET
+        for slot in range(start, start + SLOTS_PER_BUCKET):
+            if self.hashes[slot] == 0:
+                return slot
+        return -1
+
+    def _place(self, code, key, val):
+        """
+        Put an entry into one of its buckets, kicking residents as needed.
+
+        Returns:
+            bool: False if the entry ended up in an overfull stash.
+        """
+        hashes, keys, values = self.hashes, self.keys, self.values
+        for _ in range(self.max_kicks):
+            first, second = self.buckets_of(code)
+            slot = self._free_slot(first)
+            if slot < 0:
+                slot = self._free_slot(second)
+            if slot >= 0:
+                hashes[slot], keys[slot], values[slot] = code, key, val
+                return True
+
+            # Both buckets are full: kick a random resident of one of them
+            bucket = first if self.rng.random() < 0.5 else second
+            slot = bucket * SLOTS_PER_BUCKET + self.rng.randrange(SLOTS_PER_BUCKET)
+            hashes[slot], code = code, hashes[slot]
+            keys[slot], key = key, keys[slot]
+            values[slot], val = val, values[slot]
+
+        self.stash.append([code, key, val])
+        # Growing cannot separate keys that share a full hash code, so once the
+        # table is far larger than needed, a degenerate hash spills into the stash
+        return len(self.stash) <= self.stash_size or self.MAX_SIZE >= 8 * (self.count + 64)
+
+    def _rebuild(self, num_buckets):
+        """Re-insert every entry into a fresh table with a new second-hash seed."""
+        entries = [(code, key, val) for code, key, val in zip(self.hashes, self.keys, self.values) if code]
+        entries.extend(tuple(item) for item in self.stash)
+        while True:
+            self._allocate(num_buckets, self.rng.getrandbits(64))
+            for code, key, val in entries:
+                if not self._place(code, key, val):
+                    break
+            else:
+                return
+            num_buckets *= 2  # Still failing: give the table more room
+
+    # ===============================
+    # DELETION METHOD
+    # ===============================
+    def remove(self, key):
+        """
+        Delete a key. A freed slot lets stashed entries move back into the table.
+
+        Time Complexity:
+            - O(1) worst case.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        slot = self._find(key, self._hash_code(key))
+        if slot == -1:
+            return False
+        if slot >= 0:
+            self.hashes[slot] = 0
+            self.keys[slot] = self.values[slot] = None
+            for pos, (code, stashed_key, stashed_val) in enumerate(self.stash):
+                if slot // SLOTS_PER_BUCKET in self.buckets_of(code):
+                    self.hashes[slot], self.keys[slot], self.values[slot] = code, stashed_key, stashed_val
+                    del self.stash[pos]
+                    break
+        else:
+            del self.stash[-2 - slot]
+        self.count -= 1
+        return True
+
+    def items(self):
+        """Yield (key, value) pairs: table slots first, then the stash."""
+        for code, key, val in zip(self.hashes, self.keys, self.values):
+            if code:
+                yield key, val
+        for _, key, val in self.stash:
+            yield key, val
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    hashmap = CuckooHashMap()
+    hashmap["title"] = "Vagabond"
+    hashmap["author"] = "Takehiko Inoue"
+    hashmap["year"] = 1998
+    hashmap["paper"] = "Weekly Morning Magazine"
+
+    for key in ["title", "author", "year", "paper"]:
+        code = hashmap._hash_code(key)
+        print(f"'{key}': candidate buckets = {hashmap.buckets_of(code)}, "
+              f"slot = {hashmap._find(key, code)}, value = {hashmap[key]}")
+
+    # Fill to a high load factor and confirm lookups never probe more than 2 buckets
+    big = CuckooHashMap()
+    for i in range(100000):
+        big[f"user_{i}"] = i
+    print(f"Entries: {len(big)}, slots: {big.MAX_SIZE}, "
+          f"load factor: {len(big) / big.MAX_SIZE:.2f}, stash: {len(big.stash)}")
+    big.remove("user_5")
+    print("user_5 present after removal?", "user_5" in big)
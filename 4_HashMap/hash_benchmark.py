@@ -0,0 +1,132 @@
+# ===============================
+# Hash Function Collision-Quality Benchmark
+# ===============================
+#
+# Compares the hash functions available to HashMap on real-world string sets:
+#   - identifiers and words harvested from the Python standard library sources
+#   - /usr/share/dict/words (if the system provides it)
+#   - sequential IDs, file paths, IPv4 addresses and anagram permutations
+#
+# For every (data set, hash function) pair it reports:
+#   - quality: sum(b * (b + 1) / 2) / ((n / 2m) * (n + 2m - 1)), where b is the
+#     length of each bucket. 1.0 matches a uniformly random hash; higher is worse.
+#   - max chain length and empty-bucket ratio
+#   - average hashing time per key
+#
+# Run with:
+#     python 4_HashMap/hash_benchmark.py
+
+import itertools
+import os
+import re
+import time
+
+from hashmap import HashMap, ascii_sum_hash, mixed_hash
+
+
+# ===============================
+# DATA SETS
+# ===============================
+def stdlib_words(limit=50000):
+    """Collect distinct identifiers from the standard library source files."""
+    words = set()
+    stdlib_dir = os.path.dirname(os.__file__)
+    for name in sorted(os.listdir(stdlib_dir)):
+        if not name.endswith(".py"):
+            continue
+        try:
+            with open(os.path.join(stdlib_dir, name), encoding="utf-8") as f:
+                words.update(re.findall(r"[A-Za-z_][A-Za-z0-9_]{2,}", f.read()))
+        except (OSError, UnicodeDecodeError):
+            continue
+        if len(words) >= limit:
+            break
+    return sorted(words)[:limit]
+
+
+def dictionary_words(path="/usr/share/dict/words", limit=50000):
+    """Read words from the system dictionary, if it exists."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        return sorted({line.strip() for line in f if line.strip()})[:limit]
+
+
+def sequential_ids(n=50000):
+    return [f"user_{i:06d}" for i in range(n)]
+
+
+def file_paths(n=50000):
+    return [f"/var/log/service-{i % 97}/2024-{i % 12 + 1:02d}/part-{i}.log" for i in range(n)]
+
+
+def ipv4_addresses(n=50000):
+    return [f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}" for i in range(n)]
+
+
+def anagrams():
+    return ["".join(p) for p in itertools.permutations("abcdefgh")]
+
+
+# ===============================
+# MEASUREMENT
+# ===============================
+def measure(keys, hash_func, buckets):
+    """
+    Insert every key into a fixed-size HashMap and summarise its bucket lengths.
+
+    Returns:
+        dict: quality, max_chain, empty_ratio and ns_per_hash for the run.
+    """
+    hashmap = HashMap(buckets, hash_func=hash_func, max_load_factor=None)
+    for key in keys:
+        hashmap[key] = None
+
+    start = time.perf_counter()
+    for key in keys:
+        hash_func(key)
+    elapsed = time.perf_counter() - start
+
+    n = len(hashmap)
+    lengths = [len(bucket) for bucket in hashmap.arr]
+    observed = sum(b * (b + 1) / 2 for b in lengths)
+    expected = (n / (2 * buckets)) * (n + 2 * buckets - 1)
+    return {
+        "quality": observed / expected,
+        "max_chain": max(lengths),
+        "empty_ratio": lengths.count(0) / buckets,
+        "ns_per_hash": elapsed / n * 1e9,
+    }
+
+
+def run_benchmark(load_factor=0.75):
+    data_sets = {
+        "stdlib identifiers": stdlib_words(),
+        "dictionary words": dictionary_words(),
+        "sequential ids": sequential_ids(),
+        "file paths": file_paths(),
+        "ipv4 addresses": ipv4_addresses(),
+        "anagrams": anagrams(),
+    }
+    hash_funcs = {
+        "ascii_sum_hash": ascii_sum_hash,
+        "builtin hash": hash,
+        "mixed_hash": mixed_hash,
+    }
+
+    print(f"{'data set':<20}{'hash':<16}{'n':>8}{'quality':>10}{'max':>6}{'empty':>8}{'ns/key':>9}")
+    for data_name, keys in data_sets.items():
+        if not keys:
+            continue
+        buckets = int(len(keys) / load_factor)
+        for hash_name, hash_func in hash_funcs.items():
+            r = measure(keys, hash_func, buckets)
+            print(f"{data_name:<20}{hash_name:<16}{len(keys):>8}{r['quality']:>10.3f}"
+                  f"{r['max_chain']:>6}{r['empty_ratio']:>8.1%}{r['ns_per_hash']:>9.0f}")
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    run_benchmark()
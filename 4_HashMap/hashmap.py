@@ -2,6 +2,237 @@
 # Hash Map Implementation
 # ===============================
 
+import itertools
+import random
+import sys
+import time
+
+try:
+    import numpy as np  # Optional: only used to vectorize hashing and bucket indexing of array keys
+except ImportError:
+    np = None
+
+# ===============================
+# HASH FUNCTIONS
+# ===============================
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def mixed_hash(key):
+    """
+    Default hash function: Python's built-in hash() followed by a 64-bit bit mixer.
+
+    Theory:
+        - hash() already works for every hashable type (str, int, bytes, tuple, ...)
+          and runs in C, but for small integers it is the identity (hash(7) == 7),
+          so keys like 10, 20, 30 all land in bucket 0 of a 10-bucket table.
+        - The SplitMix64 finalizer spreads every input bit across the whole
+          64-bit output, so `code % MAX_SIZE` is well-distributed even when the
+          table size shares factors with the keys.
+        - Anagrams ("abc" / "cab") no longer collide, unlike an ASCII-sum hash.
+
+    Time Complexity:
+        - O(1) for the mixing step; hash() of a str is computed once and cached
+          by Python itself.
+    Space Complexity:
+        - O(1)
+
+    Args:
+        key (Hashable): Any hashable key.
+
+    Returns:
+        int: A non-negative 64-bit hash code.
+    """
+    h = hash(key) & MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
+
+
+def mixed_hash_array(keys):
+    """
+    Vectorized mixed_hash for a NumPy array of integer or byte-string keys.
+
+    Produces exactly the same codes as calling mixed_hash on every element, so
+    batch and single-key operations can be mixed freely.
+
+    Theory:
+        - Integers: Python's hash(n) is n reduced modulo the Mersenne prime
+          2**61 - 1 (keeping the sign, with -1 mapped to -2). This is reproduced
+          with uint64 arithmetic, then the SplitMix64 finalizer runs on the
+          whole array at once (uint64 multiplication wraps modulo 2**64).
+        - Byte strings: hash(bytes) is a salted SipHash that NumPy cannot
+          reproduce, so it is taken per element; only the mixing step is
+          vectorized.
+
+    Time Complexity:
+        - O(n), with the per-element work done in C for integer keys.
+    Space Complexity:
+        - O(n) for the result array.
+
+    Args:
+        keys (numpy.ndarray): 1-D array with an integer or bytes ('S') dtype.
+
+    Returns:
+        numpy.ndarray: uint64 array of hash codes.
+    """
+    if keys.dtype.kind == "S":
+        h = np.array([hash(key) for key in keys.tolist()], dtype=np.int64).view(np.uint64)
+    else:
+        modulus = np.uint64((1 << 61) - 1)
+        if keys.dtype.kind == "u":
+            h = keys.astype(np.uint64) % modulus
+        else:
+            signed = keys.astype(np.int64)
+            raw = signed.view(np.uint64)
+            negative = signed < 0
+            magnitude = np.where(negative, ~raw + np.uint64(1), raw) % modulus
+            h = np.where(negative, ~magnitude + np.uint64(1), magnitude)
+            h[h == np.uint64(MASK_64)] = np.uint64(MASK_64 - 1)  # hash(-1) == -2
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def ascii_sum_hash(key):
+    """
+    Classic teaching hash: the sum of the character codes of a string key.
+
+    Kept as a pluggable option to demonstrate collisions (every anagram maps to
+    the same bucket). Only works for strings.
+
+    Time Complexity:
+        - O(k), where k is the length of the key.
+    Space Complexity:
+        - O(1)
+
+    Args:
+        key (str): The key to be hashed.
+
+    Returns:
+        int: Sum of the ASCII values of the characters.
+    """
+    hash = 0
+    for char in key:
+        hash += ord(char)
+    return hash
+
+
+# ===============================
+# PROFILING HELPERS
+# ===============================
+def _absent_keys(stored, k, contains):
+    """
+    Build k keys that are not in the table, of the same type as the stored
+    keys, so a custom hash function sees the kind of key it expects.
+
+    Returns:
+        list | None: The keys, or None if no absent keys of that type can be
+        generated (pass miss_keys to the stats method instead).
+    """
+    sample = stored[0]
+    if isinstance(sample, bool):
+        return None
+    if isinstance(sample, int):
+        start = max(key for key in stored if isinstance(key, int) and not isinstance(key, bool)) + 1
+        candidates = itertools.count(start)
+    elif isinstance(sample, str):
+        candidates = (f"\0absent-{i}" for i in itertools.count())
+    elif isinstance(sample, bytes):
+        candidates = (b"\0absent-%d" % i for i in itertools.count())
+    else:
+        return None
+    return list(itertools.islice((key for key in candidates if not contains(key)), k))
+
+
+def chaining_stats(arr, count, lookup, latency_samples=0, miss_keys=None):
+    """
+    Report bucket occupancy, probe lengths and memory use of a separate-chaining
+    table whose buckets hold tuples ending in the cached hash code.
+
+    Theory:
+        - With separate chaining, finding the j-th element of a bucket takes
+          j comparisons, so a bucket of length b contributes b(b+1)/2
+          comparisons over its b successful lookups.
+        - An unsuccessful lookup scans its whole bucket; averaged over all
+          buckets that is n/m comparisons (the load factor).
+        - For a good hash function at load factor a, expect about 1 + a/2
+          comparisons per hit and a per miss; much larger values point to
+          clustering (a weak hash) or an undersized table.
+
+    Time Complexity:
+        - O(n + m), plus O(latency_samples) timed lookups.
+    Space Complexity:
+        - O(longest bucket) for the histogram.
+
+    Args:
+        arr (list[list[tuple]]): The bucket array; element[0] is the key and
+            element[-1] the cached hash code.
+        count (int): Number of stored elements.
+        lookup (Callable): Timed for the latency samples, called with one key.
+        latency_samples (int, optional): If > 0, time this many lookups of
+            stored keys and of absent ones, on the live table. Defaults to 0.
+        miss_keys (Iterable, optional): Absent keys for the miss timings.
+            Defaults to keys generated from the stored key type (int, str or
+            bytes); for other key types, miss latency is only measured when
+            miss_keys is given.
+
+    Returns:
+        dict: load_factor, bucket_histogram (length -> bucket count),
+        max_chain, mean_chain (over non-empty buckets), empty_bucket_ratio,
+        avg_comparisons_hit, avg_comparisons_miss, table_bytes (buckets,
+        entry tuples and cached hash codes), total_bytes (table_bytes plus
+        the stored objects), and, when sampled, hit_latency_ns and
+        miss_latency_ns as (mean, p99) pairs.
+    """
+    n, m = count, len(arr)
+    histogram = {}
+    comparisons_hit = 0
+    table_bytes = sys.getsizeof(arr)
+    payload_bytes = 0
+    for bucket in arr:
+        length = len(bucket)
+        histogram[length] = histogram.get(length, 0) + 1
+        comparisons_hit += length * (length + 1) // 2
+        table_bytes += sys.getsizeof(bucket)
+        for element in bucket:
+            table_bytes += sys.getsizeof(element) + sys.getsizeof(element[-1])
+            payload_bytes += sum(sys.getsizeof(item) for item in element[:-1])
+
+    non_empty = m - histogram.get(0, 0)
+    report = {
+        "load_factor": n / m,
+        "bucket_histogram": dict(sorted(histogram.items())),
+        "max_chain": max(histogram),
+        "mean_chain": n / non_empty if non_empty else 0.0,
+        "empty_bucket_ratio": histogram.get(0, 0) / m,
+        "avg_comparisons_hit": comparisons_hit / n if n else 0.0,
+        "avg_comparisons_miss": n / m,
+        "table_bytes": table_bytes,
+        "total_bytes": table_bytes + payload_bytes,
+    }
+
+    if latency_samples > 0 and n:
+        stored = [element[0] for bucket in arr for element in bucket]
+        samples = {"hit_latency_ns": random.choices(stored, k=latency_samples)}
+        if miss_keys is not None:
+            samples["miss_latency_ns"] = list(itertools.islice(miss_keys, latency_samples))
+        else:
+            absent = _absent_keys(stored, latency_samples, lookup)
+            if absent is not None:
+                samples["miss_latency_ns"] = absent
+        for name, keys in samples.items():
+            timings = []
+            for key in keys:
+                start = time.perf_counter_ns()
+                lookup(key)
+                timings.append(time.perf_counter_ns() - start)
+            if timings:
+                timings.sort()
+                report[name] = (sum(timings) / len(timings), timings[int(len(timings) * 0.99)])
+    return report
+
+
 class HashMap:
     """
     HashMap implementation using Separate Chaining for collision handling.
@@ -9,8 +240,14 @@ class HashMap:
     Theory:
         - A HashMap (or dictionary) is a data structure that stores key-value pairs.
         - Keys are converted into array indices using a hash function.
-        - Collisions (two keys mapping to the same index) are handled using lists 
+        - Collisions (two keys mapping to the same index) are handled using lists
           (separate chaining).
+        - Each entry is stored as a (key, value, hash_code) tuple. Caching the hash
+          code lets lookups skip the (possibly expensive) key comparison when the
+          codes differ, and lets rehashing move entries without recomputing hashes.
+        - The hash function is pluggable: any callable mapping a key to an int.
+        - When the load factor (entries / buckets) exceeds max_load_factor, the
+          number of buckets is doubled.
         - Provides efficient lookups, insertions, and deletions.
 
     Real-world Usage:
@@ -20,7 +257,7 @@ class HashMap:
 
     Complexity Overview:
         - Average Case:
-            Insert: O(1)
+            Insert: O(1) (amortized, including occasional rehashing)
             Search: O(1)
             Delete: O(1)
         - Worst Case (when many collisions occur):
@@ -30,35 +267,43 @@ class HashMap:
         - Space Complexity: O(n), where n is the number of key-value pairs.
     """
 
-    def __init__(self, size):
+    def __init__(self, size, hash_func=mixed_hash, max_load_factor=0.75):
         """
         Initialize the HashMap with a given size.
 
         Args:
-            size (int): The maximum size of the HashMap (number of buckets).
+            size (int): The initial number of buckets.
+            hash_func (Callable, optional): Maps a key to an integer hash code.
+                Defaults to mixed_hash.
+            max_load_factor (float, optional): Load factor above which the table
+                doubles in size. None disables automatic growth. Defaults to 0.75.
         """
         self.MAX_SIZE = size
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.count = 0
         self.arr = [[] for _ in range(self.MAX_SIZE)]  # Each bucket is a list
 
+    def __len__(self):
+        """Return the number of key-value pairs stored in the HashMap."""
+        return self.count
+
     def get_hash(self, key):
         """
         Compute the hash value (bucket index) for a given key.
 
         Time Complexity:
-            - O(k), where k is the length of the key (summing ASCII values).
+            - O(1) with the default hash function.
         Space Complexity:
             - O(1)
 
         Args:
-            key (str): The key to be hashed.
+            key (Hashable): The key to be hashed.
 
         Returns:
             int: The hash index within the range [0, MAX_SIZE-1].
         """
-        hash = 0
-        for char in key:
-            hash += ord(char)
-        return hash % self.MAX_SIZE
+        return self.hash_func(key) % self.MAX_SIZE
 
     def __setitem__(self, key, val):
         """
@@ -71,18 +316,20 @@ class HashMap:
             - O(1)
 
         Args:
-            key (str): The key to insert.
+            key (Hashable): The key to insert.
             val (Any): The value associated with the key.
         """
-        hash = self.get_hash(key)
-        found = False
-        for idx, element in enumerate(self.arr[hash]):
-            if len(element) == 2 and element[0] == key:
-                found = True
-                self.arr[hash][idx] = (key, val)  # Update existing key
-                break
-        if not found:
-            self.arr[hash].append((key, val))  # Insert new key-value pair
+        code = self.hash_func(key)
+        bucket = self.arr[code % self.MAX_SIZE]
+        for idx, element in enumerate(bucket):
+            if element[2] == code and element[0] == key:
+                bucket[idx] = (key, val, code)  # Update existing key
+                return
+        bucket.append((key, val, code))  # Insert new key-value pair
+        self.count += 1
+
+        if self.max_load_factor is not None and self.count > self.MAX_SIZE * self.max_load_factor:
+            self.rehash(self.MAX_SIZE * 2)
 
     def __getitem__(self, key):
         """
@@ -95,7 +342,7 @@ class HashMap:
             - O(1)
 
         Args:
-            key (str): The key to search for.
+            key (Hashable): The key to search for.
 
         Returns:
             Any: The value associated with the key.
@@ -103,22 +350,320 @@ class HashMap:
         Raises:
             KeyError: If the key is not found in the HashMap.
         """
-        hash = self.get_hash(key)
-        for element in self.arr[hash]:
-            if element[0] == key:
+        code = self.hash_func(key)
+        for element in self.arr[code % self.MAX_SIZE]:
+            if element[2] == code and element[0] == key:
                 return element[1]
         raise KeyError(f"key '{key}' not found")
-    
+
+    def get(self, key, default=None):
+        """
+        Return the value for key, or default if the key is absent.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        """
+        code = self.hash_func(key)
+        for element in self.arr[code % self.MAX_SIZE]:
+            if element[2] == code and element[0] == key:
+                return element[1]
+        return default
+
+    def __contains__(self, key):
+        """Return True if key is stored in the HashMap. O(1) on average."""
+        code = self.hash_func(key)
+        for element in self.arr[code % self.MAX_SIZE]:
+            if element[2] == code and element[0] == key:
+                return True
+        return False
+
     def remove(self, key):
-        hash = self.get_hash(key)
-        bucket = self.arr[hash]
+        """
+        Delete a key-value pair from the HashMap if it exists.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n) if bucket is large due to collisions.
+        Space Complexity:
+            - O(1)
+
+        Args:
+            key (Hashable): The key to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        code = self.hash_func(key)
+        bucket = self.arr[code % self.MAX_SIZE]
 
         for idx, element in enumerate(bucket):
-            if len(element) == 2 and element[0] == key:
+            if element[2] == code and element[0] == key:
                 del bucket[idx]
+                self.count -= 1
                 return True
         return False
 
+    # ===============================
+    # REHASH METHOD
+    # ===============================
+    def rehash(self, new_size):
+        """
+        Redistribute all entries into a new bucket array of the given size.
+
+        The cached hash code of every entry is reused, so the hash function is
+        never called during a rehash.
+
+        Time Complexity:
+            - O(n + m), where n is the number of entries and m the new bucket count.
+        Space Complexity:
+            - O(m) for the new bucket array.
+
+        Args:
+            new_size (int): The new number of buckets.
+        """
+        new_arr = [[] for _ in range(new_size)]
+        for bucket in self.arr:
+            for element in bucket:
+                new_arr[element[2] % new_size].append(element)
+        self.MAX_SIZE = new_size
+        self.arr = new_arr
+
+    def reserve(self, n):
+        """
+        Grow the bucket array once so that n entries fit without further rehashing.
+
+        Time Complexity:
+            - O(n + m) if a rehash is needed, O(1) otherwise.
+
+        Args:
+            n (int): Total number of entries the map should be able to hold.
+        """
+        if self.max_load_factor is None:
+            return
+        needed = int(n / self.max_load_factor) + 1
+        if needed > self.MAX_SIZE:
+            new_size = self.MAX_SIZE
+            while new_size < needed:
+                new_size *= 2
+            self.rehash(new_size)
+
+    # ===============================
+    # BULK METHODS
+    # ===============================
+    def _hash_batch(self, keys):
+        """
+        Hash a batch of keys in one go.
+
+        NumPy arrays of integer or byte-string keys are hashed with
+        mixed_hash_array when the default hash function is in use; everything
+        else falls back to one hash_func call per key.
+
+        Returns:
+            tuple: (keys as a list, hash codes as a uint64 NumPy array when
+            hashed vectorized or else a list, True if keys was a NumPy array)
+        """
+        is_array = np is not None and isinstance(keys, np.ndarray)
+        if is_array:
+            keys = keys.ravel()
+            if self.hash_func is mixed_hash and keys.dtype.kind in "iuS":
+                return keys.tolist(), mixed_hash_array(keys), True
+        keys = keys.tolist() if is_array else list(keys)
+        return keys, list(map(self.hash_func, keys)), is_array
+
+    def _bucket_indexes(self, codes):
+        """
+        Map hash codes from _hash_batch to bucket indices for the current size.
+
+        Vectorized codes are reduced with one NumPy modulo before leaving
+        NumPy; list codes fall back to one Python modulo per code.
+
+        Returns:
+            tuple: (hash codes as a list, bucket indices as a list)
+        """
+        size = self.MAX_SIZE
+        if np is not None and isinstance(codes, np.ndarray):
+            return codes.tolist(), (codes % np.uint64(size)).tolist()
+        return codes, [code % size for code in codes]
+
+    def update(self, pairs, values=None):
+        """
+        Insert or update many key-value pairs, resizing the table at most once.
+
+        Accepts either an iterable of (key, value) pairs, or two parallel
+        sequences `update(keys, values)`, which allows NumPy key arrays to be
+        hashed and mapped to buckets in a vectorized way.
+
+        Time Complexity:
+            - O(k) on average for k pairs, plus one O(n + m) rehash at most.
+        Space Complexity:
+            - O(k) for the batch of keys and hash codes.
+
+        Args:
+            pairs (Iterable[tuple] | Sequence): Pairs, or the keys if values is given.
+            values (Sequence, optional): Values parallel to the keys.
+
+        Raises:
+            ValueError: If keys and values have different lengths.
+        """
+        if values is None:
+            pairs = list(pairs.items() if hasattr(pairs, "items") else pairs)
+            keys, codes, _ = self._hash_batch([pair[0] for pair in pairs])
+            values = [pair[1] for pair in pairs]
+        else:
+            keys, codes, _ = self._hash_batch(keys=pairs)
+            values = values.tolist() if np is not None and isinstance(values, np.ndarray) else list(values)
+            if len(values) != len(keys):
+                raise ValueError(f"update got {len(keys)} keys but {len(values)} values")
+
+        self.reserve(self.count + len(keys))  # Pre-size once for the whole batch
+
+        arr = self.arr
+        codes, indexes = self._bucket_indexes(codes)
+        added = 0
+        for key, val, code, index in zip(keys, values, codes, indexes):
+            bucket = arr[index]
+            for idx, element in enumerate(bucket):
+                if element[2] == code and element[0] == key:
+                    bucket[idx] = (key, val, code)
+                    break
+            else:
+                bucket.append((key, val, code))
+                added += 1
+        self.count += added
+
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys at once.
+
+        Time Complexity:
+            - O(k) on average for k keys.
+
+        Args:
+            keys (Iterable): Keys to look up (a NumPy array is hashed and indexed vectorized).
+            default (Any, optional): Value returned for missing keys. Defaults to None.
+
+        Returns:
+            list | numpy.ndarray: Values in the order of keys; an object array
+            when keys is a NumPy array.
+        """
+        keys, codes, is_array = self._hash_batch(keys)
+        arr = self.arr
+        codes, indexes = self._bucket_indexes(codes)
+        results = []
+        for key, code, index in zip(keys, codes, indexes):
+            for element in arr[index]:
+                if element[2] == code and element[0] == key:
+                    results.append(element[1])
+                    break
+            else:
+                results.append(default)
+        if is_array:
+            out = np.empty(len(results), dtype=object)
+            out[:] = results
+            return out
+        return results
+
+    def contains_many(self, keys):
+        """
+        Test membership of many keys at once.
+
+        Time Complexity:
+            - O(k) on average for k keys.
+
+        Returns:
+            list[bool] | numpy.ndarray: One flag per key; a bool array when keys
+            is a NumPy array.
+        """
+        keys, codes, is_array = self._hash_batch(keys)
+        arr = self.arr
+        codes, indexes = self._bucket_indexes(codes)
+        results = []
+        for key, code, index in zip(keys, codes, indexes):
+            for element in arr[index]:
+                if element[2] == code and element[0] == key:
+                    results.append(True)
+                    break
+            else:
+                results.append(False)
+        return np.array(results, dtype=bool) if is_array else results
+
+    def remove_many(self, keys):
+        """
+        Delete many keys at once.
+
+        Time Complexity:
+            - O(k) on average for k keys.
+
+        Returns:
+            list[bool] | numpy.ndarray: True for every key that was removed; a
+            bool array when keys is a NumPy array.
+        """
+        keys, codes, is_array = self._hash_batch(keys)
+        arr = self.arr
+        codes, indexes = self._bucket_indexes(codes)
+        results = []
+        for key, code, index in zip(keys, codes, indexes):
+            bucket = arr[index]
+            for idx, element in enumerate(bucket):
+                if element[2] == code and element[0] == key:
+                    del bucket[idx]
+                    results.append(True)
+                    break
+            else:
+                results.append(False)
+        self.count -= sum(results)
+        return np.array(results, dtype=bool) if is_array else results
+
+    # ===============================
+    # PROFILING METHOD
+    # ===============================
+    def stats(self, latency_samples=0, miss_keys=None):
+        """
+        Report bucket occupancy, probe lengths and memory use of the HashMap.
+        See chaining_stats for the metrics and how to read them.
+
+        Time Complexity:
+            - O(n + m), plus O(latency_samples) timed lookups.
+
+        Args:
+            latency_samples (int, optional): If > 0, time this many get() calls
+                for stored keys and for absent ones. Defaults to 0.
+            miss_keys (Iterable, optional): Absent keys for the miss timings;
+                generated from the stored key type by default.
+
+        Returns:
+            dict: See chaining_stats.
+        """
+        return chaining_stats(self.arr, self.count, self.get, latency_samples, miss_keys)
+
+    # ===============================
+    # ITERATION METHODS
+    # ===============================
+    def keys(self):
+        """
+        Yield every key, bucket by bucket.
+
+        Time Complexity:
+            - O(n + m): every bucket is visited, including the empty ones.
+              See CompactHashMap for iteration that is independent of capacity.
+        """
+        for bucket in self.arr:
+            for element in bucket:
+                yield element[0]
+
+    def values(self):
+        """Yield every value, bucket by bucket. O(n + m)."""
+        for bucket in self.arr:
+            for element in bucket:
+                yield element[1]
+
+    def items(self):
+        """Yield every (key, value) pair, bucket by bucket. O(n + m)."""
+        for bucket in self.arr:
+            for element in bucket:
+                yield element[0], element[1]
+
 
 
 # ===============================
@@ -129,14 +674,14 @@ if __name__ == "__main__":
     hashmap["title"] = "Vagabond"
     hashmap["author"] = "Takehiko Inoue"
     hashmap["year"] = 1998
-
-    # Force a collision with "title"
     hashmap["paper"] = "Weekly Morning Magazine"
+    hashmap[1998] = "Any hashable key works, not only strings"
 
     print("Manga Title:", hashmap["title"])
     print("Manga Author:", hashmap["author"])
     print("Published Year:", hashmap["year"])
-    print("Serialized In:", hashmap["paper"])  # Same bucket as "title"
+    print("Serialized In:", hashmap["paper"])
+    print("Integer Key:", hashmap[1998])
 
     print(f"Hash of 'title' = {hashmap.get_hash('title')}")
     print(f"Hash of 'author' = {hashmap.get_hash('author')}")
@@ -148,5 +693,45 @@ if __name__ == "__main__":
     hashmap.remove("title") # Removing 'title' key from hashmap
 
     print("After removing:", hashmap.arr)
-    
-    # print("Manga Title:", hashmap["title"]) # This will throw KeyError
\ No newline at end of file
+
+    # print("Manga Title:", hashmap["title"]) # This will throw KeyError
+
+    # Force a collision with "title" using the ASCII-sum hash function
+    weak_hashmap = HashMap(10, hash_func=ascii_sum_hash)
+    weak_hashmap["title"] = "Vagabond"
+    weak_hashmap["paper"] = "Weekly Morning Magazine"  # Same bucket as "title"
+    print(f"ASCII-sum hash of 'title' = {weak_hashmap.get_hash('title')}")
+    print(f"ASCII-sum hash of 'paper' = {weak_hashmap.get_hash('paper')}")
+    print("Colliding buckets:", weak_hashmap.arr)
+
+    # Bulk operations: one pre-size, one batch of hashing
+    bulk_hashmap = HashMap(8)
+    bulk_hashmap.update((f"volume_{i}", i) for i in range(1, 38))
+    print("Buckets after bulk update:", bulk_hashmap.MAX_SIZE)
+    print("get_many:", bulk_hashmap.get_many(["volume_1", "volume_37", "volume_99"], default="?"))
+    print("contains_many:", bulk_hashmap.contains_many(["volume_2", "volume_0"]))
+    print("remove_many:", bulk_hashmap.remove_many(["volume_1", "volume_1"]), "size:", len(bulk_hashmap))
+
+    # Profile the table to see why it is (or is not) slow
+    report = bulk_hashmap.stats(latency_samples=100)
+    for name, value in report.items():
+        print(f"  {name}: {value}")
+
+    # The vectorized path must agree with mixed_hash, or batch-inserted keys
+    # would sit in buckets that get() never probes
+    if np is None:
+        print("Vectorized hashing check: skipped (NumPy is not installed)")
+    else:
+        mersenne = (1 << 61) - 1
+        special = [0, 1, -1, -2, 7, -7, mersenne - 1, mersenne, mersenne + 1, -mersenne, -mersenne - 1,
+                   2**63 - 1, -2**63, *range(-500, 500, 7)]
+        int_keys = np.array(list(dict.fromkeys(special)), dtype=np.int64)
+        unsigned_keys = np.array([0, 1, mersenne, 2**63, 2**64 - 1], dtype=np.uint64)
+        byte_keys = np.array([b"alpha", b"beta", b"", b"gamma"], dtype="S")
+        codes_match = all(mixed_hash_array(keys).tolist() == [mixed_hash(key) for key in keys.tolist()]
+                          for keys in (int_keys, unsigned_keys, byte_keys))
+        vector_hashmap = HashMap(8)
+        vector_hashmap.update(int_keys, np.arange(len(int_keys)))
+        round_trip = (vector_hashmap.get_many(int_keys).tolist() == list(range(len(int_keys)))
+                      and all(vector_hashmap.get(key) == i for i, key in enumerate(int_keys.tolist())))
+        print("Vectorized hashing matches mixed_hash?", codes_match, "| update/get round trip?", round_trip)
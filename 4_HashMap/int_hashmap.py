@@ -0,0 +1,327 @@
+# ===============================
+# Integer-Keyed Hash Map Implementation (typed arrays)
+# ===============================
+
+from array import array
+
+try:
+    import numpy as np  # Optional: only used to vectorize bulk loads
+except ImportError:
+    np = None
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+EMPTY = -(1 << 63)  # INT64_MIN marks an empty slot; that key is stored on the side
+
+
+def mix64(key):
+    """
+    Fast integer mixer (SplitMix64 finalizer) applied directly to a 64-bit key.
+
+    Unlike mixed_hash in hashmap.py it skips hash(), since an int key is
+    already a 64-bit number.
+
+    Time Complexity:
+        - O(1)
+    """
+    h = key & MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
+
+
+def mix64_array(keys):
+    """Vectorized mix64 for a NumPy integer array; returns a uint64 array."""
+    h = keys.astype(np.int64).view(np.uint64)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+class IntHashMap:
+    """
+    HashMap specialized for 64-bit integer keys, stored in typed arrays.
+
+    Theory:
+        - Keys live unboxed in an array('q') (8 bytes each) and values in a
+          parallel typed array (e.g. 'q' or 'd', 8 bytes each) or, for
+          arbitrary Python values, a parallel list.
+        - Open addressing with linear probing: a key's home slot is
+          mix64(key) & mask, and collisions move to the next slot.
+        - The key INT64_MIN marks an empty slot; if the user stores that key, it
+          is kept in a separate field, so every 64-bit key is still allowed.
+        - Deletion uses backward shifting (like RobinHoodHashMap): following
+          entries move back into the hole whenever that does not put them before
+          their home slot, so no tombstones are needed.
+        - Memory: about 16 / load_factor bytes per entry with a typed value
+          array, versus a list slot, a tuple and boxed ints (~100+ bytes) in
+          the chaining HashMap.
+
+    Real-world Usage:
+        - ID -> offset/score/counter maps (user IDs, row IDs, graph node IDs).
+        - Columnar joins and group-by on integer keys.
+
+    Complexity Overview:
+        - Average Case:
+            Insert: O(1) (amortized, including resizing)
+            Search: O(1)
+            Delete: O(1)
+        - Worst Case: O(n)
+        - Space Complexity: O(capacity), 16 bytes per slot with typed values.
+    """
+
+    def __init__(self, size=8, value_typecode=None, max_load_factor=0.7):
+        """
+        Initialize the IntHashMap.
+
+        Args:
+            size (int, optional): Minimum initial number of slots (rounded up to a
+                power of two). Defaults to 8.
+            value_typecode (str, optional): array typecode for values, e.g. "q"
+                or "d". None stores arbitrary Python objects in a list.
+            max_load_factor (float, optional): Load factor that triggers doubling.
+        """
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self.value_typecode = value_typecode
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self.has_empty_key = False  # Whether the INT64_MIN key itself is stored
+        self.empty_key_value = None
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.MAX_SIZE = capacity
+        self.mask = capacity - 1
+        self.keys = array("q", [EMPTY]) * capacity
+        if self.value_typecode is None:
+            self.values = [None] * capacity
+        else:
+            self.values = array(self.value_typecode, [0]) * capacity
+
+    def __len__(self):
+        return self.count
+
+    def get_hash(self, key):
+        """Return the home slot of a key within [0, MAX_SIZE-1]."""
+        return mix64(key) & self.mask
+
+    def _find(self, key):
+        """Return the slot holding key, or -1."""
+        keys, mask = self.keys, self.mask
+        idx = mix64(key) & mask
+        while True:
+            slot_key = keys[idx]
+            if slot_key == key:
+                return idx
+            if slot_key == EMPTY:
+                return -1
+            idx = (idx + 1) & mask
+
+    # ===============================
+    # SEARCH METHODS
+    # ===============================
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        if key == EMPTY:
+            if self.has_empty_key:
+                return self.empty_key_value
+            raise KeyError(f"key '{key}' not found")
+        idx = self._find(key)
+        if idx < 0:
+            raise KeyError(f"key '{key}' not found")
+        return self.values[idx]
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is absent."""
+        if key == EMPTY:
+            return self.empty_key_value if self.has_empty_key else default
+        idx = self._find(key)
+        return default if idx < 0 else self.values[idx]
+
+    def __contains__(self, key):
+        if key == EMPTY:
+            return self.has_empty_key
+        return self._find(key) >= 0
+
+    # ===============================
+    # INSERTION METHODS
+    # ===============================
+    def __setitem__(self, key, val):
+        """
+        Insert or update a key-value pair.
+
+        Time Complexity:
+            - Average Case: O(1) (amortized)
+
+        Raises:
+            OverflowError: If key does not fit in a signed 64-bit integer.
+        """
+        if key == EMPTY:
+            self.count += not self.has_empty_key
+            self.has_empty_key, self.empty_key_value = True, val
+            return
+        if self.count + 1 > self.MAX_SIZE * self.max_load_factor:
+            self.rehash(self.MAX_SIZE * 2)
+        self._insert(key, val, mix64(key) & self.mask)
+
+    def _insert(self, key, val, idx):
+        keys, mask = self.keys, self.mask
+        while True:
+            slot_key = keys[idx]
+            if slot_key == EMPTY:
+                keys[idx] = key
+                self.values[idx] = val
+                self.count += 1
+                return
+            if slot_key == key:
+                self.values[idx] = val
+                return
+            idx = (idx + 1) & mask
+
+    def reserve(self, n):
+        """Grow once so that n entries fit below the maximum load factor."""
+        capacity = self.MAX_SIZE
+        while capacity * self.max_load_factor < n:
+            capacity *= 2
+        if capacity != self.MAX_SIZE:
+            self.rehash(capacity)
+
+    def rehash(self, new_size):
+        """
+        Move every entry into a table of new_size slots (a power of two).
+
+        Time Complexity:
+            - O(n + capacity)
+        """
+        old_keys, old_values = self.keys, self.values
+        self._allocate(new_size)
+        self.count = int(self.has_empty_key)
+        for key, val in zip(old_keys, old_values):
+            if key != EMPTY:
+                self._insert(key, val, mix64(key) & self.mask)
+
+    def update(self, pairs, values=None):
+        """
+        Bulk insert, pre-sizing the table once.
+
+        Accepts an iterable of (key, value) pairs, or parallel key and value
+        sequences `update(keys, values)`. With NumPy integer arrays the home
+        slots are computed for the whole batch with mix64_array.
+
+        Time Complexity:
+            - O(k) on average for k entries, plus at most one rehash.
+        """
+        if values is None:
+            pairs = list(pairs)
+            keys = [pair[0] for pair in pairs]
+            values = [pair[1] for pair in pairs]
+        else:
+            keys = pairs
+        self.reserve(self.count + len(keys))
+
+        if np is not None and isinstance(keys, np.ndarray):
+            homes = (mix64_array(keys) & np.uint64(self.mask)).tolist()
+            keys = keys.tolist()
+        else:
+            keys = list(keys)
+            homes = [mix64(key) & self.mask for key in keys]
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+
+        for key, val, home in zip(keys, values, homes):
+            if key == EMPTY:
+                self[key] = val
+            else:
+                self._insert(key, val, home)
+
+    @classmethod
+    def from_arrays(cls, keys, values, value_typecode=None):
+        """
+        Build an IntHashMap from parallel key and value arrays (NumPy arrays,
+        array('q') or lists) in one pre-sized pass.
+        """
+        hashmap = cls(value_typecode=value_typecode)
+        hashmap.update(keys, values)
+        return hashmap
+
+    # ===============================
+    # DELETION METHOD
+    # ===============================
+    def remove(self, key):
+        """
+        Delete a key using backward-shift deletion.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        if key == EMPTY:
+            if not self.has_empty_key:
+                return False
+            self.has_empty_key, self.empty_key_value = False, None
+            self.count -= 1
+            return True
+
+        idx = self._find(key)
+        if idx < 0:
+            return False
+        keys, values, mask = self.keys, self.values, self.mask
+        hole = idx
+        while True:
+            idx = (idx + 1) & mask
+            slot_key = keys[idx]
+            if slot_key == EMPTY:
+                break
+            home = mix64(slot_key) & mask
+            # Move back only if the hole lies between the entry's home and its slot
+            if ((idx - home) & mask) >= ((idx - hole) & mask):
+                keys[hole] = slot_key
+                values[hole] = values[idx]
+                hole = idx
+        keys[hole] = EMPTY
+        values[hole] = None if self.value_typecode is None else 0
+        self.count -= 1
+        return True
+
+    def items(self):
+        """Yield (key, value) pairs in slot order."""
+        if self.has_empty_key:
+            yield EMPTY, self.empty_key_value
+        for key, val in zip(self.keys, self.values):
+            if key != EMPTY:
+                yield key, val
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import sys
+
+    from hashmap import HashMap
+
+    scores = IntHashMap(value_typecode="d")
+    scores[9007199254740993] = 98.5
+    scores[-42] = 77.0
+    scores[EMPTY] = 1.0  # Even INT64_MIN is a valid key
+    print("Score of 9007199254740993:", scores[9007199254740993])
+    print("Items:", list(scores.items()))
+    scores.remove(-42)
+    print("-42 present after removal?", -42 in scores)
+
+    # Memory per entry versus the chaining HashMap
+    n = 100000
+    ids = array("q", range(10**12, 10**12 + n * 7919, 7919))
+    int_map = IntHashMap.from_arrays(ids, array("q", range(n)), value_typecode="q")
+    chained = HashMap(8)
+    chained.update(ids, range(n))
+
+    int_bytes = sys.getsizeof(int_map.keys) + sys.getsizeof(int_map.values)
+    chained_bytes = chained.stats()["total_bytes"]
+    print(f"IntHashMap: {int_bytes / n:.1f} bytes/entry, "
+          f"chaining HashMap: {chained_bytes / n:.1f} bytes/entry")
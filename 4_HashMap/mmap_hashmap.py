@@ -0,0 +1,448 @@
+# ===============================
+# Memory-Mapped On-Disk Hash Map Implementation
+# ===============================
+
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+from hashmap import HashMap
+
+# ===============================
+# FILE FORMAT
+# ===============================
+# +--------------------------------------------------------------+
+# | header (64 bytes)                                            |
+# |   magic "HMAPv001", slot_count, entry_count, table_offset    |
+# +--------------------------------------------------------------+
+# | data region, written in one streaming pass:                  |
+# |   [key_len u32][key bytes][value_len u32][value bytes] ...   |
+# +--------------------------------------------------------------+
+# | slot table (slot_count slots, 24 bytes each):                |
+# |   [hash u64][key_offset u64][value_offset u64]               |
+# |   hash == 0 marks an empty slot; linear probing              |
+# +--------------------------------------------------------------+
+# All integers are little-endian. The append log (<path>.log) holds records
+#   [op u8][key_len u32][key bytes][value_len u32][value bytes][crc32 u32]
+# with op 1 = set and op 2 = delete (value_len 0); the CRC-32 covers the
+# record bytes before it.
+
+MAGIC = b"HMAPv001"
+HEADER = struct.Struct("<8sQQQ")
+HEADER_SIZE = 64
+SLOT = struct.Struct("<QQQ")
+LENGTH = struct.Struct("<I")
+LOG_RECORD = struct.Struct("<BI")
+CRC = struct.Struct("<I")
+OP_SET, OP_DELETE = 1, 2
+_DELETED = object()
+
+
+def stable_hash(key_bytes):
+    """
+    Process-independent 64-bit hash of a byte string (BLAKE2b, 8-byte digest).
+
+    Python's hash() of str/bytes is salted per process, so it cannot be stored
+    in a file that other processes will open. Never returns 0 (the empty-slot marker).
+    """
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little") or 1
+
+
+def _to_bytes(data):
+    """
+    Encode a key or value: str as UTF-8, bytes-like objects as their bytes.
+
+    Raises:
+        TypeError: For any other type. bytes(n) would silently turn an int into
+            n zero bytes, making int keys collide with byte-string keys.
+    """
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    raise TypeError(f"keys and values must be str or bytes-like, not {type(data).__name__}")
+
+
+# ===============================
+# BUILDER
+# ===============================
+def build(path, pairs, load_factor=0.7):
+    """
+    Write a memory-mappable hash table file from an iterable of (key, value) pairs.
+
+    Theory:
+        - Pass 1 (the only pass over the input): every record is streamed to
+          the data region; only its 8-byte hash and 8-byte offset are kept in
+          memory (two array('Q') arrays, 16 bytes per entry).
+        - The slot table is then allocated at the end of the file and filled
+          through an mmap of the file, so it never has to fit in RAM at once.
+        - Duplicate keys: the last occurrence wins.
+
+    Time Complexity:
+        - O(n) on average.
+    Space Complexity:
+        - O(n) * 16 bytes of RAM; O(data + n / load_factor * 24) bytes on disk.
+
+    Args:
+        path (str): Output file path.
+        pairs (Iterable[tuple]): (key, value) pairs of str or bytes.
+        load_factor (float, optional): Target fill ratio of the slot table.
+
+    Returns:
+        int: Number of distinct keys written.
+
+    Raises:
+        TypeError: If a key or value is not str or bytes-like.
+    """
+    hashes = array("Q")
+    offsets = array("Q")
+    with open(path, "wb") as f:
+        f.write(bytes(HEADER_SIZE))
+        offset = HEADER_SIZE
+        for key, value in pairs:
+            key, value = _to_bytes(key), _to_bytes(value)
+            hashes.append(stable_hash(key))
+            offsets.append(offset)
+            f.write(LENGTH.pack(len(key)) + key + LENGTH.pack(len(value)) + value)
+            offset += 2 * LENGTH.size + len(key) + len(value)
+
+        slot_count = 8
+        while slot_count * load_factor < len(hashes):
+            slot_count *= 2
+        table_offset = offset
+        f.truncate(table_offset + slot_count * SLOT.size)
+
+    with open(path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0)
+        try:
+            mask = slot_count - 1
+            entries = 0
+            for code, key_offset in zip(hashes, offsets):
+                key_len = LENGTH.unpack_from(mm, key_offset)[0]
+                value_offset = key_offset + LENGTH.size + key_len
+                idx = code & mask
+                while True:
+                    slot_pos = table_offset + idx * SLOT.size
+                    slot_hash, slot_key = SLOT.unpack_from(mm, slot_pos)[:2]
+                    if slot_hash == 0:
+                        entries += 1
+                        break
+                    if slot_hash == code and _read_bytes(mm, slot_key) == _read_bytes(mm, key_offset):
+                        break  # Duplicate key: overwrite with the later record
+                    idx = (idx + 1) & mask
+                SLOT.pack_into(mm, slot_pos, code, key_offset, value_offset)
+            HEADER.pack_into(mm, 0, MAGIC, slot_count, entries, table_offset)
+            mm.flush()
+        finally:
+            mm.close()
+    return entries
+
+
+def _log_record(op, key, value):
+    """Encode one append-log record, CRC trailer included."""
+    record = LOG_RECORD.pack(op, len(key)) + key + LENGTH.pack(len(value)) + value
+    return record + CRC.pack(zlib.crc32(record))
+
+
+def _parse_log_record(data, pos):
+    """
+    Decode the append-log record starting at pos.
+
+    Returns:
+        tuple | None: (op, key, value, next_pos), or None if the record is cut
+        off, has an unknown op or fails its CRC check.
+    """
+    if pos + LOG_RECORD.size > len(data):
+        return None
+    op, key_len = LOG_RECORD.unpack_from(data, pos)
+    value_pos = pos + LOG_RECORD.size + key_len
+    if op not in (OP_SET, OP_DELETE) or value_pos + LENGTH.size > len(data):
+        return None
+    value_len = LENGTH.unpack_from(data, value_pos)[0]
+    crc_pos = value_pos + LENGTH.size + value_len
+    if crc_pos + CRC.size > len(data) or CRC.unpack_from(data, crc_pos)[0] != zlib.crc32(data[pos:crc_pos]):
+        return None
+    key = data[pos + LOG_RECORD.size:value_pos]
+    value = data[value_pos + LENGTH.size:crc_pos]
+    return op, key, value, crc_pos + CRC.size
+
+
+def _read_bytes(buffer, offset):
+    """Read one length-prefixed byte string starting at offset."""
+    length = LENGTH.unpack_from(buffer, offset)[0]
+    start = offset + LENGTH.size
+    return buffer[start:start + length]
+
+
+# ===============================
+# READER / UPDATER
+# ===============================
+class MmapHashMap:
+    """
+    Persistent HashMap opened with mmap: no deserialization on open.
+
+    Theory:
+        - Opening maps the file into memory and reads only the 64-byte header,
+          so it takes the same time for 50 entries or 50 million. The operating
+          system pages in only the slots and records that lookups touch.
+        - A lookup hashes the key, then linearly probes the slot table directly
+          in the mapping and compares key bytes in place.
+        - Updates are appended to a log file (<path>.log) and mirrored in an
+          in-memory overlay HashMap that is consulted before the table. On open,
+          the log is replayed into the overlay through a read-only mmap. Every record carries a CRC-32,
+          so a record cut off by a crash mid-append (or otherwise damaged)
+          ends the replay, and the log is truncated back to the last good record.
+        - compact() merges table + overlay into a fresh file with build(),
+          swaps it in atomically with os.replace and empties the log. It runs
+          automatically when the log grows past compact_ratio of the data file.
+
+    Real-world Usage:
+        - Read-mostly lookup tables shared by many processes (the page cache is
+          shared), e.g. ID mappings, dictionaries and feature stores.
+        - Formats in the spirit of CDB, sparkey and LMDB.
+
+    Complexity Overview:
+        - Open: O(1) plus O(log size) to replay the append log.
+        - Search: O(1) average (a few page reads).
+        - Insert/Delete: O(1) append to the log.
+        - Compaction: O(n).
+    """
+
+    def __init__(self, path, compact_ratio=0.5):
+        """
+        Open a file created by build().
+
+        Args:
+            path (str): Path of the hash table file.
+            compact_ratio (float, optional): Compact automatically when the log
+                exceeds this fraction of the data file size. None disables it.
+
+        Raises:
+            ValueError: If the file is not a hash table file.
+        """
+        self.path = path
+        self.log_path = path + ".log"
+        self.compact_ratio = compact_ratio
+        self._open()
+
+    def _open(self):
+        self.file = open(self.path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.slot_count, self.base_count, self.table_offset = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"'{self.path}' is not a memory-mapped HashMap file")
+        self.mask = self.slot_count - 1
+
+        self.overlay = HashMap(16)  # key bytes -> value bytes or _DELETED
+        self.count = self.base_count
+        if os.path.exists(self.log_path) and os.path.getsize(self.log_path):
+            # Replay through a read-only mapping: the log is paged in as it is
+            # parsed instead of being read into memory at once
+            with open(self.log_path, "rb") as log, \
+                    mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                pos = 0
+                while True:
+                    record = _parse_log_record(data, pos)
+                    if record is None:
+                        break
+                    op, key, value, pos = record
+                    self._apply(key, value if op == OP_SET else _DELETED)
+                damaged = pos < len(data)
+            if damaged:
+                os.truncate(self.log_path, pos)  # Drop the damaged tail
+        self.log = open(self.log_path, "ab")
+
+    def close(self):
+        """Unmap the file and close the log."""
+        self.mm.close()
+        self.file.close()
+        if getattr(self, "log", None) is not None:
+            self.log.close()
+            self.log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    # ===============================
+    # SEARCH METHODS
+    # ===============================
+    def _lookup_base(self, key):
+        """Probe the mapped slot table; return the value bytes or None."""
+        mm, table_offset, mask = self.mm, self.table_offset, self.mask
+        code = stable_hash(key)
+        idx = code & mask
+        while True:
+            slot_hash, key_offset, value_offset = SLOT.unpack_from(mm, table_offset + idx * SLOT.size)
+            if slot_hash == 0:
+                return None
+            if slot_hash == code and _read_bytes(mm, key_offset) == key:
+                return _read_bytes(mm, value_offset)
+            idx = (idx + 1) & mask
+
+    def get(self, key, default=None):
+        """
+        Return the value bytes for key, or default if absent.
+
+        Time Complexity:
+            - O(1) average; only the probed slots and one record are read.
+        """
+        key = _to_bytes(key)
+        value = self.overlay.get(key)
+        if value is None:
+            value = self._lookup_base(key)
+        return default if value is None or value is _DELETED else value
+
+    def __getitem__(self, key):
+        """
+        Return the value bytes for key.
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        value = self.get(key)
+        if value is None:
+            raise KeyError(f"key '{key}' not found")
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def items(self):
+        """Yield every (key bytes, value bytes) pair: table entries, then log-only keys."""
+        mm = self.mm
+        for idx in range(self.slot_count):
+            slot_hash, key_offset, value_offset = SLOT.unpack_from(mm, self.table_offset + idx * SLOT.size)
+            if slot_hash:
+                key = _read_bytes(mm, key_offset)
+                value = self.overlay.get(key)
+                if value is None:
+                    yield key, _read_bytes(mm, value_offset)
+                elif value is not _DELETED:
+                    yield key, value
+        for key, value in self.overlay.items():
+            if value is not _DELETED and self._lookup_base(key) is None:
+                yield key, value
+
+    # ===============================
+    # UPDATE METHODS (APPEND LOG)
+    # ===============================
+    def _apply(self, key, value):
+        """Apply one update to the overlay and keep count exact."""
+        before = self.overlay.get(key)
+        if before is None:
+            existed = self._lookup_base(key) is not None
+        else:
+            existed = before is not _DELETED
+        exists = value is not _DELETED
+        self.count += exists - existed
+        self.overlay[key] = value
+        return existed
+
+    def _append(self, op, key, value):
+        self.log.write(_log_record(op, key, value))
+        self.log.flush()
+        if self.compact_ratio is not None and self.log.tell() > self.compact_ratio * self.table_offset:
+            self.compact()
+
+    def __setitem__(self, key, value):
+        """
+        Insert or update a key. The update is appended to the log and visible at once.
+
+        Time Complexity:
+            - O(1) average (plus an occasional O(n) automatic compaction).
+
+        Raises:
+            TypeError: If key or value is not str or bytes-like.
+        """
+        key, value = _to_bytes(key), _to_bytes(value)
+        self._apply(key, value)
+        self._append(OP_SET, key, value)
+
+    def remove(self, key):
+        """
+        Delete a key by appending a delete record to the log.
+
+        Returns:
+            bool: True if the key existed, False otherwise.
+        """
+        key = _to_bytes(key)
+        if self._apply(key, _DELETED):
+            self._append(OP_DELETE, key, b"")
+            return True
+        return False
+
+    # ===============================
+    # COMPACTION
+    # ===============================
+    def compact(self):
+        """
+        Rewrite the file with every live entry, atomically replace it and empty the log.
+
+        Time Complexity:
+            - O(n)
+        """
+        tmp_path = self.path + ".compact"
+        build(tmp_path, self.items())
+        self.close()
+        os.replace(tmp_path, self.path)
+        os.remove(self.log_path)
+        self._open()
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "users.hmap")
+
+    n = 200000
+    start = time.perf_counter()
+    build(path, ((f"user:{i}", f"profile-{i}") for i in range(n)))
+    print(f"Built {n} entries in {time.perf_counter() - start:.2f}s "
+          f"({os.path.getsize(path) / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    table = MmapHashMap(path)
+    print(f"Opened in {(time.perf_counter() - start) * 1e3:.3f} ms")
+    print("user:42 ->", table["user:42"])
+
+    table["user:42"] = "updated profile"  # Goes to the append log
+    table.remove("user:7")
+    table["user:new"] = "fresh profile"
+    table.close()
+
+    with MmapHashMap(path) as reopened:     # Log is replayed on open
+        print("user:42 ->", reopened["user:42"], "| user:7 present?", "user:7" in reopened)
+        print("Entries:", len(reopened))
+        reopened.compact()
+        print("After compaction:", len(reopened), "entries,",
+              os.path.exists(reopened.log_path) and os.path.getsize(reopened.log_path), "log bytes")
+
+    # A crash in the middle of an append leaves a torn record at the end of the log
+    with MmapHashMap(path, compact_ratio=None) as table:
+        table["user:torn"] = "hello world"
+    os.truncate(table.log_path, os.path.getsize(table.log_path) - 3)
+    with MmapHashMap(path) as recovered:
+        print("Torn record replayed?", "user:torn" in recovered,
+              "| log bytes after recovery:", os.path.getsize(recovered.log_path))
+
+    # Only str and bytes-like keys are accepted: bytes(5) would be five zero bytes
+    with MmapHashMap(path) as table:
+        try:
+            table[5] = "five"
+        except TypeError as error:
+            print("Int key rejected:", error)
@@ -0,0 +1,269 @@
+# ===============================
+# Robin Hood Hash Map Implementation
+# ===============================
+
+from array import array
+
+from hashmap import MASK_64, mixed_hash
+
+
+class RobinHoodHashMap:
+    """
+    HashMap implementation using Open Addressing with Robin Hood linear probing.
+
+    Theory:
+        - All entries live directly in three flat, parallel arrays:
+            1. hashes (array('Q') of 64-bit hash codes, 0 marks an empty slot)
+            2. keys   (list of keys)
+            3. values (list of values)
+          There is no list object per bucket and no tuple per entry.
+        - Collisions are resolved with linear probing: if the home slot
+          (hash_code & mask) is taken, the next slot is tried, and so on.
+        - Robin Hood rule: while inserting, if the new entry has travelled further
+          from its home slot than the entry currently in the slot, they swap places
+          ("take from the rich, give to the poor"). This keeps probe lengths short
+          and nearly equal, and lets a lookup stop early as soon as it meets an
+          entry that is closer to its home than the searched key would be.
+        - Deletion uses backward shifting: the entries following the removed slot
+          are moved one slot back until an empty slot or an entry already at its
+          home slot is reached. No tombstones are ever left behind.
+        - The capacity is always a power of two, so `code & mask` replaces `%`.
+
+    Real-world Usage:
+        - High-performance dictionaries in Rust (older std HashMap) and C++ libraries.
+        - Memory-sensitive caches and indexes with millions of small entries.
+
+    Complexity Overview:
+        - Average Case:
+            Insert: O(1) (amortized, including resizing)
+            Search: O(1)
+            Delete: O(1)
+        - Worst Case:
+            Insert: O(n)
+            Search: O(n)
+            Delete: O(n)
+        - Space Complexity: O(capacity), three machine words per slot.
+    """
+
+    def __init__(self, size=8, hash_func=mixed_hash, max_load_factor=0.85):
+        """
+        Initialize the RobinHoodHashMap.
+
+        Args:
+            size (int, optional): Minimum initial number of slots (rounded up to a
+                power of two). Defaults to 8.
+            hash_func (Callable, optional): Maps a key to an integer hash code.
+                Defaults to mixed_hash.
+            max_load_factor (float, optional): Load factor above which the table
+                doubles in size. Defaults to 0.85.
+        """
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.MAX_SIZE = capacity
+        self.mask = capacity - 1
+        self.hashes = array("Q", bytes(8 * capacity))  # 0 = empty slot
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+
+    def __len__(self):
+        """Return the number of key-value pairs stored in the map."""
+        return self.count
+
+    def _hash_code(self, key):
+        # 0 is reserved for empty slots
+        return (self.hash_func(key) & MASK_64) or 1
+
+    def get_hash(self, key):
+        """
+        Compute the home slot index for a given key.
+
+        Args:
+            key (Hashable): The key to be hashed.
+
+        Returns:
+            int: The home slot within the range [0, MAX_SIZE-1].
+        """
+        return self._hash_code(key) & self.mask
+
+    def _find_slot(self, key, code):
+        """Return the slot holding key, or -1 if it is absent."""
+        hashes, keys, mask = self.hashes, self.keys, self.mask
+        idx = code & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[idx]
+            if slot_hash == 0:
+                return -1
+            if ((idx - slot_hash) & mask) < dist:
+                return -1  # Robin Hood invariant: key would have been placed earlier
+            if slot_hash == code and keys[idx] == key:
+                return idx
+            idx = (idx + 1) & mask
+            dist += 1
+
+    # ===============================
+    # INSERTION METHOD
+    # ===============================
+    def __setitem__(self, key, val):
+        """
+        Insert or update a key-value pair.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        Space Complexity:
+            - O(1) (amortized O(n) when the table is resized)
+
+        Args:
+            key (Hashable): The key to insert.
+            val (Any): The value associated with the key.
+        """
+        if self.count + 1 > self.MAX_SIZE * self.max_load_factor:
+            self.rehash(self.MAX_SIZE * 2)
+        self._insert(key, val, self._hash_code(key))
+
+    def _insert(self, key, val, code):
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        idx = code & mask
+        dist = 0
+        while True:
+            slot_hash = hashes[idx]
+            if slot_hash == 0:
+                hashes[idx] = code
+                keys[idx] = key
+                values[idx] = val
+                self.count += 1
+                return
+            if slot_hash == code and keys[idx] == key:
+                values[idx] = val  # Update existing key
+                return
+            slot_dist = (idx - slot_hash) & mask
+            if slot_dist < dist:
+                # Swap with the "richer" entry and continue inserting it instead
+                hashes[idx], code = code, slot_hash
+                keys[idx], key = key, keys[idx]
+                values[idx], val = val, values[idx]
+                dist = slot_dist
+            idx = (idx + 1) & mask
+            dist += 1
+
+    # ===============================
+    # SEARCH METHOD
+    # ===============================
+    def __getitem__(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        Space Complexity:
+            - O(1)
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        idx = self._find_slot(key, self._hash_code(key))
+        if idx < 0:
+            raise KeyError(f"key '{key}' not found")
+        return self.values[idx]
+
+    def __contains__(self, key):
+        return self._find_slot(key, self._hash_code(key)) >= 0
+
+    # ===============================
+    # DELETION METHOD
+    # ===============================
+    def remove(self, key):
+        """
+        Delete a key using backward-shift deletion (no tombstones).
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+        Space Complexity:
+            - O(1)
+
+        Args:
+            key (Hashable): The key to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        idx = self._find_slot(key, self._hash_code(key))
+        if idx < 0:
+            return False
+
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        nxt = (idx + 1) & mask
+        # Shift back every following entry that is not at its home slot
+        while hashes[nxt] != 0 and ((nxt - hashes[nxt]) & mask) != 0:
+            hashes[idx] = hashes[nxt]
+            keys[idx] = keys[nxt]
+            values[idx] = values[nxt]
+            idx = nxt
+            nxt = (nxt + 1) & mask
+        hashes[idx] = 0
+        keys[idx] = None
+        values[idx] = None
+        self.count -= 1
+        return True
+
+    # ===============================
+    # REHASH METHOD
+    # ===============================
+    def rehash(self, new_size):
+        """
+        Move every entry into a new table with at least new_size slots,
+        reusing the stored hash codes.
+
+        Time Complexity:
+            - O(n + capacity)
+        Space Complexity:
+            - O(capacity)
+        """
+        old = zip(self.hashes, self.keys, self.values)
+        capacity = 8
+        while capacity < max(new_size, self.count + 1):
+            capacity *= 2
+        self._allocate(capacity)
+        self.count = 0
+        for code, key, val in old:
+            if code:
+                self._insert(key, val, code)
+
+    def items(self):
+        """Yield (key, value) pairs in slot order."""
+        for code, key, val in zip(self.hashes, self.keys, self.values):
+            if code:
+                yield key, val
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    hashmap = RobinHoodHashMap()
+    hashmap["title"] = "Vagabond"
+    hashmap["author"] = "Takehiko Inoue"
+    hashmap["year"] = 1998
+    hashmap["paper"] = "Weekly Morning Magazine"
+
+    print("Manga Title:", hashmap["title"])
+    print("Manga Author:", hashmap["author"])
+    print("Published Year:", hashmap["year"])
+    print("Serialized In:", hashmap["paper"])
+
+    for key in ["title", "author", "year", "paper"]:
+        slot = hashmap._find_slot(key, hashmap._hash_code(key))
+        print(f"'{key}': home slot = {hashmap.get_hash(key)}, stored in slot = {slot}")
+
+    hashmap.remove("title")  # Backward-shift deletion, no tombstone left behind
+    print("After removing 'title':", list(hashmap.items()))
@@ -0,0 +1,335 @@
+# ===============================
+# Process-Sharded Hash Map Implementation
+# ===============================
+
+import multiprocessing
+import os
+
+from hashmap import HashMap, mixed_hash
+
+
+# ===============================
+# WORKER PROCESS
+# ===============================
+def _shard_worker(conn, size):
+    """
+    Main loop of one shard process: owns a HashMap and serves batched commands.
+
+    Every command is a tuple (name, *args) and gets exactly one reply:
+    (True, result) on success or (False, exception) on failure.
+    """
+    hashmap = HashMap(size)
+    while True:
+        command, *args = conn.recv()
+        if command == "close":
+            conn.close()
+            return
+        try:
+            if command == "set_many":
+                keys, values = args
+                hashmap.update(keys, values)
+                result = None
+            elif command == "get_many":
+                keys, default = args
+                result = hashmap.get_many(keys, default)
+            elif command == "getitem":
+                result = hashmap[args[0]]
+            elif command == "contains_many":
+                result = hashmap.contains_many(args[0])
+            elif command == "remove_many":
+                result = hashmap.remove_many(args[0])
+            elif command == "len":
+                result = len(hashmap)
+            elif command == "map_reduce":
+                map_fn, reduce_fn = args
+                result = None
+                for key, val in hashmap.items():
+                    mapped = map_fn(key, val)
+                    result = mapped if result is None else reduce_fn(result, mapped)
+            else:
+                raise ValueError(f"unknown shard command '{command}'")
+            conn.send((True, result))
+        except Exception as exc:
+            conn.send((False, exc))
+
+
+class ShardedHashMap:
+    """
+    HashMap partitioned across N worker processes by hash.
+
+    Theory:
+        - Each key belongs to shard `mixed_hash(key) % num_shards`; every shard
+          is a separate process owning a plain HashMap, so the shards use
+          separate cores and separate memory (no GIL sharing).
+        - Batched routing: a batch of keys is split into one sub-batch per
+          shard, all sub-batches are sent before any reply is awaited (so the
+          shards work in parallel), and the replies are stitched back into the
+          caller's order. Inter-process messages cost far more than a lookup,
+          so batching is what makes sharding pay off.
+        - Bulk build streams an iterable once, filling per-shard buffers and
+          shipping each full buffer while the other shards are still inserting.
+        - map_reduce runs map_fn/reduce_fn inside every shard and reduces the N
+          partial results in the parent, so only N small values cross processes.
+
+    Real-world Usage:
+        - Scaling in-memory lookups and joins across the cores of one machine.
+        - The same partitioning scheme as Redis Cluster, Memcached client
+          sharding and distributed hash tables, at process scale.
+
+    Complexity Overview:
+        - get_many / set_many / remove_many of k keys: O(k) total work,
+          about O(k / N) per shard in parallel, plus O(N) messages.
+        - Single-key operations: O(1) plus one round trip (prefer batches).
+        - map_reduce: O(n / N) per shard in parallel, plus O(N) to combine.
+        - Space Complexity: O(n) spread across N processes.
+    """
+
+    def __init__(self, num_shards=None, size_per_shard=1024):
+        """
+        Start the shard processes.
+
+        Args:
+            num_shards (int, optional): Number of worker processes. Defaults to
+                os.cpu_count().
+            size_per_shard (int, optional): Initial bucket count of every shard.
+        """
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.connections = []
+        self.processes = []
+        for _ in range(self.num_shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_worker, args=(child_conn, size_per_shard),
+                                              daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def close(self):
+        """Stop every shard process."""
+        for conn, process in zip(self.connections, self.processes):
+            conn.send(("close",))
+            conn.close()
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def shard_of(self, key):
+        """Return the index of the shard that owns key."""
+        return mixed_hash(key) % self.num_shards
+
+    # ===============================
+    # ROUTING HELPERS
+    # ===============================
+    def _receive(self, shard):
+        ok, result = self.connections[shard].recv()
+        if not ok:
+            raise result
+        return result
+
+    def _scatter(self, keys):
+        """Split keys into per-shard lists, remembering each key's original position."""
+        shard_keys = [[] for _ in range(self.num_shards)]
+        shard_positions = [[] for _ in range(self.num_shards)]
+        for pos, key in enumerate(keys):
+            shard = mixed_hash(key) % self.num_shards
+            shard_keys[shard].append(key)
+            shard_positions[shard].append(pos)
+        return shard_keys, shard_positions
+
+    def _broadcast(self, command, shard_args):
+        """Send one command per shard that has work, then collect every reply."""
+        active = [shard for shard, args in enumerate(shard_args) if args is not None]
+        for shard in active:
+            self.connections[shard].send((command, *shard_args[shard]))
+        # Read every reply before raising, so no shard is left out of step
+        replies = {shard: self.connections[shard].recv() for shard in active}
+        for ok, result in replies.values():
+            if not ok:
+                raise result
+        return {shard: result for shard, (_, result) in replies.items()}
+
+    def _gather(self, command, keys, *extra):
+        keys = list(keys)
+        shard_keys, shard_positions = self._scatter(keys)
+        replies = self._broadcast(command, [(part, *extra) if part else None for part in shard_keys])
+        results = [None] * len(keys)
+        for shard, values in replies.items():
+            for pos, val in zip(shard_positions[shard], values):
+                results[pos] = val
+        return results
+
+    # ===============================
+    # BATCH METHODS
+    # ===============================
+    def set_many(self, pairs):
+        """
+        Insert or update many key-value pairs with one message per shard.
+
+        Args:
+            pairs (Iterable[tuple]): (key, value) pairs.
+        """
+        pairs = list(pairs)
+        shard_keys, shard_positions = self._scatter(pair[0] for pair in pairs)
+        self._broadcast("set_many", [
+            (keys, [pairs[pos][1] for pos in positions]) if keys else None
+            for keys, positions in zip(shard_keys, shard_positions)
+        ])
+
+    def get_many(self, keys, default=None):
+        """
+        Look up many keys with one message per shard, answered in parallel.
+
+        Returns:
+            list: Values in the order of keys (default for missing keys).
+        """
+        return self._gather("get_many", keys, default)
+
+    def contains_many(self, keys):
+        """Return one membership flag per key, in the order of keys."""
+        return self._gather("contains_many", keys)
+
+    def remove_many(self, keys):
+        """Delete many keys; returns one 'was removed' flag per key."""
+        return self._gather("remove_many", keys)
+
+    def __setitem__(self, key, val):
+        self.set_many([(key, val)])
+
+    def __getitem__(self, key):
+        """
+        Retrieve one value (one round trip; prefer get_many for many keys).
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        shard = self.shard_of(key)
+        self.connections[shard].send(("getitem", key))
+        return self._receive(shard)  # Re-raises the shard's KeyError
+
+    def remove(self, key):
+        """Delete one key. Returns True if it existed."""
+        return self.remove_many([key])[0]
+
+    def __len__(self):
+        return sum(self._broadcast("len", [()] * self.num_shards).values())
+
+    # ===============================
+    # PARALLEL BULK BUILD
+    # ===============================
+    def build(self, pairs, batch_size=50000):
+        """
+        Stream (key, value) pairs into the shards in one pass.
+
+        Each shard has at most one batch in flight: before a shard receives its
+        next batch, the acknowledgement of the previous one is collected. While
+        the parent routes the following keys, every shard inserts in parallel.
+
+        Time Complexity:
+            - O(n) routing in the parent, O(n / N) insertion per shard in parallel.
+        Space Complexity:
+            - O(N * batch_size) buffered pairs.
+
+        Args:
+            pairs (Iterable[tuple]): (key, value) pairs, consumed lazily.
+            batch_size (int, optional): Pairs buffered per shard before sending.
+        """
+        buffers = [([], []) for _ in range(self.num_shards)]
+        in_flight = [False] * self.num_shards
+
+        def flush(shard):
+            keys, values = buffers[shard]
+            if in_flight[shard]:
+                self._receive(shard)
+            self.connections[shard].send(("set_many", keys, values))
+            in_flight[shard] = True
+            buffers[shard] = ([], [])
+
+        for key, val in pairs:
+            shard = mixed_hash(key) % self.num_shards
+            keys, values = buffers[shard]
+            keys.append(key)
+            values.append(val)
+            if len(keys) >= batch_size:
+                flush(shard)
+
+        for shard in range(self.num_shards):
+            if buffers[shard][0]:
+                flush(shard)
+            if in_flight[shard]:
+                self._receive(shard)
+
+    # ===============================
+    # MAP-REDUCE
+    # ===============================
+    def map_reduce(self, map_fn, reduce_fn, initial=None):
+        """
+        Aggregate over every entry of every shard.
+
+        Each shard computes reduce_fn over map_fn(key, value) of its entries in
+        parallel; the parent then reduces the partial results. reduce_fn must
+        be associative, and both functions must be picklable (defined at module
+        level).
+
+        Example:
+            def value_of(key, val):
+                return val
+
+            total = sharded.map_reduce(value_of, operator.add, 0)
+
+        Args:
+            map_fn (Callable): Maps (key, value) to a partial result.
+            reduce_fn (Callable): Combines two partial results.
+            initial (Any, optional): Starting value, combined in exactly once.
+
+        Returns:
+            Any: The combined result, or initial if the map is empty.
+        """
+        partials = self._broadcast("map_reduce", [(map_fn, reduce_fn)] * self.num_shards)
+        result = initial
+        for partial in partials.values():
+            if partial is None:
+                continue
+            result = partial if result is None else reduce_fn(result, partial)
+        return result
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+def _value_of(key, val):
+    return val
+
+
+def _max_pair(a, b):
+    return max(a, b)
+
+
+def _key_and_value(key, val):
+    return (val, key)
+
+
+if __name__ == "__main__":
+    import operator
+    import time
+
+    n = 400000
+    with ShardedHashMap(num_shards=4) as sharded:
+        start = time.perf_counter()
+        sharded.build((f"user_{i}", i) for i in range(n))
+        print(f"Bulk-built {len(sharded)} entries across {sharded.num_shards} shards "
+              f"in {time.perf_counter() - start:.2f}s")
+
+        print("get_many:", sharded.get_many(["user_1", "user_399999", "nobody"], default=-1))
+        sharded.set_many([("user_1", 1000000), ("vip", 5)])
+        print("user_1 after set_many:", sharded["user_1"])
+        print("remove_many:", sharded.remove_many(["vip", "vip"]))
+
+        print("Sum of all values:", sharded.map_reduce(_value_of, operator.add, 0))
+        print("Largest (value, key):", sharded.map_reduce(_key_and_value, _max_pair))
@@ -2,6 +2,181 @@
 # Hash Set Implementation
 # ===============================
 
+import itertools
+import random
+import sys
+import time
+
+# ===============================
+# HASH FUNCTIONS
+# ===============================
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def mixed_hash(key):
+    """
+    Default hash function: Python's built-in hash() followed by a 64-bit bit mixer.
+
+    Theory:
+        - hash() works for every hashable type and runs in C.
+        - The SplitMix64 finalizer spreads every input bit across the 64-bit
+          output, so small integers and anagrams ("abc" / "cab") land in
+          different buckets.
+
+    Time Complexity:
+        - O(1) for the mixing step.
+    Space Complexity:
+        - O(1)
+
+    Args:
+        key (Hashable): Any hashable value.
+
+    Returns:
+        int: A non-negative 64-bit hash code.
+    """
+    h = hash(key) & MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
+
+
+def ascii_sum_hash(key):
+    """
+    Classic teaching hash: the sum of the character codes of a string value.
+    Every anagram maps to the same bucket. Only works for strings.
+
+    Time Complexity:
+        - O(k), where k is the length of the value.
+    Space Complexity:
+        - O(1)
+
+    Args:
+        key (str): The value to be hashed.
+
+    Returns:
+        int: Sum of the ASCII values of the characters.
+    """
+    hash_val = 0
+    for char in key:
+        hash_val += ord(char)
+    return hash_val
+
+
+# ===============================
+# PROFILING HELPERS
+# ===============================
+def _absent_keys(stored, k, contains):
+    """
+    Build k keys that are not in the table, of the same type as the stored
+    keys, so a custom hash function sees the kind of key it expects.
+
+    Returns:
+        list | None: The keys, or None if no absent keys of that type can be
+        generated (pass miss_keys to the stats method instead).
+    """
+    sample = stored[0]
+    if isinstance(sample, bool):
+        return None
+    if isinstance(sample, int):
+        start = max(key for key in stored if isinstance(key, int) and not isinstance(key, bool)) + 1
+        candidates = itertools.count(start)
+    elif isinstance(sample, str):
+        candidates = (f"\0absent-{i}" for i in itertools.count())
+    elif isinstance(sample, bytes):
+        candidates = (b"\0absent-%d" % i for i in itertools.count())
+    else:
+        return None
+    return list(itertools.islice((key for key in candidates if not contains(key)), k))
+
+
+def chaining_stats(arr, count, lookup, latency_samples=0, miss_keys=None):
+    """
+    Report bucket occupancy, probe lengths and memory use of a separate-chaining
+    table whose buckets hold tuples ending in the cached hash code.
+
+    Theory:
+        - With separate chaining, finding the j-th element of a bucket takes
+          j comparisons, so a bucket of length b contributes b(b+1)/2
+          comparisons over its b successful lookups.
+        - An unsuccessful lookup scans its whole bucket; averaged over all
+          buckets that is n/m comparisons (the load factor).
+        - For a good hash function at load factor a, expect about 1 + a/2
+          comparisons per hit and a per miss; much larger values point to
+          clustering (a weak hash) or an undersized table.
+
+    Time Complexity:
+        - O(n + m), plus O(latency_samples) timed lookups.
+    Space Complexity:
+        - O(longest bucket) for the histogram.
+
+    Args:
+        arr (list[list[tuple]]): The bucket array; element[0] is the key and
+            element[-1] the cached hash code.
+        count (int): Number of stored elements.
+        lookup (Callable): Timed for the latency samples, called with one key.
+        latency_samples (int, optional): If > 0, time this many lookups of
+            stored values and of absent ones, on the live table. Defaults to 0.
+        miss_keys (Iterable, optional): Absent values for the miss timings.
+            Defaults to keys generated from the stored key type (int, str or
+            bytes); for other key types, miss latency is only measured when
+            miss_keys is given.
+
+    Returns:
+        dict: load_factor, bucket_histogram (length -> bucket count),
+        max_chain, mean_chain (over non-empty buckets), empty_bucket_ratio,
+        avg_comparisons_hit, avg_comparisons_miss, table_bytes (buckets,
+        entry tuples and cached hash codes), total_bytes (table_bytes plus
+        the stored objects), and, when sampled, hit_latency_ns and
+        miss_latency_ns as (mean, p99) pairs.
+    """
+    n, m = count, len(arr)
+    histogram = {}
+    comparisons_hit = 0
+    table_bytes = sys.getsizeof(arr)
+    payload_bytes = 0
+    for bucket in arr:
+        length = len(bucket)
+        histogram[length] = histogram.get(length, 0) + 1
+        comparisons_hit += length * (length + 1) // 2
+        table_bytes += sys.getsizeof(bucket)
+        for element in bucket:
+            table_bytes += sys.getsizeof(element) + sys.getsizeof(element[-1])
+            payload_bytes += sum(sys.getsizeof(item) for item in element[:-1])
+
+    non_empty = m - histogram.get(0, 0)
+    report = {
+        "load_factor": n / m,
+        "bucket_histogram": dict(sorted(histogram.items())),
+        "max_chain": max(histogram),
+        "mean_chain": n / non_empty if non_empty else 0.0,
+        "empty_bucket_ratio": histogram.get(0, 0) / m,
+        "avg_comparisons_hit": comparisons_hit / n if n else 0.0,
+        "avg_comparisons_miss": n / m,
+        "table_bytes": table_bytes,
+        "total_bytes": table_bytes + payload_bytes,
+    }
+
+    if latency_samples > 0 and n:
+        stored = [element[0] for bucket in arr for element in bucket]
+        samples = {"hit_latency_ns": random.choices(stored, k=latency_samples)}
+        if miss_keys is not None:
+            samples["miss_latency_ns"] = list(itertools.islice(miss_keys, latency_samples))
+        else:
+            absent = _absent_keys(stored, latency_samples, lookup)
+            if absent is not None:
+                samples["miss_latency_ns"] = absent
+        for name, keys in samples.items():
+            timings = []
+            for key in keys:
+                start = time.perf_counter_ns()
+                lookup(key)
+                timings.append(time.perf_counter_ns() - start)
+            if timings:
+                timings.sort()
+                report[name] = (sum(timings) / len(timings), timings[int(len(timings) * 0.99)])
+    return report
+
+
 class HashSet:
     """
     HashSet implementation using Separate Chaining for collision handling.
@@ -12,6 +187,11 @@ class HashSet:
         - Collisions (two values mapping to the same index) are handled using lists
           (separate chaining).
         - Duplicate values are not allowed.
+        - Each element is stored as a (value, hash_code) tuple, so comparisons
+          short-circuit on differing codes and rehashing never calls the hash
+          function again.
+        - The hash function is pluggable, and the bucket array doubles when the
+          load factor exceeds max_load_factor.
 
     Real-world Usage:
         - Removing duplicates from data.
@@ -20,7 +200,7 @@ class HashSet:
 
     Complexity Overview:
         - Average Case:
-            Insert: O(1)
+            Insert: O(1) (amortized, including occasional rehashing)
             Search: O(1)
         - Worst Case (many collisions in one bucket):
             Insert: O(n)
@@ -28,35 +208,43 @@ class HashSet:
         - Space Complexity: O(n), where n is the number of values.
     """
 
-    def __init__(self, size):
+    def __init__(self, size, hash_func=mixed_hash, max_load_factor=0.75):
         """
         Initialize the HashSet with a given number of buckets.
 
         Args:
-            size (int): Number of buckets in the HashSet.
+            size (int): Initial number of buckets in the HashSet.
+            hash_func (Callable, optional): Maps a value to an integer hash code.
+                Defaults to mixed_hash.
+            max_load_factor (float, optional): Load factor above which the table
+                doubles in size. None disables automatic growth. Defaults to 0.75.
         """
         self.MAX_SIZE = size
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.count = 0
         self.arr = [[] for _ in range(self.MAX_SIZE)]  # Each bucket is a list for collisions
 
+    def __len__(self):
+        """Return the number of values stored in the HashSet."""
+        return self.count
+
     def get_hash(self, key):
         """
         Compute the hash value (bucket index) for a given key.
 
         Time Complexity:
-            - O(k), where k is the length of the key (sum of ASCII values).
+            - O(1) with the default hash function.
         Space Complexity:
             - O(1)
 
         Args:
-            key (str): The value to be hashed.
+            key (Hashable): The value to be hashed.
 
         Returns:
             int: Index of the bucket in the range [0, MAX_SIZE-1].
         """
-        hash_val = 0
-        for char in key:
-            hash_val += ord(char)
-        return hash_val % self.MAX_SIZE
+        return self.hash_func(key) % self.MAX_SIZE
 
     def append(self, val):
         """
@@ -69,16 +257,38 @@ class HashSet:
             - O(1) for the value itself, O(n) for the bucket in worst case.
 
         Args:
-            val (str): The value to add to the set.
+            val (Hashable): The value to add to the set.
+        """
+        code = self.hash_func(val)
+        bucket = self.arr[code % self.MAX_SIZE]
+        for element in bucket:
+            if element[1] == code and element[0] == val:  # Check for duplicates
+                return
+        bucket.append((val, code))  # Insert value in bucket
+        self.count += 1
+
+        if self.max_load_factor is not None and self.count > self.MAX_SIZE * self.max_load_factor:
+            self.rehash(self.MAX_SIZE * 2)
+
+    def __contains__(self, val):
+        """
+        Check whether a value is in the HashSet.
+
+        Time Complexity:
+            - Average Case: O(1)
+            - Worst Case: O(n)
+
+        Args:
+            val (Hashable): The value to look for.
+
+        Returns:
+            bool: True if the value is present, False otherwise.
         """
-        hash_val = self.get_hash(val)
-        found = False
-        for element in self.arr[hash_val]:
-            if element == val:  # Check for duplicates
-                found = True
-                break
-        if not found:
-            self.arr[hash_val].append(val)  # Insert value in bucket
+        code = self.hash_func(val)
+        for element in self.arr[code % self.MAX_SIZE]:
+            if element[1] == code and element[0] == val:
+                return True
+        return False
 
     def print_hashset(self):
         """
@@ -96,8 +306,7 @@ class HashSet:
         elements = []
         for bucket in self.arr:
             for element in bucket:
-                if element is not None:
-                    elements.append(element)
+                elements.append(str(element[0]))
         print(", ".join(elements), end="")
         print("}")
     
@@ -115,7 +324,7 @@ class HashSet:
             - O(1)
 
         Args:
-            val (str): The value to delete.
+            val (Hashable): The value to delete.
 
         Returns:
             bool: True if deletion was successful, False otherwise.
@@ -123,21 +332,386 @@ class HashSet:
         Example:
             del hashset["abc"]
         """
-        hash_val = self.get_hash(val)
-        bucket = self.arr[hash_val]
+        code = self.hash_func(val)
+        bucket = self.arr[code % self.MAX_SIZE]
+
+        for idx, element in enumerate(bucket):
+            if element[1] == code and element[0] == val:
+                del bucket[idx]
+                self.count -= 1
+                return True
+        return False
+
+    # ===============================
+    # REHASH METHOD
+    # ===============================
+    def rehash(self, new_size):
+        """
+        Redistribute all values into a new bucket array of the given size,
+        reusing the cached hash codes.
+
+        Time Complexity:
+            - O(n + m), where n is the number of values and m the new bucket count.
+        Space Complexity:
+            - O(m) for the new bucket array.
+
+        Args:
+            new_size (int): The new number of buckets.
+        """
+        new_arr = [[] for _ in range(new_size)]
+        for bucket in self.arr:
+            for element in bucket:
+                new_arr[element[1] % new_size].append(element)
+        self.MAX_SIZE = new_size
+        self.arr = new_arr
+
+    # ===============================
+    # SET ALGEBRA HELPERS
+    # ===============================
+    def __iter__(self):
+        """Yield every value, bucket by bucket. O(n + m)."""
+        for bucket in self.arr:
+            for element in bucket:
+                yield element[0]
+
+    def _elements(self):
+        """Yield the stored (value, hash_code) tuples."""
+        for bucket in self.arr:
+            yield from bucket
+
+    def _has(self, val, code):
+        """Membership test with a precomputed hash code (no hashing)."""
+        for element in self.arr[code % self.MAX_SIZE]:
+            if element[1] == code and element[0] == val:
+                return True
+        return False
+
+    def _code_from(self, other, element):
+        """Hash code of another set's element under this set's hash function."""
+        return element[1] if other.hash_func is self.hash_func else self.hash_func(element[0])
+
+    def _add_code(self, val, code):
+        """Insert a value whose hash code is already known. Returns True if added."""
+        bucket = self.arr[code % self.MAX_SIZE]
+        for element in bucket:
+            if element[1] == code and element[0] == val:
+                return False
+        bucket.append((val, code))
+        self.count += 1
+        if self.max_load_factor is not None and self.count > self.MAX_SIZE * self.max_load_factor:
+            self.rehash(self.MAX_SIZE * 2)
+        return True
 
+    def _discard_code(self, val, code):
+        """Remove a value whose hash code is already known. Returns True if removed."""
+        bucket = self.arr[code % self.MAX_SIZE]
         for idx, element in enumerate(bucket):
-            if element == val:
+            if element[1] == code and element[0] == val:
                 del bucket[idx]
+                self.count -= 1
                 return True
         return False
 
+    def _empty_like(self):
+        return HashSet(self.MAX_SIZE, self.hash_func, self.max_load_factor)
+
+    def _as_hashset(self, other):
+        """Accept any iterable as the other operand of a set operation."""
+        if isinstance(other, HashSet):
+            return other
+        result = HashSet(8, self.hash_func, self.max_load_factor)
+        for val in other:
+            result.append(val)
+        return result
+
+    def _same_layout(self, other):
+        """True if equal values land in the same bucket index of both sets."""
+        return self.hash_func is other.hash_func and self.MAX_SIZE == other.MAX_SIZE
+
+    def copy(self):
+        """
+        Return a shallow copy, reusing the cached hash codes.
+
+        Time Complexity:
+            - O(n + m), no hashing.
+        """
+        result = self._empty_like()
+        result.arr = [list(bucket) for bucket in self.arr]
+        result.count = self.count
+        return result
+
+    # ===============================
+    # SET ALGEBRA METHODS
+    # ===============================
+    # Strategy:
+    #   - Same bucket count and hash function: walk both bucket arrays side by
+    #     side. Equal values sit in the same bucket index, so each pair of
+    #     buckets is merged on its own without hashing or probing anything.
+    #   - Otherwise: iterate the smaller operand and probe the larger one,
+    #     reusing cached hash codes whenever the hash functions match.
+    def union(self, other):
+        """
+        Return a new HashSet with the values of both sets (self | other).
+
+        The larger operand is copied bucket by bucket and the smaller one is
+        inserted into the copy; the result uses the larger operand's layout.
+
+        Time Complexity:
+            - O(len(larger) + m) for the copy + O(len(smaller)) inserts.
+        """
+        other = self._as_hashset(other)
+        if self._same_layout(other):
+            result = self._empty_like()
+            for idx, (mine, theirs) in enumerate(zip(self.arr, other.arr)):
+                merged = list(mine)
+                for element in theirs:
+                    if not any(e[1] == element[1] and e[0] == element[0] for e in mine):
+                        merged.append(element)
+                result.arr[idx] = merged
+                result.count += len(merged)
+            if result.max_load_factor is not None and result.count > result.MAX_SIZE * result.max_load_factor:
+                result.rehash(result.MAX_SIZE * 2)
+            return result
+
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = larger.copy()
+        for element in smaller._elements():
+            result._add_code(element[0], result._code_from(smaller, element))
+        return result
+
+    def intersection(self, other):
+        """
+        Return a new HashSet with the values present in both sets (self & other).
+
+        Time Complexity:
+            - O(min(len(self), len(other))) probes, or O(n + m) bucket merging
+              for sets with the same layout.
+        """
+        other = self._as_hashset(other)
+        result = self._empty_like()
+        if self._same_layout(other):
+            for idx, (mine, theirs) in enumerate(zip(self.arr, other.arr)):
+                if mine and theirs:
+                    common = [e for e in mine if any(x[1] == e[1] and x[0] == e[0] for x in theirs)]
+                    result.arr[idx] = common
+                    result.count += len(common)
+            return result
+
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        for element in smaller._elements():
+            if larger._has(element[0], larger._code_from(smaller, element)):
+                result._add_code(element[0], result._code_from(smaller, element))
+        return result
+
+    def difference(self, other):
+        """
+        Return a new HashSet with the values of self that are not in other (self - other).
+
+        If self is the smaller set, its values are probed in other; otherwise
+        self is copied and the (smaller) other set's values are discarded.
+
+        Time Complexity:
+            - O(min(len(self), len(other))) probes, plus an O(n + m) copy when
+              self is larger.
+        """
+        other = self._as_hashset(other)
+        if self._same_layout(other):
+            result = self._empty_like()
+            for idx, (mine, theirs) in enumerate(zip(self.arr, other.arr)):
+                if not theirs:
+                    kept = list(mine)
+                else:
+                    kept = [e for e in mine if not any(x[1] == e[1] and x[0] == e[0] for x in theirs)]
+                result.arr[idx] = kept
+                result.count += len(kept)
+            return result
+
+        if len(self) <= len(other):
+            result = self._empty_like()
+            for element in self._elements():
+                if not other._has(element[0], other._code_from(self, element)):
+                    result._add_code(element[0], element[1])
+            return result
+        result = self.copy()
+        for element in other._elements():
+            result._discard_code(element[0], result._code_from(other, element))
+        return result
+
+    def symmetric_difference(self, other):
+        """
+        Return a new HashSet with the values in exactly one of the sets (self ^ other).
+
+        The larger operand is copied and every value of the smaller one is
+        toggled: removed if present, added otherwise.
+
+        Time Complexity:
+            - O(len(larger) + m) copy + O(len(smaller)) toggles.
+        """
+        other = self._as_hashset(other)
+        if self._same_layout(other):
+            result = self._empty_like()
+            for idx, (mine, theirs) in enumerate(zip(self.arr, other.arr)):
+                merged = [e for e in mine if not any(x[1] == e[1] and x[0] == e[0] for x in theirs)]
+                merged += [e for e in theirs if not any(x[1] == e[1] and x[0] == e[0] for x in mine)]
+                result.arr[idx] = merged
+                result.count += len(merged)
+            return result
+
+        larger, smaller = (self, other) if len(self) >= len(other) else (other, self)
+        result = larger.copy()
+        for element in smaller._elements():
+            code = result._code_from(smaller, element)
+            if not result._discard_code(element[0], code):
+                result._add_code(element[0], code)
+        return result
+
+    # ===============================
+    # IN-PLACE SET ALGEBRA METHODS
+    # ===============================
+    # Every in-place method checks for other being self first: iterating a
+    # set's own buckets while toggling values in them skips or revisits values.
+    def clear(self):
+        """Remove every value, keeping the bucket count. O(m)."""
+        self.arr = [[] for _ in range(self.MAX_SIZE)]
+        self.count = 0
+
+    def update(self, other):
+        """Add every value of other to self (self |= other). O(len(other))."""
+        if other is self:
+            return self
+        other = self._as_hashset(other)
+        for element in other._elements():
+            self._add_code(element[0], self._code_from(other, element))
+        return self
+
+    def intersection_update(self, other):
+        """Keep only the values also in other (self &= other). O(min(len(self), len(other)))."""
+        if other is self:
+            return self
+        result = self.intersection(other)
+        self.arr, self.count, self.MAX_SIZE = result.arr, result.count, result.MAX_SIZE
+        return self
+
+    def difference_update(self, other):
+        """
+        Remove every value of other from self (self -= other).
+
+        Discards other's values when other is smaller; otherwise filters self's
+        own buckets, probing other.
+
+        Time Complexity:
+            - O(min(len(self), len(other))) probes (+ O(m) bucket walk when
+              filtering self).
+        """
+        if other is self:
+            self.clear()
+            return self
+        other = self._as_hashset(other)
+        if len(other) < len(self):
+            for element in other._elements():
+                self._discard_code(element[0], self._code_from(other, element))
+        else:
+            for bucket in self.arr:
+                if bucket:
+                    bucket[:] = [e for e in bucket if not other._has(e[0], other._code_from(self, e))]
+            self.count = sum(len(bucket) for bucket in self.arr)
+        return self
+
+    def symmetric_difference_update(self, other):
+        """Toggle every value of other in self (self ^= other). O(len(other))."""
+        if other is self:
+            self.clear()
+            return self
+        other = self._as_hashset(other)
+        for element in other._elements():
+            code = self._code_from(other, element)
+            if not self._discard_code(element[0], code):
+                self._add_code(element[0], code)
+        return self
+
+    # ===============================
+    # COMPARISON METHODS
+    # ===============================
+    def issubset(self, other):
+        """
+        Return True if every value of self is in other (self <= other).
+
+        Time Complexity:
+            - O(len(self)) probes; O(1) when self is larger than other.
+        """
+        other = self._as_hashset(other)
+        if len(self) > len(other):
+            return False
+        return all(other._has(e[0], other._code_from(self, e)) for e in self._elements())
+
+    def issuperset(self, other):
+        """Return True if every value of other is in self (self >= other)."""
+        return self._as_hashset(other).issubset(self)
+
+    def isdisjoint(self, other):
+        """
+        Return True if the sets share no value.
+
+        Time Complexity:
+            - O(min(len(self), len(other))) probes.
+        """
+        other = self._as_hashset(other)
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        return not any(larger._has(e[0], larger._code_from(smaller, e)) for e in smaller._elements())
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+    __ior__ = update
+    __iand__ = intersection_update
+    __isub__ = difference_update
+    __ixor__ = symmetric_difference_update
+    __le__ = issubset
+    __ge__ = issuperset
+
+    def __lt__(self, other):
+        return len(self) < len(other) and self.issubset(other)
+
+    def __gt__(self, other):
+        return len(self) > len(other) and self.issuperset(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, HashSet):
+            return NotImplemented
+        return len(self) == len(other) and self.issubset(other)
+
+    __hash__ = None  # Mutable, like the built-in set
+
+    # ===============================
+    # PROFILING METHOD
+    # ===============================
+    def stats(self, latency_samples=0, miss_keys=None):
+        """
+        Report bucket occupancy, probe lengths and memory use of the HashSet.
+        See chaining_stats for the metrics and how to read them.
+
+        Time Complexity:
+            - O(n + m), plus O(latency_samples) timed lookups.
+
+        Args:
+            latency_samples (int, optional): If > 0, time this many membership
+                tests for stored values and for absent ones. Defaults to 0.
+            miss_keys (Iterable, optional): Absent values for the miss timings;
+                generated from the stored value type by default.
+
+        Returns:
+            dict: See chaining_stats.
+        """
+        return chaining_stats(self.arr, self.count, self.__contains__, latency_samples, miss_keys)
+
 
 # ===============================
 # DEMO USAGE
 # ===============================
 if __name__ == "__main__":
-    hashset = HashSet(10)
+    # The ASCII-sum hash makes anagrams collide, so collisions are easy to see
+    hashset = HashSet(10, hash_func=ascii_sum_hash)
 
     # Add elements with intended collisions
     hashset.append("abc")  # hash("abc") % 10
@@ -162,4 +736,50 @@ if __name__ == "__main__":
 
     # Print HashSet after deletion
     print("HashSet after deletion:")
-    hashset.print_hashset()  # {abc, xyz, yzx}
\ No newline at end of file
+    hashset.print_hashset()  # {abc, xyz, yzx}
+
+    # The default mixed hash spreads anagrams and accepts any hashable value
+    mixed_set = HashSet(10)
+    for value in ["abc", "cab", "xyz", "yzx", 42, (1, 2)]:
+        mixed_set.append(value)
+    print("\nHashSet with the default hash:")
+    mixed_set.print_hashset()
+    print(f"Hash of 'abc' = {mixed_set.get_hash('abc')}")
+    print(f"Hash of 'cab' = {mixed_set.get_hash('cab')}")
+
+    # Profile bucket occupancy: the ASCII-sum hash clusters, the mixed hash does not
+    words = [f"user_{i}" for i in range(500)]
+    for hash_func in (ascii_sum_hash, mixed_hash):
+        profiled = HashSet(1024, hash_func=hash_func)
+        for word in words:
+            profiled.append(word)
+        report = profiled.stats(latency_samples=200)
+        print(f"\n{hash_func.__name__}: max chain = {report['max_chain']}, "
+              f"empty buckets = {report['empty_bucket_ratio']:.0%}, "
+              f"comparisons per hit = {report['avg_comparisons_hit']:.2f}, "
+              f"hit latency (mean, p99) ns = {report['hit_latency_ns']}")
+
+    # Set algebra
+    manga = HashSet(16)
+    anime = HashSet(16)
+    for title in ["Vagabond", "Berserk", "Monster", "Pluto"]:
+        manga.append(title)
+    for title in ["Monster", "Pluto", "Cowboy Bebop"]:
+        anime.append(title)
+    print("\nUnion:", sorted(manga | anime))
+    print("Intersection:", sorted(manga & anime))
+    print("Manga only:", sorted(manga - anime))
+    print("Symmetric difference:", sorted(manga ^ anime))
+    print("Is {Monster} a subset of anime?", anime.issuperset(["Monster"]))
+    print("Disjoint?", manga.isdisjoint(anime))
+
+    # In-place operators with the set itself as the other operand
+    aliased = {}
+    for name, op, expected in (("|=", HashSet.update, 50), ("&=", HashSet.intersection_update, 50),
+                               ("-=", HashSet.difference_update, 0), ("^=", HashSet.symmetric_difference_update, 0)):
+        numbers = HashSet(8)
+        for i in range(50):
+            numbers.append(i)
+        op(numbers, numbers)
+        aliased[name] = len(numbers) == expected == sum(1 for _ in numbers)
+    print("Self-aliased in-place operators correct?", aliased)
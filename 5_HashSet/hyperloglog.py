@@ -0,0 +1,353 @@
+# ===============================
+# HyperLogLog Cardinality Estimator
+# ===============================
+
+import math
+import struct
+from array import array
+
+from bloom_filter import stable_hash
+from hashset import HashSet
+
+MAGIC = b"HLLS"
+HEADER = struct.Struct("<4sBBQ")  # magic, kind, precision, threshold
+KIND_SKETCH, KIND_EXACT = 0, 1
+MIN_PRECISION, MAX_PRECISION = 4, 18
+
+
+def _alpha(m):
+    """Bias-correction constant of the HyperLogLog estimator."""
+    if m == 16:
+        return 0.673
+    if m == 32:
+        return 0.697
+    if m == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / m)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog: estimates the number of distinct values in a stream using a
+    fixed amount of memory.
+
+    Theory:
+        - Every value is hashed to 64 bits. The first p bits pick one of
+          m = 2^p registers; the rank of the remaining bits (position of the
+          first 1 bit) is a geometric random variable: a rank of r is seen about
+          once every 2^r distinct values.
+        - Each register keeps the largest rank it has seen, so duplicates never
+          change the sketch and order does not matter.
+        - The estimate is a bias-corrected harmonic mean of 2^register over all
+          registers; for small cardinalities (many empty registers) linear
+          counting m * ln(m / empty) is used instead.
+        - Standard error is 1.04 / sqrt(m): 0.81% at p = 14 with 16 KiB of
+          registers, whether the stream has a thousand or a billion values.
+        - Two sketches with the same precision merge by a register-wise max,
+          giving exactly the sketch of the combined stream. stable_hash keeps
+          sketches from different processes compatible.
+
+    Real-world Usage:
+        - Distinct users/IPs/queries on dashboards (Redis PFCOUNT, BigQuery
+          APPROX_COUNT_DISTINCT, Presto, Druid).
+        - Combining per-worker or per-day counts without re-reading the data.
+
+    Complexity Overview:
+        - add: O(1)
+        - count: O(m)
+        - merge: O(m)
+        - Space Complexity: O(m) bytes, independent of the cardinality.
+    """
+
+    def __init__(self, precision=14, hash_func=stable_hash):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            precision (int, optional): p, with m = 2^p registers (4..18).
+                Defaults to 14 (16 KiB, ~0.8% standard error).
+            hash_func (Callable, optional): Maps a value to a 64-bit code.
+                Defaults to stable_hash, which is required for merging or
+                serializing sketches across processes.
+
+        Raises:
+            ValueError: If precision is out of range.
+        """
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f"precision must be between {MIN_PRECISION} and {MAX_PRECISION}")
+        self.precision = precision
+        self.hash_func = hash_func
+        self.registers = bytearray(1 << precision)
+
+    def add_code(self, code):
+        """Add a value by its precomputed 64-bit hash code."""
+        rank_bits = 64 - self.precision
+        idx = code >> rank_bits
+        rank = rank_bits - (code & ((1 << rank_bits) - 1)).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def add(self, value):
+        """
+        Add a value to the sketch.
+
+        Time Complexity:
+            - O(1)
+        """
+        self.add_code(self.hash_func(value))
+
+    def add_many(self, values):
+        """
+        Add every value of an iterable.
+
+        Time Complexity:
+            - O(k) for k values.
+        """
+        hash_func, registers = self.hash_func, self.registers
+        rank_bits = 64 - self.precision
+        rank_mask = (1 << rank_bits) - 1
+        for value in values:  # Inlined add_code (hot path)
+            code = hash_func(value)
+            idx = code >> rank_bits
+            rank = rank_bits - (code & rank_mask).bit_length() + 1
+            if rank > registers[idx]:
+                registers[idx] = rank
+
+    def count(self):
+        """
+        Estimate the number of distinct values added.
+
+        Time Complexity:
+            - O(m): registers are counted per rank with bytearray.count.
+
+        Returns:
+            float: The estimated cardinality.
+        """
+        registers = self.registers
+        m = len(registers)
+        harmonic = sum(registers.count(rank) * 2.0 ** -rank for rank in range(max(registers) + 1))
+        estimate = _alpha(m) * m * m / harmonic
+        empty = registers.count(0)
+        if estimate <= 2.5 * m and empty:
+            return m * math.log(m / empty)  # Linear counting for small cardinalities
+        return estimate
+
+    def __len__(self):
+        return round(self.count())
+
+    def standard_error(self):
+        """Relative standard error of count(): 1.04 / sqrt(m)."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one (register-wise max), e.g. to combine
+        the counts of several workers.
+
+        Raises:
+            ValueError: If the sketches have different precisions.
+        """
+        if self.precision != other.precision:
+            raise ValueError("can only merge HyperLogLog sketches with the same precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    # ===============================
+    # SERIALIZATION
+    # ===============================
+    def to_bytes(self):
+        """Serialize the sketch: a 15-byte header followed by the registers."""
+        return HEADER.pack(MAGIC, KIND_SKETCH, self.precision, 0) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data, hash_func=stable_hash):
+        """
+        Rebuild a sketch written by to_bytes().
+
+        Raises:
+            ValueError: If data is not a serialized HyperLogLog sketch.
+        """
+        magic, kind, precision, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or kind != KIND_SKETCH:
+            raise ValueError("data is not a serialized HyperLogLog sketch")
+        sketch = cls(precision, hash_func)
+        sketch.registers = bytearray(data[HEADER.size:HEADER.size + (1 << precision)])
+        return sketch
+
+
+def _code_hash(code):
+    """Hash function for sets of 64-bit hash codes: they are already mixed."""
+    return code
+
+
+class HybridCounter:
+    """
+    Distinct counter that is exact for small streams and switches to a
+    HyperLogLog sketch once the cardinality passes a threshold.
+
+    Theory:
+        - Below the threshold, the 64-bit hash codes of the values are kept in a
+          HashSet, so the count is exact (up to 64-bit hash collisions, about
+          n^2 / 2^65: practically never). Storing codes instead of values keeps
+          the memory per value fixed and makes the exact phase serializable.
+        - When the set grows past the threshold, its codes are replayed into a
+          sketch (no re-hashing) and the set is dropped, capping memory at
+          2^precision bytes from then on.
+        - Merging two exact counters stays exact while the union fits under the
+          threshold; otherwise both sides are merged as sketches.
+
+    Complexity Overview:
+        - add: O(1) amortized (one O(threshold) switch-over).
+        - count: O(1) exact, O(m) as a sketch.
+        - Space Complexity: O(min(n, threshold)) while exact, O(m) afterwards.
+    """
+
+    def __init__(self, threshold=10000, precision=14, hash_func=stable_hash):
+        """
+        Initialize an exact counter.
+
+        Args:
+            threshold (int, optional): Distinct values kept exactly before
+                switching to the sketch. Defaults to 10000.
+            precision (int, optional): Precision of the sketch. Defaults to 14.
+            hash_func (Callable, optional): Maps a value to a 64-bit code.
+        """
+        self.threshold = threshold
+        self.precision = precision
+        self.hash_func = hash_func
+        self.exact = HashSet(64, hash_func=_code_hash)
+        self.sketch = None
+
+    def is_exact(self):
+        """True while the counter still holds every distinct hash code."""
+        return self.sketch is None
+
+    def _switch_to_sketch(self):
+        self.sketch = HyperLogLog(self.precision, self.hash_func)
+        for code in self.exact:
+            self.sketch.add_code(code)
+        self.exact = None
+
+    def add_code(self, code):
+        """Add a value by its precomputed 64-bit hash code."""
+        if self.sketch is not None:
+            self.sketch.add_code(code)
+        elif self.exact._add_code(code, code) and len(self.exact) > self.threshold:
+            self._switch_to_sketch()
+
+    def add(self, value):
+        """
+        Add a value.
+
+        Time Complexity:
+            - O(1) amortized.
+        """
+        self.add_code(self.hash_func(value))
+
+    def add_many(self, values):
+        """Add every value of an iterable."""
+        hash_func = self.hash_func
+        values = iter(values)
+        for value in values:
+            self.add_code(hash_func(value))
+            if self.sketch is not None:
+                self.sketch.add_many(values)  # The rest of the stream skips the checks
+                return
+
+    def count(self):
+        """Return the exact count while exact, the sketch estimate afterwards."""
+        return len(self.exact) if self.sketch is None else self.sketch.count()
+
+    def __len__(self):
+        return round(self.count())
+
+    def merge(self, other):
+        """
+        Fold another HybridCounter into this one.
+
+        Raises:
+            ValueError: If the counters have different precisions.
+        """
+        if self.precision != other.precision:
+            raise ValueError("can only merge counters with the same precision")
+        if other.sketch is None:
+            for code in other.exact:
+                self.add_code(code)
+            return self
+        if self.sketch is None:
+            self._switch_to_sketch()
+        self.sketch.merge(other.sketch)
+        return self
+
+    # ===============================
+    # SERIALIZATION
+    # ===============================
+    def to_bytes(self):
+        """
+        Serialize the counter: the header, then the sorted hash codes (8 bytes
+        each) while exact, or the sketch registers afterwards.
+        """
+        if self.sketch is not None:
+            return HEADER.pack(MAGIC, KIND_SKETCH, self.precision, self.threshold) + bytes(self.sketch.registers)
+        codes = array("Q", sorted(self.exact))
+        return HEADER.pack(MAGIC, KIND_EXACT, self.precision, self.threshold) + codes.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data, hash_func=stable_hash):
+        """
+        Rebuild a counter written by to_bytes() (or a bare HyperLogLog sketch).
+
+        Raises:
+            ValueError: If data is not a serialized counter or sketch.
+        """
+        magic, kind, precision, threshold = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or kind not in (KIND_SKETCH, KIND_EXACT):
+            raise ValueError("data is not a serialized HybridCounter")
+        counter = cls(threshold, precision, hash_func)
+        if kind == KIND_SKETCH:
+            counter.exact = None
+            counter.sketch = HyperLogLog.from_bytes(data, hash_func)
+        else:
+            codes = array("Q")
+            codes.frombytes(data[HEADER.size:])
+            for code in codes:
+                counter.exact._add_code(code, code)
+        return counter
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import random
+
+    # A click stream with many repeats: 400,000 events from 100,000 users
+    rng = random.Random(7)
+    events = [f"user_{rng.randrange(100000)}" for _ in range(400000)]
+    true_count = len(set(events))
+
+    sketch = HyperLogLog(precision=14)
+    sketch.add_many(events)
+    print(f"True distinct: {true_count}, HLL estimate: {sketch.count():.0f} "
+          f"(error {abs(sketch.count() - true_count) / true_count:.2%}, "
+          f"expected ~{sketch.standard_error():.2%}), memory: {len(sketch.registers) // 1024} KiB")
+
+    # Per-worker sketches merge into the sketch of the whole stream
+    workers = [HyperLogLog(precision=14) for _ in range(4)]
+    for i, event in enumerate(events):
+        workers[i % 4].add(event)
+    shipped = [HyperLogLog.from_bytes(worker.to_bytes()) for worker in workers]
+    combined = shipped[0]
+    for worker in shipped[1:]:
+        combined.merge(worker)
+    print("Merged worker sketches equal the single sketch?", combined.registers == sketch.registers)
+
+    # Hybrid: exact for small streams, bounded memory for large ones
+    small, large = HybridCounter(threshold=10000), HybridCounter(threshold=10000)
+    small.add_many(events[:5000])
+    large.add_many(events)
+    print(f"Small stream: exact={small.is_exact()}, count={small.count()} "
+          f"(true {len(set(events[:5000]))})")
+    print(f"Large stream: exact={large.is_exact()}, count={large.count():.0f} (true {true_count})")
+    restored = HybridCounter.from_bytes(small.to_bytes())
+    print("Restored exact counter:", restored.count())
@@ -0,0 +1,407 @@
+# ===============================
+# Roaring Bitmap Implementation (compressed integer set)
+# ===============================
+
+import sys
+from array import array
+from bisect import bisect_left
+
+CHUNK_BITS = 16                    # Low 16 bits index into a container
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+ARRAY_MAX = 4096                   # Above this, a bitmap (8 KiB) is smaller than an array
+BITMAP_WORDS = (1 << CHUNK_BITS) // 64
+BITMAP_BYTES = BITMAP_WORDS * 8
+
+
+# ===============================
+# CONTAINERS
+# ===============================
+class ArrayContainer:
+    """
+    Sparse chunk: the sorted low 16 bits of its values in an array('H'),
+    2 bytes per value. Lookups use binary search.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values=()):
+        self.values = array("H", values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def contains(self, low):
+        values = self.values
+        idx = bisect_left(values, low)
+        return idx < len(values) and values[idx] == low
+
+    def add(self, low):
+        """Insert low in sorted position. Returns True if it was new."""
+        values = self.values
+        idx = bisect_left(values, low)
+        if idx < len(values) and values[idx] == low:
+            return False
+        values.insert(idx, low)
+        return True
+
+    def remove(self, low):
+        values = self.values
+        idx = bisect_left(values, low)
+        if idx < len(values) and values[idx] == low:
+            del values[idx]
+            return True
+        return False
+
+    def to_int(self):
+        """The chunk as a 65536-bit Python int (bit i set if i is present)."""
+        return BitmapContainer.from_values(self.values).to_int()
+
+    def nbytes(self):
+        return sys.getsizeof(self.values)
+
+
+class BitmapContainer:
+    """
+    Dense chunk: 65536 bits in 1024 64-bit words (8 KiB), plus its cardinality.
+    """
+    __slots__ = ("words", "cardinality")
+
+    def __init__(self, words=None, cardinality=0):
+        self.words = array("Q", bytes(BITMAP_BYTES)) if words is None else words
+        self.cardinality = cardinality
+
+    @classmethod
+    def from_values(cls, lows):
+        bitmap = cls()
+        for low in lows:
+            bitmap.add(low)
+        return bitmap
+
+    @classmethod
+    def from_int(cls, bits):
+        """Build a container from a 65536-bit int (see to_int)."""
+        words = array("Q")
+        words.frombytes(bits.to_bytes(BITMAP_BYTES, sys.byteorder))
+        return cls(words, bits.bit_count())
+
+    def to_int(self):
+        return int.from_bytes(self.words, sys.byteorder)
+
+    def __len__(self):
+        return self.cardinality
+
+    def __iter__(self):
+        """Yield the set bits in increasing order, skipping empty words."""
+        for idx, word in enumerate(self.words):
+            base = idx << 6
+            while word:
+                lowest = word & -word
+                yield base + lowest.bit_length() - 1
+                word ^= lowest
+
+    def contains(self, low):
+        return (self.words[low >> 6] >> (low & 63)) & 1 == 1
+
+    def add(self, low):
+        idx, bit = low >> 6, 1 << (low & 63)
+        word = self.words[idx]
+        if word & bit:
+            return False
+        self.words[idx] = word | bit
+        self.cardinality += 1
+        return True
+
+    def remove(self, low):
+        idx, bit = low >> 6, 1 << (low & 63)
+        word = self.words[idx]
+        if not word & bit:
+            return False
+        self.words[idx] = word ^ bit
+        self.cardinality -= 1
+        return True
+
+    def nbytes(self):
+        return sys.getsizeof(self.words)
+
+
+def _container_from_int(bits):
+    """Pick the smaller representation for a chunk given as a 65536-bit int."""
+    bitmap = BitmapContainer.from_int(bits)
+    if bitmap.cardinality <= ARRAY_MAX:
+        return ArrayContainer(bitmap) if bitmap.cardinality else None
+    return bitmap
+
+
+def _union_containers(a, b):
+    if isinstance(a, ArrayContainer) and isinstance(b, ArrayContainer) and len(a) + len(b) <= ARRAY_MAX:
+        return ArrayContainer(sorted(set(a.values).union(b.values)))
+    # Word-level OR: both chunks become 65536-bit ints, OR-ed in C
+    return _container_from_int(a.to_int() | b.to_int())
+
+
+def _intersect_containers(a, b):
+    if isinstance(a, BitmapContainer) and isinstance(b, BitmapContainer):
+        return _container_from_int(a.to_int() & b.to_int())  # Word-level AND
+    if isinstance(a, BitmapContainer):
+        a, b = b, a
+    if isinstance(b, ArrayContainer):
+        common = sorted(set(a.values).intersection(b.values))
+    else:
+        common = [low for low in a.values if b.contains(low)]
+    return ArrayContainer(common) if common else None
+
+
+def _copy_container(container):
+    if isinstance(container, ArrayContainer):
+        return ArrayContainer(container.values)
+    return BitmapContainer(array("Q", container.words), container.cardinality)
+
+
+class RoaringBitmap:
+    """
+    Compressed set of integers using roaring-style containers.
+
+    Theory:
+        - Each value is split into a chunk key (value >> 16) and its low 16
+          bits. A dict maps every non-empty chunk key to a container holding
+          the low bits of that chunk's values.
+        - Sparse chunks (<= 4096 values) are sorted array('H') containers at
+          2 bytes per value; dense chunks are 8 KiB bitmaps at 1 bit per
+          possible value. The 4096 cut-over is where both take 8 KiB, so a
+          container always uses the smaller form, switching on add/remove.
+        - Bitmap-bitmap union and intersection run word by word: the two
+          1024-word arrays are read as 65536-bit ints and combined with a
+          single | or &, which CPython executes in C.
+        - Chunks present in only one operand are copied (union) or skipped
+          (intersection) without looking at their contents.
+        - Memory for dense IDs is ~1 bit per value versus ~100+ bytes per value
+          (bucket list slot, tuple, boxed int and hash code) in HashSet.
+
+    Real-world Usage:
+        - Posting lists and filters in search engines (Lucene, Elasticsearch).
+        - Bitmap indexes in analytical databases (Druid, ClickHouse, Pinot).
+
+    Complexity Overview:
+        - add / remove / contains: O(log 4096) for array chunks, O(1) for bitmap
+          chunks, plus O(4096) element moves for an array insert in the worst case.
+        - union / intersection: O(chunks x 8 KiB / machine word) for bitmaps.
+        - Space Complexity: at most 2 bytes per value, at most 8 KiB per chunk.
+    """
+
+    def __init__(self, values=None):
+        """
+        Initialize the bitmap.
+
+        Args:
+            values (Iterable[int], optional): Initial integers (any sign and size).
+        """
+        self.containers = {}  # chunk key -> ArrayContainer | BitmapContainer
+        self.count = 0
+        if values is not None:
+            self.update(values)
+
+    def __len__(self):
+        return self.count
+
+    # ===============================
+    # ELEMENT METHODS
+    # ===============================
+    def add(self, val):
+        """
+        Add an integer to the set.
+
+        Time Complexity:
+            - O(log n) search in an array chunk (plus the array shift), O(1) in
+              a bitmap chunk.
+
+        Returns:
+            bool: True if the value was not present before.
+        """
+        key, low = val >> CHUNK_BITS, val & CHUNK_MASK
+        container = self.containers.get(key)
+        if container is None:
+            self.containers[key] = ArrayContainer([low])
+            self.count += 1
+            return True
+        if not container.add(low):
+            return False
+        self.count += 1
+        if isinstance(container, ArrayContainer) and len(container) > ARRAY_MAX:
+            self.containers[key] = BitmapContainer.from_values(container.values)
+        return True
+
+    append = add  # Same spelling as HashSet.append
+
+    def update(self, values):
+        """
+        Add many integers, building each touched chunk in one pass.
+
+        Time Complexity:
+            - O(k log k) for k values (sorting the low bits of each chunk).
+        """
+        chunks = {}
+        for val in values:
+            chunks.setdefault(val >> CHUNK_BITS, []).append(val & CHUNK_MASK)
+        for key, lows in chunks.items():
+            lows = set(lows)
+            if len(lows) > ARRAY_MAX:
+                new = BitmapContainer.from_values(lows)
+            else:
+                new = ArrayContainer(sorted(lows))
+            old = self.containers.get(key)
+            if old is not None:
+                self.count -= len(old)
+                new = _union_containers(old, new)
+            self.containers[key] = new
+            self.count += len(new)
+
+    def __contains__(self, val):
+        """
+        Check whether an integer is in the set.
+
+        Time Complexity:
+            - O(1) dict lookup + O(log 4096) or O(1) within the chunk.
+        """
+        if not isinstance(val, int):
+            return False
+        container = self.containers.get(val >> CHUNK_BITS)
+        return container is not None and container.contains(val & CHUNK_MASK)
+
+    def remove(self, val):
+        """
+        Delete an integer if it exists. A bitmap chunk that drops to 4096
+        values turns back into an array; an empty chunk is dropped.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        key = val >> CHUNK_BITS
+        container = self.containers.get(key)
+        if container is None or not container.remove(val & CHUNK_MASK):
+            return False
+        self.count -= 1
+        if not len(container):
+            del self.containers[key]
+        elif isinstance(container, BitmapContainer) and len(container) <= ARRAY_MAX:
+            self.containers[key] = ArrayContainer(container)
+        return True
+
+    def __iter__(self):
+        """Yield the integers in increasing order."""
+        for key in sorted(self.containers):
+            base = key << CHUNK_BITS
+            for low in self.containers[key]:
+                yield base | low
+
+    # ===============================
+    # SET ALGEBRA METHODS
+    # ===============================
+    def _from_containers(self, containers):
+        result = RoaringBitmap()
+        result.containers = containers
+        result.count = sum(len(container) for container in containers.values())
+        return result
+
+    def union(self, other):
+        """
+        Return a new bitmap with the values of both (self | other).
+
+        Time Complexity:
+            - O(C) containers; each shared chunk costs one word-level OR.
+        """
+        containers = {key: _copy_container(container) for key, container in self.containers.items()}
+        for key, container in other.containers.items():
+            mine = containers.get(key)
+            containers[key] = _copy_container(container) if mine is None else _union_containers(mine, container)
+        return self._from_containers(containers)
+
+    def intersection(self, other):
+        """
+        Return a new bitmap with the values present in both (self & other).
+
+        Time Complexity:
+            - O(min(C1, C2)) chunk lookups; each shared chunk costs one
+              word-level AND or a scan of its array.
+        """
+        small, large = (self, other) if len(self.containers) <= len(other.containers) else (other, self)
+        containers = {}
+        for key, container in small.containers.items():
+            theirs = large.containers.get(key)
+            if theirs is not None:
+                common = _intersect_containers(container, theirs)
+                if common is not None:
+                    containers[key] = common
+        return self._from_containers(containers)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return self.count == other.count and list(self) == list(other)
+
+    __hash__ = None  # Mutable, like the built-in set
+
+    # ===============================
+    # PROFILING METHOD
+    # ===============================
+    def stats(self):
+        """
+        Report container counts and memory use.
+
+        Returns:
+            dict: array_containers, bitmap_containers, total_bytes (containers,
+            their arrays and the chunk dict) and bytes_per_value.
+        """
+        arrays = sum(isinstance(container, ArrayContainer) for container in self.containers.values())
+        total_bytes = sys.getsizeof(self.containers) + sum(
+            sys.getsizeof(key) + sys.getsizeof(container) + container.nbytes()
+            for key, container in self.containers.items()
+        )
+        return {
+            "array_containers": arrays,
+            "bitmap_containers": len(self.containers) - arrays,
+            "total_bytes": total_bytes,
+            "bytes_per_value": total_bytes / self.count if self.count else 0.0,
+        }
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import time
+
+    from hashset import HashSet
+
+    ids = RoaringBitmap([3, 1, 4, 1, 5, 9, 2, 6, 1 << 40])
+    print("Sorted IDs:", list(ids))
+    print("4 present?", 4 in ids, "| 7 present?", 7 in ids)
+    ids.remove(4)
+    print("After removing 4:", list(ids))
+
+    # Dense IDs: memory versus the chaining HashSet
+    n = 1000000
+    dense = RoaringBitmap(range(n))
+    hashset = HashSet(8)
+    for i in range(0, n, 10):  # A tenth of the IDs, to keep the demo quick
+        hashset.append(i)
+    hashset_per_value = hashset.stats()["total_bytes"] / len(hashset)
+    print(f"RoaringBitmap: {dense.stats()['bytes_per_value']:.3f} bytes/ID, "
+          f"HashSet: {hashset_per_value:.1f} bytes/ID")
+
+    # Word-level set algebra on dense and sparse chunks
+    evens = RoaringBitmap(range(0, 2 * n, 2))
+    thirds = RoaringBitmap(range(0, 2 * n, 3))
+    start = time.perf_counter()
+    both = evens & thirds
+    either = evens | thirds
+    print(f"|evens & thirds| = {len(both)}, |evens | thirds| = {len(either)} "
+          f"in {time.perf_counter() - start:.3f}s")
+    print("Containers of the intersection:", both.stats())
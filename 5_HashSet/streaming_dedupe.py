@@ -0,0 +1,292 @@
+# ===============================
+# Out-of-Core Streaming Deduplication
+# ===============================
+
+import heapq
+import itertools
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from hashset import HashSet, mixed_hash
+
+ENTRY_OVERHEAD = 120  # Approximate bytes per stored record beyond the record itself
+RUN_BATCH = 10000     # Records per pickled batch in spill and run files
+
+
+def read_chunks(source, chunk_size=10000):
+    """
+    Yield lists of up to chunk_size records.
+
+    Args:
+        source (str | os.PathLike | Iterable): A path to a text file (one record
+            per line, without the trailing newline) or any iterable of records.
+        chunk_size (int, optional): Records per chunk. Defaults to 10000.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as file:
+            yield from read_chunks((line.rstrip("\n") for line in file), chunk_size)
+        return
+    iterator = iter(source)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_batches(path):
+    """Yield the pickled batches of a spill or run file, in write order."""
+    with open(path, "rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def _read_run(path):
+    """Yield the (seq, record) pairs of a run file."""
+    for batch in _read_batches(path):
+        yield from batch
+
+
+def _dedupe_partition(spill_path, run_path):
+    """
+    Deduplicate one spilled partition into a run file (runs in a worker process).
+
+    Spilled windows were written in input order, so the first copy of a record
+    read here is its first occurrence in the whole input, and the surviving
+    (seq, record) pairs come out sorted by seq.
+
+    Returns:
+        int: Number of unique records in the partition.
+    """
+    seen = HashSet(1024)
+    unique = 0
+    with open(run_path, "wb") as run:
+        survivors = []
+        for batch in _read_batches(spill_path):
+            for seq, record in batch:
+                if seen._add_code(record, mixed_hash(record)):
+                    survivors.append((seq, record))
+            if len(survivors) >= RUN_BATCH:
+                pickle.dump(survivors, run, pickle.HIGHEST_PROTOCOL)
+                unique += len(survivors)
+                survivors = []
+        if survivors:
+            pickle.dump(survivors, run, pickle.HIGHEST_PROTOCOL)
+            unique += len(survivors)
+    os.remove(spill_path)
+    return unique
+
+
+class StreamingDeduplicator:
+    """
+    Deduplicates streams larger than memory with a HashSet per memory window
+    and hash-partitioned spill files.
+
+    Theory:
+        - Stage 1: the input is read in chunks (from a file or a generator),
+          and every record is tagged with its position (seq) in the input.
+        - Stage 2: records are deduplicated in an in-memory HashSet until its
+          estimated size reaches memory_budget. If the whole input fits, the
+          result is produced straight from memory and nothing touches disk.
+        - Stage 3: otherwise, the first occurrences of the current window are
+          spilled to num_partitions files, chosen by hash, and a fresh HashSet
+          starts the next window. Equal records always land in the same
+          partition, so no two partitions share a record.
+        - Stage 4: each partition is deduplicated on its own (in parallel with
+          workers > 1), needing about unique_bytes / num_partitions of memory,
+          and written to a run file sorted by seq.
+        - Output: "first_seen" k-way merges the runs by seq, giving every unique
+          record in the order of its first occurrence; "partition" streams the
+          runs one after another, which skips the merge.
+        - The partition index uses the high bits of the hash code, so it is
+          independent of the bucket index (the low bits) inside a partition.
+
+    Real-world Usage:
+        - Deduplicating log lines, event IDs or crawled URLs that exceed RAM.
+        - The same hash-partition-then-process plan as external hash joins and
+          GROUP BY spilling in databases (Grace hash join).
+
+    Complexity Overview:
+        - Time: O(n) hashing plus two sequential passes over the spilled
+          records, and O(u log P) for the first-seen merge of u unique records.
+        - Space: O(memory_budget) in the parent, O(u / P) per partition worker,
+          and O(spilled records) on disk.
+    """
+
+    def __init__(self, memory_budget=64 * 1024 * 1024, num_partitions=16, workers=1,
+                 order="first_seen", chunk_size=10000, temp_dir=None):
+        """
+        Configure the pipeline.
+
+        Args:
+            memory_budget (int, optional): Approximate bytes of records held in
+                memory before spilling. Defaults to 64 MiB.
+            num_partitions (int, optional): Spill partitions; pick at least
+                unique_bytes / memory_budget so each partition fits. Defaults to 16.
+            workers (int, optional): Processes deduplicating partitions; 1 runs
+                them in this process. Defaults to 1.
+            order (str, optional): "first_seen" or "partition". Defaults to "first_seen".
+            chunk_size (int, optional): Records read per chunk. Defaults to 10000.
+            temp_dir (str, optional): Directory for spill files. Defaults to the
+                system temp directory.
+
+        Raises:
+            ValueError: If order is not "first_seen" or "partition".
+        """
+        if order not in ("first_seen", "partition"):
+            raise ValueError(f"unknown output order '{order}'")
+        self.memory_budget = memory_budget
+        self.num_partitions = num_partitions
+        self.workers = workers
+        self.order = order
+        self.chunk_size = chunk_size
+        self.temp_dir = temp_dir
+        self.records_read = 0
+        self.unique_records = 0
+        self.spills = 0
+
+    def dedupe(self, source):
+        """
+        Yield every distinct record of source once.
+
+        Records must be hashable and, if the input spills, picklable.
+
+        Args:
+            source (str | os.PathLike | Iterable): A text file path or an
+                iterable of records.
+
+        Yields:
+            Any: Unique records, in the configured order.
+        """
+        self.records_read = self.unique_records = self.spills = 0
+        num_partitions = self.num_partitions
+        seen = HashSet(1024)
+        window = [[] for _ in range(num_partitions)]  # (seq, record) per partition
+        used = 0
+        temp = None
+        spill_files = []
+        try:
+            seq = 0
+            for chunk in read_chunks(source, self.chunk_size):
+                for record in chunk:
+                    code = mixed_hash(record)
+                    if seen._add_code(record, code):
+                        window[(code >> 32) % num_partitions].append((seq, record))
+                        used += sys.getsizeof(record) + ENTRY_OVERHEAD
+                    seq += 1
+                if used > self.memory_budget:
+                    if temp is None:
+                        temp = tempfile.TemporaryDirectory(prefix="dedupe-", dir=self.temp_dir)
+                        spill_files = [open(os.path.join(temp.name, f"spill-{p}.bin"), "wb")
+                                       for p in range(num_partitions)]
+                    self._spill(window, spill_files)
+                    seen = HashSet(1024)
+                    window = [[] for _ in range(num_partitions)]
+                    used = 0
+            self.records_read = seq
+
+            if temp is None:
+                # Stage 2 fast path: everything fit in memory
+                self.unique_records = len(seen)
+                yield from self._emit(window)
+                return
+
+            self._spill(window, spill_files)
+            for file in spill_files:
+                file.close()
+            run_paths = self._dedupe_partitions(temp.name)
+            yield from self._emit([_read_run(path) for path in run_paths])
+        finally:
+            for file in spill_files:
+                file.close()
+            if temp is not None:
+                temp.cleanup()
+
+    def _spill(self, window, spill_files):
+        """Append the window's first occurrences to the partition files."""
+        for partition, records in enumerate(window):
+            for start in range(0, len(records), RUN_BATCH):
+                pickle.dump(records[start:start + RUN_BATCH], spill_files[partition], pickle.HIGHEST_PROTOCOL)
+        self.spills += 1
+
+    def _dedupe_partitions(self, directory):
+        """Run stage 4 for every partition and return the run file paths."""
+        jobs = [(os.path.join(directory, f"spill-{p}.bin"), os.path.join(directory, f"run-{p}.bin"))
+                for p in range(self.num_partitions)]
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                counts = list(pool.map(_dedupe_partition, *zip(*jobs)))
+        else:
+            counts = [_dedupe_partition(spill_path, run_path) for spill_path, run_path in jobs]
+        self.unique_records = sum(counts)
+        return [run_path for _, run_path in jobs]
+
+    def _emit(self, runs):
+        """Stream (seq, record) runs in the configured order, dropping seq."""
+        if self.order == "first_seen":
+            pairs = heapq.merge(*runs, key=lambda pair: pair[0])
+        else:
+            pairs = itertools.chain.from_iterable(runs)
+        for _, record in pairs:
+            yield record
+
+
+def dedupe_file(input_path, output_path, **options):
+    """
+    Write the distinct lines of input_path to output_path.
+
+    Args:
+        input_path (str): Text file with one record per line.
+        output_path (str): Destination file.
+        **options: Passed to StreamingDeduplicator.
+
+    Returns:
+        int: Number of unique lines written.
+    """
+    deduplicator = StreamingDeduplicator(**options)
+    with open(output_path, "w", encoding="utf-8") as output:
+        for record in deduplicator.dedupe(input_path):
+            output.write(record)
+            output.write("\n")
+    return deduplicator.unique_records
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import random
+    import time
+
+    # A log with heavy repetition: 500,000 lines, ~100,000 distinct
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "access.log")
+        with open(log_path, "w", encoding="utf-8") as log:
+            for _ in range(500000):
+                log.write(f"GET /item/{rng.randrange(100000)} 200\n")
+
+        expected = list(dict.fromkeys(line.rstrip("\n") for line in open(log_path, encoding="utf-8")))
+
+        in_memory = StreamingDeduplicator()
+        start = time.perf_counter()
+        result = list(in_memory.dedupe(log_path))
+        print(f"In memory: {len(result)} unique of {in_memory.records_read}, spills: {in_memory.spills}, "
+              f"{time.perf_counter() - start:.2f}s, first-seen order correct: {result == expected}")
+
+        # A 2 MiB budget forces spilling; partitions are deduplicated by 4 processes
+        out_of_core = StreamingDeduplicator(memory_budget=2 * 1024 * 1024, num_partitions=8, workers=4)
+        start = time.perf_counter()
+        result = list(out_of_core.dedupe(log_path))
+        print(f"Out of core: {len(result)} unique, spills: {out_of_core.spills}, "
+              f"{time.perf_counter() - start:.2f}s, first-seen order correct: {result == expected}")
+
+        output_path = os.path.join(directory, "unique.log")
+        written = dedupe_file(log_path, output_path, memory_budget=2 * 1024 * 1024, order="partition")
+        print(f"dedupe_file wrote {written} lines in partition order")
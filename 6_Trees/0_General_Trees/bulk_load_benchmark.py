@@ -0,0 +1,90 @@
+# ===============================
+# GeneralTree Bulk Loading Benchmark
+# ===============================
+#
+# Builds a tree of N nodes (default 10^7) three ways:
+#   - add_child calls, looking each parent up in a caller-side id dict
+#   - GeneralTree.from_edges with parents before children
+#   - GeneralTree.from_edges with every block of edges reversed, so children
+#     arrive before their parents and go through the pending table
+# and a smaller CSV round trip through tree_loader.
+#
+# Usage: python bulk_load_benchmark.py [N]
+# 10^7 nodes need roughly 4-5 GiB of RAM for the object form.
+
+import gc
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from general_tree import GeneralTree
+from tree_loader import load_tree
+
+FANOUT = 8
+BLOCK = 10000
+
+
+def edges_in_order(n):
+    """Yield the edges of a complete FANOUT-ary tree, parents first."""
+    yield None, 0, "node0"
+    for i in range(1, n):
+        yield (i - 1) // FANOUT, i, f"node{i}"
+
+
+def edges_out_of_order(n):
+    """Yield the same edges with each block of BLOCK edges reversed."""
+    block = []
+    for edge in edges_in_order(n):
+        block.append(edge)
+        if len(block) == BLOCK:
+            yield from reversed(block)
+            block = []
+    yield from reversed(block)
+
+
+def load_with_add_child(n):
+    tree = GeneralTree("node0", index_paths=False)
+    nodes = {0: tree.root}
+    for parent_id, child_id, data in edges_in_order(n):
+        if parent_id is not None:
+            nodes[child_id] = tree.add_child(nodes[parent_id], data)
+    return tree
+
+
+def peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(name, n, build):
+    """Time build(), which loads n edges, and print its throughput and peak RSS."""
+    gc.collect()
+    start = time.perf_counter()
+    tree = build()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<38} {elapsed:8.2f}s {n / elapsed / 1e6:8.2f} M edges/s  peak RSS {peak_rss_mib():8.0f} MiB")
+    return tree
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    print(f"Loading {n:,} nodes (fanout {FANOUT}, out-of-order blocks of {BLOCK:,})")
+
+    gc.disable()  # Millions of new container objects otherwise trigger repeated full collections
+    run("add_child + caller id dict", n, lambda: load_with_add_child(n))
+    run("from_edges, parents first", n, lambda: GeneralTree.from_edges(edges_in_order(n), index_paths=False))
+    tree = run("from_edges, children first", n,
+               lambda: GeneralTree.from_edges(edges_out_of_order(n), index_paths=False))
+    print("Root children:", [child.data for child in tree.root.children])
+    del tree
+
+    csv_n = min(n, 10**6)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("parent_id,child_id,data\n")
+            for parent_id, child_id, data in edges_out_of_order(csv_n):
+                file.write(f"{'' if parent_id is None else parent_id},{child_id},{data}\n")
+        run(f"load_tree from CSV ({csv_n:,} rows)", csv_n, lambda: load_tree(path, index_paths=False))
+    gc.enable()
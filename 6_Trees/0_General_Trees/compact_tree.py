@@ -0,0 +1,501 @@
+# ===============================
+# Compact (Flat Array) General Tree Encoding
+# ===============================
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from general_tree import GeneralTree
+
+MAGIC = b"CTRE"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sH2xQQ8x")  # magic, version, node count, payload bytes; 32 bytes
+NO_NODE = -1
+
+
+def _to_little_endian(values):
+    """Return a copy of an array('q') in little-endian byte order."""
+    if sys.byteorder == "little":
+        return values
+    values = array("q", values)
+    values.byteswap()
+    return values
+
+
+class CompactTree:
+    """
+    Read-optimized General Tree stored as flat typed arrays in pre-order.
+
+    Theory:
+        - Node i is the i-th node of a pre-order traversal, so the root is 0 and
+          the subtree of i is the contiguous index range [i, subtree_end[i]).
+          Subtree size and "is a under b" are O(1) arithmetic.
+        - Structure lives in four array('q') columns: parent, first_child,
+          next_sibling and subtree_end (NO_NODE = -1 where there is none).
+          Payloads are a parallel list of references in memory, or pickled
+          blobs addressed by an offsets column in a file.
+        - That is 32 bytes of structure per node, versus a TreeNode object with
+          its own __dict__, children list and child_index dict (several hundred
+          bytes) in the object form.
+        - save() writes the columns as raw little-endian int64s after a 32-byte
+          header; open() memory-maps the file and casts the columns to
+          memoryviews, so nothing is parsed or copied up front and the OS pages
+          in only what a query touches. Payloads are unpickled on access.
+        - Traversals walk the arrays directly with explicit stacks, like the
+          GeneralTree generators, and yield (index, depth) pairs.
+
+    File layout (all integers little-endian int64):
+        header | parent | first_child | next_sibling | subtree_end |
+        payload blob (padded to 8 bytes) | payload offsets (n + 1)
+
+    Real-world Usage:
+        - Large read-mostly hierarchies: file system snapshots, taxonomies,
+          parse trees, org charts shipped between processes.
+        - The same layout idea as succinct/pre-order tree encodings in
+          databases (nested sets) and columnar formats.
+
+    Complexity Overview:
+        - from_tree / to_tree / save: O(n)
+        - open: O(1) (memory map only)
+        - parent, subtree_size, is_ancestor, data: O(1)
+        - Traversals: O(n) time, O(h) or O(w) memory.
+        - Space Complexity: 32 bytes per node plus payloads.
+    """
+
+    def __init__(self, parent, first_child, next_sibling, subtree_end, payloads):
+        """
+        Wrap existing columns; use from_tree() or open() to create one.
+
+        Args:
+            parent, first_child, next_sibling, subtree_end (array | memoryview):
+                int64 columns indexed by pre-order number.
+            payloads (Sequence | Callable): Payload of each node, as a sequence
+                or as a function of the node index.
+        """
+        self.parent = parent
+        self.first_child = first_child
+        self.next_sibling = next_sibling
+        self.subtree_end = subtree_end
+        self._payloads = payloads
+        self._mapping = None
+        self.source_path = None  # File behind an open()ed tree
+
+    def __len__(self):
+        return len(self.parent)
+
+    # ===============================
+    # CONVERSION METHODS
+    # ===============================
+    @classmethod
+    def from_tree(cls, tree, node=None, nodes=None):
+        """
+        Encode a GeneralTree (or the subtree under node) in one pre-order pass.
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(n) for the columns, O(h) auxiliary.
+
+        Args:
+            tree (GeneralTree): Tree to encode.
+            node (TreeNode, optional): Subtree root. Defaults to the tree root.
+            nodes (list, optional): If given, the TreeNode of every index is
+                appended to it, to map results back to the object form.
+        """
+        parent, first_child, next_sibling = array("q"), array("q"), array("q")
+        payloads = []
+        path = []  # path[d] = index of the latest node at depth d on the current path
+        for current, depth in tree.preorder(node):
+            idx = len(payloads)
+            if depth < len(path):
+                next_sibling[path[depth]] = idx  # The previous node at this depth is the previous sibling
+                del path[depth:]
+            elif depth:
+                first_child[path[depth - 1]] = idx
+            parent.append(path[depth - 1] if depth else NO_NODE)
+            first_child.append(NO_NODE)
+            next_sibling.append(NO_NODE)
+            payloads.append(current.data)
+            path.append(idx)
+            if nodes is not None:
+                nodes.append(current)
+
+        sizes = array("q", [1]) * len(payloads)
+        for idx in range(len(payloads) - 1, 0, -1):
+            sizes[parent[idx]] += sizes[idx]
+        subtree_end = array("q", (idx + size for idx, size in enumerate(sizes)))
+        return cls(parent, first_child, next_sibling, subtree_end, payloads)
+
+    def to_tree(self, **options):
+        """
+        Rebuild the object form.
+
+        Args:
+            **options: Passed to GeneralTree (index_paths, aggregates).
+
+        Returns:
+            GeneralTree: A tree with the same shape, child order and payloads.
+        """
+        tree = GeneralTree(self.data(0), **options)
+        nodes = [tree.root]
+        parent = self.parent
+        for idx in range(1, len(self)):
+            nodes.append(tree.add_child(nodes[parent[idx]], self.data(idx)))
+        return tree
+
+    # ===============================
+    # NODE ACCESS METHODS
+    # ===============================
+    def data(self, idx):
+        """Return the payload of node idx (unpickled on access for mapped files)."""
+        payloads = self._payloads
+        return payloads(idx) if callable(payloads) else payloads[idx]
+
+    def children(self, idx):
+        """Yield the child indices of node idx, in order."""
+        child = self.first_child[idx]
+        next_sibling = self.next_sibling
+        while child != NO_NODE:
+            yield child
+            child = next_sibling[child]
+
+    def subtree_size(self, idx):
+        """Number of nodes in the subtree of idx. O(1)."""
+        return self.subtree_end[idx] - idx
+
+    def is_ancestor(self, ancestor, idx):
+        """True if idx lies in the subtree of ancestor (itself included). O(1)."""
+        return ancestor <= idx < self.subtree_end[ancestor]
+
+    # ===============================
+    # TRAVERSAL METHODS
+    # ===============================
+    def preorder(self, idx=0):
+        """
+        Yield (index, depth) in pre-order, which is simply index order over
+        [idx, subtree_end[idx]); the stack of open subtree ends gives the depth.
+
+        Time Complexity:
+            - O(s) for a subtree of s nodes.
+        Space Complexity:
+            - O(h)
+        """
+        subtree_end = self.subtree_end
+        open_ends = []
+        for current in range(idx, subtree_end[idx]):
+            while open_ends and current >= open_ends[-1]:
+                open_ends.pop()
+            yield current, len(open_ends)
+            open_ends.append(subtree_end[current])
+
+    def postorder(self, idx=0):
+        """
+        Yield (index, depth) in post-order using first_child/next_sibling links.
+
+        Time Complexity:
+            - O(s)
+        Space Complexity:
+            - O(h)
+        """
+        first_child, next_sibling = self.first_child, self.next_sibling
+        stack = [idx]
+        child = first_child[idx]
+        while stack:
+            if child != NO_NODE:
+                stack.append(child)
+                child = first_child[child]
+            else:
+                current = stack.pop()
+                yield current, len(stack)
+                child = next_sibling[current] if stack else NO_NODE
+
+    def level_order(self, idx=0):
+        """
+        Yield (index, depth) in level order.
+
+        Time Complexity:
+            - O(s)
+        Space Complexity:
+            - O(w)
+        """
+        first_child, next_sibling = self.first_child, self.next_sibling
+        queue = deque([(idx, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            yield current, depth
+            child = first_child[current]
+            while child != NO_NODE:
+                queue.append((child, depth + 1))
+                child = next_sibling[child]
+
+    # ===============================
+    # BINARY FILE FORMAT
+    # ===============================
+    def save(self, path):
+        """
+        Write the tree in the memory-mappable binary format.
+
+        Time Complexity:
+            - O(n + payload bytes)
+        """
+        n = len(self)
+        with open(path, "wb") as file:
+            file.write(bytes(HEADER.size))  # Header is written last, once the blob size is known
+            for column in (self.parent, self.first_child, self.next_sibling, self.subtree_end):
+                file.write(_to_little_endian(array("q", column)).tobytes())
+            offsets = array("q", [0])
+            for idx in range(n):
+                blob = pickle.dumps(self.data(idx), pickle.HIGHEST_PROTOCOL)
+                file.write(blob)
+                offsets.append(offsets[-1] + len(blob))
+            payload_bytes = offsets[-1]
+            file.write(bytes(-payload_bytes % 8))
+            file.write(_to_little_endian(offsets).tobytes())
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, n, payload_bytes))
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-map a file written by save() without loading it.
+
+        The returned tree must be closed (or used as a context manager) to
+        release the mapping.
+
+        Raises:
+            ValueError: If the file is not a compact tree of a supported version.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, payload_bytes = HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            mapping.close()
+            raise ValueError(f"'{path}' is not a compact tree file")
+
+        view = memoryview(mapping)
+        columns = []
+        offset = HEADER.size
+        for _ in range(4):
+            columns.append(cls._column(view, offset, n))
+            offset += 8 * n
+        blob_start = offset
+        offsets = cls._column(view, blob_start + payload_bytes + (-payload_bytes % 8), n + 1)
+
+        def payload(idx):
+            return pickle.loads(view[blob_start + offsets[idx]:blob_start + offsets[idx + 1]])
+
+        tree = cls(*columns, payload)
+        tree._mapping = (mapping, view, columns, offsets)
+        tree.source_path = path
+        return tree
+
+    @staticmethod
+    def _column(view, offset, count):
+        column = view[offset:offset + 8 * count]
+        if sys.byteorder == "little":
+            return column.cast("q")
+        values = array("q", bytes(column))  # Big-endian host: copy and swap
+        values.byteswap()
+        return values
+
+    def close(self):
+        """Release the memory mapping of a tree returned by open()."""
+        if self._mapping is None:
+            return
+        mapping, view, columns, offsets = self._mapping
+        self.parent = self.first_child = self.next_sibling = self.subtree_end = self._payloads = None
+        for column in (*columns, offsets):
+            if isinstance(column, memoryview):
+                column.release()
+        view.release()
+        mapping.close()
+        self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ===============================
+    # PARALLEL MAP-REDUCE
+    # ===============================
+    def map_reduce(self, map_fn, reduce_fn, split_depth=2, workers=None, by_node=False):
+        """
+        Fold reduce_fn over map_fn(data) of every node, evaluating the subtrees
+        below split_depth in parallel processes.
+
+        Theory:
+            - The nodes at depth split_depth root independent subtrees, and in
+              pre-order each subtree is one contiguous index range. Ranges are
+              grouped into about 4 tasks per worker, balanced by node count.
+            - A task ships only the slice of the payload column covering its
+              ranges (no object graph, no structure); for a tree open()ed from
+              a file it ships just the path and the ranges, and each worker
+              memory-maps the file itself.
+            - Workers fold each range in pre-order; the parent then combines the
+              partial results up the top split_depth levels, again in pre-order,
+              so reduce_fn needs to be associative but not commutative.
+            - Speedup is near-linear once map_fn work dominates the per-task
+              shipping cost; map_fn and reduce_fn must be picklable (defined at
+              module level).
+
+        Time Complexity:
+            - O(n / workers) per worker, plus O(top nodes + tasks) in the parent.
+
+        Args:
+            map_fn (Callable): data -> value for one node.
+            reduce_fn (Callable): (value, value) -> value, associative.
+            split_depth (int, optional): Depth of the independent subtrees.
+                Defaults to 2.
+            workers (int, optional): Processes; 1 runs in this process.
+                Defaults to os.cpu_count().
+            by_node (bool, optional): Also return the value of every node down
+                to split_depth. Defaults to False.
+
+        Returns:
+            Any | tuple: The value for the whole tree, or (value, {index: value})
+            for the nodes down to split_depth when by_node is True.
+        """
+        workers = workers or os.cpu_count() or 1
+        top, level = [], [0]
+        for _ in range(split_depth):
+            top.extend(level)
+            level = [child for idx in level for child in self.children(idx)]
+
+        subtree_values = dict(zip(level, self._map_ranges(map_fn, reduce_fn, level, workers)))
+
+        # Combine up the top levels in reverse pre-order (children before parents)
+        top.sort()
+        for idx in reversed(top):
+            value = map_fn(self.data(idx))
+            for child in self.children(idx):
+                value = reduce_fn(value, subtree_values[child])
+            subtree_values[idx] = value
+        if by_node:
+            return subtree_values[0], subtree_values
+        return subtree_values[0]
+
+    def _map_ranges(self, map_fn, reduce_fn, roots, workers):
+        """Fold every subtree range of roots, in tasks spread over the workers."""
+        ranges = [(root, self.subtree_end[root]) for root in roots]
+        if workers <= 1 or len(ranges) <= 1:
+            return _fold_ranges(map_fn, reduce_fn, (0, self.data), ranges)
+
+        target = max(1, sum(end - start for start, end in ranges) // (workers * 4))
+        tasks, current, size = [], [], 0
+        for start, end in ranges:
+            current.append((start, end))
+            size += end - start
+            if size >= target:
+                tasks.append(current)
+                current, size = [], 0
+        if current:
+            tasks.append(current)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for task in tasks:
+                if self.source_path is not None:
+                    source = self.source_path
+                else:
+                    base, stop = task[0][0], task[-1][1]
+                    source = (base, [self.data(idx) for idx in range(base, stop)])
+                futures.append(pool.submit(_fold_ranges, map_fn, reduce_fn, source, task))
+            return [value for future in futures for value in future.result()]
+
+
+def _fold_ranges(map_fn, reduce_fn, source, ranges):
+    """
+    Worker: fold map_fn/reduce_fn over each pre-order index range.
+
+    source is a compact tree file path, or (base, payloads) where payloads[0]
+    is the payload of index base (or a payload function of the index).
+    """
+    if isinstance(source, str):
+        with CompactTree.open(source) as tree:
+            return _fold_ranges(map_fn, reduce_fn, (0, tree.data), ranges)
+    base, payloads = source
+    data = payloads if callable(payloads) else None
+    results = []
+    for start, end in ranges:
+        value = map_fn(data(start) if data else payloads[start - base])
+        for idx in range(start + 1, end):
+            value = reduce_fn(value, map_fn(data(idx) if data else payloads[idx - base]))
+        results.append(value)
+    return results
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+def _file_checksum(name):
+    """Stand-in for per-node CPU work, e.g. hashing a file's contents."""
+    import zlib
+
+    return zlib.crc32(name.encode() * 500)
+
+
+if __name__ == "__main__":
+    import itertools
+    import operator
+    import tempfile
+    import time
+    import tracemalloc
+
+    # A synthetic file system: 20 top-level directories, 50 subdirectories each, 200 files each
+    tracemalloc.start()
+    tree = GeneralTree("root", index_paths=False)
+    for d in range(20):
+        directory = tree.add_child(tree.root, f"dir{d}")
+        for s in range(50):
+            subdirectory = tree.add_child(directory, f"sub{s}")
+            for f in range(200):
+                tree.add_child(subdirectory, f"file{f}.txt")
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    compact = CompactTree.from_tree(tree)
+    column_bytes = sum(sys.getsizeof(column) for column in
+                       (compact.parent, compact.first_child, compact.next_sibling, compact.subtree_end))
+    print(f"{len(compact)} nodes: object form ~{object_bytes / len(compact):.0f} bytes/node, "
+          f"compact structure {column_bytes / len(compact):.0f} bytes/node")
+
+    dir3 = next(idx for idx in compact.children(0) if compact.data(idx) == "dir3")
+    print("Nodes under dir3:", compact.subtree_size(dir3),
+          "| first entries:", [compact.data(idx) for idx, _ in itertools.islice(compact.preorder(dir3), 3)])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fs.tree")
+        start = time.perf_counter()
+        compact.save(path)
+        print(f"Saved {os.path.getsize(path) / 2**20:.1f} MiB in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        with CompactTree.open(path) as mapped:
+            opened = time.perf_counter() - start
+            last = len(mapped) - 1
+            print(f"Opened in {opened * 1e6:.0f} us; last node: {mapped.data(last)} "
+                  f"under {mapped.data(mapped.parent[last])}, "
+                  f"dir3 is an ancestor? {mapped.is_ancestor(dir3, last)}")
+            deepest = max(depth for _, depth in mapped.postorder())
+            print("Height from the mapped arrays:", deepest)
+
+            round_trip = mapped.to_tree()
+            print("Round trip find:", round_trip.find("root/dir19/sub49/file199.txt").data)
+
+            # Parallel map-reduce: workers map the file themselves, nothing is pickled per node
+            for workers in (1, max(2, os.cpu_count() or 1)):
+                start = time.perf_counter()
+                total = mapped.map_reduce(_file_checksum, operator.xor, split_depth=2, workers=workers)
+                print(f"Checksum {total:#010x} with {workers} worker(s) in {time.perf_counter() - start:.2f}s")
+
+    # The same API on the object form ships payload slices of a CompactTree
+    total, per_directory = tree.map_reduce(_file_checksum, operator.xor, split_depth=1, by_node=True)
+    print("Checksum of dir0:", f"{per_directory[tree.root.children[0]]:#010x}")
@@ -2,6 +2,10 @@
 # General Tree Implementation
 # ===============================
 
+import operator
+from collections import deque
+
+
 class TreeNode:
     """
     TreeNode represents a single node in a General Tree.
@@ -13,6 +17,10 @@ class TreeNode:
         - Each node stores:
             1. data (value of the node)
             2. children (list of child nodes)
+            3. parent (link to the parent node, None for the root)
+            4. child_index (child name -> child node, for O(1) name lookups)
+            5. path (its key in the tree's path index, shared with the index)
+            6. aggregates (subtree aggregate values, when the tree defines any)
 
     Real-world Usage:
         - Organizational charts, file systems, or category hierarchies.
@@ -22,10 +30,54 @@ class TreeNode:
     Attributes:
         data (Any): The value stored in the node.
         children (list[TreeNode]): List of child nodes.
+        parent (TreeNode | None): The parent node, None for the root.
+        child_index (dict[str, TreeNode]): str(child.data) -> child. With
+            duplicate names among siblings, the first such child is indexed.
+        path (str | None): The node's path in the tree's path index, or None
+            if the node is not reachable by path.
+        aggregates (dict[str, Any] | None): Aggregate name -> value over the
+            node's whole subtree, or None if the tree has no aggregates.
     """
     def __init__(self, data):
         self.data = data
         self.children = []
+        self.parent = None
+        self.child_index = {}
+        self.path = None
+        self.aggregates = None
+
+    @property
+    def name(self):
+        """Path component of the node: str(data)."""
+        return str(self.data)
+
+
+class Aggregate:
+    """
+    A user-defined subtree aggregate, e.g. headcount or total disk usage.
+
+    The value of a subtree is combine_fn folded over map_fn(data) of all its
+    nodes. combine_fn must be associative and commutative (sum, max, min,
+    set union, ...), because children are added and removed in any order.
+
+    Attributes:
+        map_fn (Callable): data -> value of a single node.
+        combine_fn (Callable): (value, value) -> value.
+        inverse_fn (Callable | None): (total, part) -> total without part, if
+            combine_fn is invertible (e.g. operator.sub for sums). It makes
+            removal O(d) instead of O(d * k); None for max/min.
+    """
+    def __init__(self, map_fn, combine_fn, inverse_fn=None):
+        self.map_fn = map_fn
+        self.combine_fn = combine_fn
+        self.inverse_fn = inverse_fn
+
+
+def _count_one(data):
+    return 1
+
+
+SUBTREE_SIZE = Aggregate(_count_one, operator.add, operator.sub)
 
 
 class GeneralTree:
@@ -33,18 +85,61 @@ class GeneralTree:
     General Tree implementation with methods to add children and print hierarchy.
 
     Complexity Overview:
-        - Adding a child: O(1) per insertion
-        - Printing the tree: O(n), where n is total number of nodes
-        - Space Complexity: O(n) (for storing nodes and children lists)
+        - Adding a child: O(1) per insertion (plus building its path string)
+        - Path lookup (find): O(1); ancestors: O(d), d = depth of the node
+        - Removing or moving a subtree: O(s + k), for s subtree nodes and k siblings
+        - Traversals and printing: O(n), where n is total number of nodes
+        - Space Complexity: O(n) (for storing nodes, children lists and the path index)
+
+    Paths join node names (str(data)) from the root with "/", e.g.
+    "Company/IT/Aarav". path_index maps every path to its node and is updated
+    by add_child, remove and move. Each indexed node also keeps its path
+    string (the same object as the index key), so no lookup or insert walks up
+    the tree. If siblings share a name, the path leads to the first of them;
+    the others are reachable only through node references.
+
+    The path strings of a tree total O(n * d) characters, so for very deep
+    trees the index can be switched off (index_paths=False); find() then walks
+    the per-node child_index dicts in O(d) instead.
+
+    Traversals are generators with an explicit stack or queue instead of
+    recursion, so they work on trees of any depth (beyond Python's recursion
+    limit) and can be stopped early. Each yields (node, depth) pairs, with the
+    start node at depth 0. The tree must not change while a traversal is running.
+
+    Ancestor queries (is_ancestor, lowest_common_ancestor, kth_ancestor,
+    depth) use an index built from one Euler tour. Every mutation bumps
+    version, and the index is rebuilt lazily on the next query after one.
+
+    Subtree aggregates (see Aggregate) are stored in every node and kept
+    current through the parent links: adding a child combines its value into
+    each ancestor (O(d)); removing one applies inverse_fn on each ancestor
+    (O(d)), or recombines each ancestor's children without one (O(d * k)).
+    Reading an aggregate is O(1).
     """
-    def __init__(self, data):
+    PATH_SEPARATOR = "/"
+
+    def __init__(self, data, index_paths=True, aggregates=None):
         """
         Initialize a General Tree with a root node.
 
         Args:
             data (Any): The value of the root node.
+            index_paths (bool, optional): Maintain the global path index for
+                O(1) find(). Defaults to True.
+            aggregates (dict[str, Aggregate], optional): Subtree aggregates to
+                maintain, by name, e.g. {"size": SUBTREE_SIZE}. Defaults to none.
         """
         self.root = TreeNode(data)
+        self.aggregates = dict(aggregates or {})
+        if self.aggregates:
+            self.root.aggregates = self._own_aggregates(self.root)
+        self.version = 0  # Incremented on every structural change
+        self._ancestor_index = None
+        self.path_index = None  # path -> node
+        if index_paths:
+            self.root.path = self.root.name
+            self.path_index = {self.root.path: self.root}
 
     # ===============================
     # ADD CHILD METHOD
@@ -54,9 +149,10 @@ class GeneralTree:
         Add a new child node to a given parent node.
 
         Time Complexity:
-            - O(1): Appending a new child to the parent's children list.
+            - O(1): Appending to the parent's children list, child_index and the
+              path index (plus building the child's path string).
         Space Complexity:
-            - O(1): Only the new child node is created.
+            - O(1): Only the new child node and its index entries are created.
 
         Args:
             parent_node (TreeNode): Node to which the child will be added.
@@ -66,9 +162,590 @@ class GeneralTree:
             TreeNode: The newly created child node.
         """
         child_node = TreeNode(child_data)
-        parent_node.children.append(child_node)
+        self._attach(parent_node, child_node)
         return child_node
 
+    def _attach(self, parent_node, child_node):
+        """Link child_node (and its subtree) under parent_node and index it."""
+        self.version += 1
+        child_node.parent = parent_node
+        parent_node.children.append(child_node)
+        if self.aggregates:
+            if child_node.aggregates is None:
+                child_node.aggregates = self._own_aggregates(child_node)
+            self._propagate_added(parent_node, child_node.aggregates)
+        name = child_node.name
+        if name not in parent_node.child_index:
+            parent_node.child_index[name] = child_node
+            if parent_node.path is not None:
+                self._index_subtree(child_node, parent_node.path + self.PATH_SEPARATOR + name)
+
+    def _detach(self, node):
+        """Unlink node (and its subtree) from its parent and the path index."""
+        self.version += 1
+        parent = node.parent
+        name = node.name
+        if parent.child_index.get(name) is node:
+            if node.path is not None:
+                self._unindex_subtree(node)
+            del parent.child_index[name]
+        parent.children.remove(node)
+        node.parent = None
+        if self.aggregates:
+            self._propagate_removed(parent, node.aggregates)
+        if name not in parent.child_index:
+            # A same-named sibling becomes the one the path leads to
+            for sibling in parent.children:
+                if sibling.name == name:
+                    parent.child_index[name] = sibling
+                    if parent.path is not None:
+                        self._index_subtree(sibling, parent.path + self.PATH_SEPARATOR + name)
+                    break
+
+    def _index_subtree(self, node, path):
+        stack = [(node, path)]
+        while stack:
+            current, current_path = stack.pop()
+            current.path = current_path
+            self.path_index[current_path] = current
+            for name, child in current.child_index.items():
+                stack.append((child, current_path + self.PATH_SEPARATOR + name))
+
+    def _unindex_subtree(self, node):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            del self.path_index[current.path]
+            current.path = None
+            stack.extend(current.child_index.values())
+
+    # ===============================
+    # SUBTREE AGGREGATE METHODS
+    # ===============================
+    def _own_aggregates(self, node):
+        return {name: spec.map_fn(node.data) for name, spec in self.aggregates.items()}
+
+    def _recompute_aggregates(self, node):
+        """Recombine a node's aggregates from its own data and its children's. O(k)."""
+        values = self._own_aggregates(node)
+        for name, spec in self.aggregates.items():
+            combine = spec.combine_fn
+            value = values[name]
+            for child in node.children:
+                value = combine(value, child.aggregates[name])
+            values[name] = value
+        node.aggregates = values
+
+    def _propagate_added(self, node, added):
+        """Combine a new subtree's values into node and all its ancestors. O(d)."""
+        while node is not None:
+            values = node.aggregates
+            for name, spec in self.aggregates.items():
+                values[name] = spec.combine_fn(values[name], added[name])
+            node = node.parent
+
+    def _propagate_removed(self, node, removed):
+        """Take a detached subtree's values out of node and all its ancestors."""
+        if all(spec.inverse_fn is not None for spec in self.aggregates.values()):
+            while node is not None:
+                values = node.aggregates
+                for name, spec in self.aggregates.items():
+                    values[name] = spec.inverse_fn(values[name], removed[name])
+                node = node.parent
+        else:
+            while node is not None:
+                self._recompute_aggregates(node)
+                node = node.parent
+
+    def aggregate(self, node, name):
+        """
+        Return the value of an aggregate over the subtree rooted at node.
+
+        Time Complexity:
+            - O(1): the value is maintained on every change.
+
+        Raises:
+            KeyError: If the tree has no aggregate of that name.
+        """
+        if name not in self.aggregates:
+            raise KeyError(f"aggregate '{name}' not found")
+        return node.aggregates[name]
+
+    def refresh_aggregates(self, node):
+        """
+        Recompute the aggregates after node.data was changed in place.
+        The change must keep str(data), which is the node's path component.
+
+        Time Complexity:
+            - O(d * k): node and each ancestor are recombined from their children.
+        """
+        while node is not None:
+            self._recompute_aggregates(node)
+            node = node.parent
+
+    # ===============================
+    # BULK LOADING METHODS
+    # ===============================
+    @classmethod
+    def from_edges(cls, edges, index_paths=True, aggregates=None):
+        """
+        Build a tree from a stream of (parent_id, child_id, data) edges in one pass.
+
+        Theory:
+            - nodes maps every id seen so far to its TreeNode, so a child whose
+              parent already exists is linked in O(1) without holding node
+              objects in the caller.
+            - A child that arrives before its parent is still created (its own
+              children can attach to it at once) and parked in a pending table
+              under the missing parent id. When that id arrives, the whole
+              parked subtree is linked with one append.
+            - Linking sets only parent, children and child_index; the path
+              index and aggregates are built afterwards in one O(n) pass
+              instead of O(d) propagation per edge.
+            - Auxiliary memory is the id map plus the parked edges: when
+              parents come before their children, the pending table stays empty.
+
+        Time Complexity:
+            - O(n) for n edges.
+        Space Complexity:
+            - O(n) for the id map, O(out-of-order edges) for the pending table.
+
+        Args:
+            edges (Iterable[tuple]): (parent_id, child_id, data) triples, in any
+                order. Exactly one edge has parent_id None (or ""): the root.
+            index_paths (bool, optional): See __init__. Defaults to True.
+            aggregates (dict[str, Aggregate], optional): See __init__.
+
+        Returns:
+            GeneralTree: The loaded tree. Children keep edge order, except that
+            parked children follow the ones linked while their parent existed.
+
+        Raises:
+            ValueError: On a duplicate child id, a missing or repeated root, a
+                parent id that never appears, or a cycle.
+        """
+        nodes = {}    # id -> TreeNode
+        pending = {}  # missing parent id -> [TreeNode] parked until it arrives
+        root = None
+        parked = 0
+        link = cls._link
+        for parent_id, child_id, data in edges:
+            if child_id in nodes:
+                raise ValueError(f"duplicate node id '{child_id}'")
+            if parent_id == child_id:
+                raise ValueError(f"edges contain a cycle: '{child_id}' is its own parent")
+            node = TreeNode(data)
+            nodes[child_id] = node
+            if parent_id is None or parent_id == "":
+                if root is not None:
+                    raise ValueError(f"more than one root: '{child_id}'")
+                root = node
+            else:
+                parent = nodes.get(parent_id)
+                if parent is None:
+                    pending.setdefault(parent_id, []).append(node)
+                    parked += 1
+                else:
+                    link(parent, node)
+            if pending and child_id in pending:
+                for orphan in pending.pop(child_id):
+                    link(node, orphan)
+
+        if root is None:
+            raise ValueError("no root edge (parent_id None)")
+        if pending:
+            raise ValueError(f"{len(pending)} parent ids never appear, e.g. '{next(iter(pending))}'")
+
+        tree = cls(root.data, index_paths, aggregates)
+        tree.root = root
+        # Self-loops were rejected above; any other cycle needs at least one
+        # child that arrived before its parent
+        if parked and sum(1 for _ in tree.preorder()) != len(nodes):
+            raise ValueError("edges contain a cycle detached from the root")
+        tree._rebuild_indexes()
+        return tree
+
+    @staticmethod
+    def _link(parent_node, child_node):
+        """Attach child_node without index maintenance (bulk loading only)."""
+        child_node.parent = parent_node
+        parent_node.children.append(child_node)
+        parent_node.child_index.setdefault(child_node.name, child_node)
+
+    def _rebuild_indexes(self):
+        """Recompute the path index and all aggregates from scratch. O(n)."""
+        self.version += 1
+        if self.path_index is not None:
+            self.path_index = {}
+            self._index_subtree(self.root, self.root.name)
+        if self.aggregates:
+            for node, _ in self.postorder():
+                self._recompute_aggregates(node)
+
+    # ===============================
+    # REMOVE AND MOVE METHODS
+    # ===============================
+    def remove(self, node):
+        """
+        Remove a node and its whole subtree from the tree.
+
+        Time Complexity:
+            - O(s + k): unindexing the s subtree nodes and removing the node
+              from its k siblings.
+
+        Args:
+            node (TreeNode): The node to remove (not the root).
+
+        Returns:
+            TreeNode: The detached node, which still holds its subtree.
+
+        Raises:
+            ValueError: If node is the root or is not attached to a parent.
+        """
+        if node.parent is None:
+            raise ValueError("cannot remove the root or a detached node")
+        self._detach(node)
+        return node
+
+    def move(self, node, new_parent):
+        """
+        Move a node and its subtree under new_parent (appended as its last child).
+
+        Time Complexity:
+            - O(s + k + d): re-indexing the s subtree nodes under their new
+              paths, plus the O(d) ancestor check on new_parent.
+
+        Args:
+            node (TreeNode): The node to move (not the root).
+            new_parent (TreeNode): The new parent, in this tree.
+
+        Raises:
+            ValueError: If node is the root, or new_parent is node or one of its
+                descendants (which would create a cycle).
+        """
+        if node.parent is None:
+            raise ValueError("cannot move the root or a detached node")
+        if new_parent is node or any(ancestor is node for ancestor in self.ancestors(new_parent)):
+            raise ValueError("cannot move a node under itself or its own subtree")
+        self._detach(node)
+        self._attach(new_parent, node)
+
+    # ===============================
+    # PATH METHODS
+    # ===============================
+    def find(self, path):
+        """
+        Return the node at a path such as "Company/IT/Aarav", or None.
+
+        Time Complexity:
+            - O(1) average with the path index (plus hashing the path);
+              O(d) child_index lookups without it.
+        """
+        if self.path_index is not None:
+            return self.path_index.get(path)
+        root_name, *names = path.split(self.PATH_SEPARATOR)
+        if root_name != self.root.name:
+            return None
+        node = self.root
+        for name in names:
+            node = node.child_index.get(name)
+            if node is None:
+                return None
+        return node
+
+    def path_of(self, node):
+        """
+        Return the path of a node.
+
+        Time Complexity:
+            - O(1) for indexed nodes; O(d) walk up the parent pointers for
+              same-named siblings that the path index does not cover.
+        """
+        if node.path is not None:
+            return node.path
+        names = [node.name]
+        while node.parent is not None:
+            node = node.parent
+            names.append(node.name)
+        return self.PATH_SEPARATOR.join(reversed(names))
+
+    def ancestors(self, node):
+        """
+        Yield the parent, grandparent, ... up to the root of a node.
+
+        Time Complexity:
+            - O(d)
+        """
+        node = node.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    # ===============================
+    # ANCESTOR QUERY METHODS
+    # ===============================
+    def build_ancestor_index(self):
+        """
+        Precompute Euler-tour intervals and a binary-lifting table.
+
+        Theory:
+            - Nodes are numbered in pre-order (the entry time of an Euler tour);
+              a node's subtree is the contiguous range [entry, exit], where exit
+              is the entry time of its last descendant. Hence u is an ancestor
+              of v iff entry[u] <= entry[v] <= exit[u]: an O(1) test.
+            - Binary lifting: up[j][i] is the 2^j-th ancestor of node i (the
+              root is its own parent). Any k-th ancestor is at most log2(h)
+              jumps away, and the LCA of u and v is found by lifting u as long
+              as the jump target is not an ancestor of v.
+
+        Time Complexity:
+            - O(n log h)
+        Space Complexity:
+            - O(n log h) for the lifting table.
+
+        Called automatically by the query methods when the tree has changed.
+        """
+        nodes, entry, depths, parents = [], {}, [], []
+        for node, depth in self.preorder():
+            idx = len(nodes)
+            entry[node] = idx
+            nodes.append(node)
+            depths.append(depth)
+            parents.append(idx if node.parent is None else entry[node.parent])
+
+        sizes = [1] * len(nodes)
+        for idx in range(len(nodes) - 1, 0, -1):
+            sizes[parents[idx]] += sizes[idx]
+        exits = [idx + size - 1 for idx, size in enumerate(sizes)]
+
+        up = [parents]
+        for _ in range(max(depths).bit_length() - 1):
+            previous = up[-1]
+            up.append([previous[ancestor] for ancestor in previous])
+
+        self._ancestor_index = (self.version, nodes, entry, exits, depths, up)
+
+    def _index(self):
+        if self._ancestor_index is None or self._ancestor_index[0] != self.version:
+            self.build_ancestor_index()
+        return self._ancestor_index
+
+    def _entry(self, entry, node):
+        idx = entry.get(node)
+        if idx is None:
+            raise ValueError(f"node '{node.data}' is not in this tree")
+        return idx
+
+    def depth(self, node):
+        """Return the depth of a node (root = 0). O(1) with a current index."""
+        _, _, entry, _, depths, _ = self._index()
+        return depths[self._entry(entry, node)]
+
+    def is_ancestor(self, ancestor, node):
+        """
+        Return True if ancestor lies on the path from the root to node (a node
+        counts as its own ancestor), i.e. "is node under ancestor?".
+
+        Time Complexity:
+            - O(1) with a current index.
+
+        Raises:
+            ValueError: If either node is not in this tree.
+        """
+        _, _, entry, exits, _, _ = self._index()
+        start = self._entry(entry, ancestor)
+        return start <= self._entry(entry, node) <= exits[start]
+
+    def lowest_common_ancestor(self, first, second):
+        """
+        Return the deepest node that is an ancestor of both nodes.
+
+        Time Complexity:
+            - O(log h) with a current index.
+
+        Raises:
+            ValueError: If either node is not in this tree.
+        """
+        _, nodes, entry, exits, _, up = self._index()
+        u, v = self._entry(entry, first), self._entry(entry, second)
+        if u <= v <= exits[u]:
+            return first
+        if v <= u <= exits[v]:
+            return second
+        for jumps in reversed(up):
+            candidate = jumps[u]
+            if not candidate <= v <= exits[candidate]:
+                u = candidate
+        return nodes[up[0][u]]
+
+    def kth_ancestor(self, node, k):
+        """
+        Return the ancestor k levels above node (k = 0 is the node itself),
+        or None if node is less than k levels deep.
+
+        Time Complexity:
+            - O(log k) with a current index.
+
+        Raises:
+            ValueError: If node is not in this tree or k is negative.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        _, nodes, entry, _, depths, up = self._index()
+        idx = self._entry(entry, node)
+        if k > depths[idx]:
+            return None
+        level = 0
+        while k:
+            if k & 1:
+                idx = up[level][idx]
+            k >>= 1
+            level += 1
+        return nodes[idx]
+
+    # ===============================
+    # PARALLEL MAP-REDUCE
+    # ===============================
+    def map_reduce(self, map_fn, reduce_fn, split_depth=2, workers=None, by_node=False):
+        """
+        Fold reduce_fn over map_fn(data) of every node, in parallel processes.
+
+        The tree is encoded once as a CompactTree and the subtrees below
+        split_depth are shipped to a ProcessPoolExecutor as payload slices of
+        that encoding (see CompactTree.map_reduce); the partial results are
+        combined up the top levels in this process.
+
+        Time Complexity:
+            - O(n) for the encoding, plus O(n / workers) map/reduce work per worker.
+
+        Args:
+            map_fn (Callable): data -> value, picklable.
+            reduce_fn (Callable): (value, value) -> value, associative and picklable.
+            split_depth (int, optional): Depth of the independent subtrees. Defaults to 2.
+            workers (int, optional): Processes. Defaults to os.cpu_count().
+            by_node (bool, optional): Also return {TreeNode: value} for every
+                node down to split_depth. Defaults to False.
+
+        Returns:
+            Any | tuple: The value for the whole tree, or (value, {node: value}).
+        """
+        from compact_tree import CompactTree  # compact_tree imports this module
+
+        nodes = [] if by_node else None
+        compact = CompactTree.from_tree(self, nodes=nodes)
+        result = compact.map_reduce(map_fn, reduce_fn, split_depth, workers, by_node)
+        if by_node:
+            total, values = result
+            return total, {nodes[idx]: value for idx, value in values.items()}
+        return result
+
+    # ===============================
+    # TRAVERSAL METHODS
+    # ===============================
+    def preorder(self, node=None, max_depth=None):
+        """
+        Yield (node, depth) in pre-order: every node before its children.
+
+        The stack holds one child iterator per level, not the pending siblings,
+        so memory stays O(h) however wide the tree is.
+
+        Time Complexity:
+            - O(n) for a full traversal.
+        Space Complexity:
+            - O(h), where h is the height of the tree (or max_depth).
+
+        Args:
+            node (TreeNode, optional): Node to start from. Defaults to root.
+            max_depth (int, optional): Deepest depth to visit. None visits all.
+
+        Yields:
+            tuple: (TreeNode, depth)
+        """
+        if node is None:
+            node = self.root
+        yield node, 0
+        if max_depth is not None and max_depth <= 0:
+            return
+        stack = [iter(node.children)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            depth = len(stack)
+            yield child, depth
+            if max_depth is None or depth < max_depth:
+                stack.append(iter(child.children))
+
+    def depth_limited(self, max_depth, node=None):
+        """
+        Yield (node, depth) in pre-order, skipping everything below max_depth.
+
+        Time Complexity:
+            - O(number of nodes within max_depth levels).
+        Space Complexity:
+            - O(max_depth)
+
+        Args:
+            max_depth (int): Deepest depth to visit (0 yields only the start node).
+            node (TreeNode, optional): Node to start from. Defaults to root.
+
+        Yields:
+            tuple: (TreeNode, depth)
+        """
+        return self.preorder(node, max_depth)
+
+    def postorder(self, node=None):
+        """
+        Yield (node, depth) in post-order: every node after all its children.
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(h): one (node, child iterator) pair per level.
+
+        Args:
+            node (TreeNode, optional): Node to start from. Defaults to root.
+
+        Yields:
+            tuple: (TreeNode, depth)
+        """
+        if node is None:
+            node = self.root
+        stack = [(node, iter(node.children))]
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                yield parent, len(stack)
+            else:
+                stack.append((child, iter(child.children)))
+
+    def level_order(self, node=None):
+        """
+        Yield (node, depth) in level order (breadth-first), left to right.
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(w), where w is the maximum number of nodes on one level.
+
+        Args:
+            node (TreeNode, optional): Node to start from. Defaults to root.
+
+        Yields:
+            tuple: (TreeNode, depth)
+        """
+        if node is None:
+            node = self.root
+        queue = deque([(node, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            yield current, depth
+            for child in current.children:
+                queue.append((child, depth + 1))
+
     # ===============================
     # PRINT TREE METHOD
     # ===============================
@@ -79,11 +756,11 @@ class GeneralTree:
         Time Complexity:
             - O(n): Traverses every node in the tree.
         Space Complexity:
-            - O(h): Recursion stack space, where h is height of the tree.
+            - O(h): Traversal stack, where h is height of the tree (no recursion).
 
         Args:
             node (TreeNode, optional): Node to start printing from. Defaults to root.
-            level (int, optional): Current tree level for indentation. Defaults to 0.
+            level (int, optional): Indentation level of the start node. Defaults to 0.
 
         Example Output:
             -Company
@@ -94,12 +771,8 @@ class GeneralTree:
                     -Karan
                     -Meera
         """
-        if node is None:
-            node = self.root
-        
-        print("    " * level + f" -{node.data}")
-        for child in node.children:
-            self.print_tree(child, level=level+1)
+        for current, depth in self.preorder(node):
+            print("    " * (level + depth) + f" -{current.data}")
 
 
 # ===============================
@@ -141,4 +814,63 @@ if __name__ == "__main__":
     tree.add_child(rnd_department, "Priya")
 
     # Print the tree hierarchy
-    tree.print_tree()
\ No newline at end of file
+    tree.print_tree()
+
+    # Generator traversals yield (node, depth) pairs
+    print("Post-order:", [node.data for node, _ in tree.postorder(it_department)])
+    print("Level 1:", [node.data for node, depth in tree.level_order() if depth == 1])
+    print("Down to depth 1:", [node.data for node, _ in tree.depth_limited(1)])
+
+    # No recursion: a 100,000-level chain is far beyond the recursion limit
+    chain = GeneralTree(0, index_paths=False)
+    node = chain.root
+    for i in range(1, 100000):
+        node = chain.add_child(node, i)
+    deepest = max(depth for _, depth in chain.postorder())
+    print("Depth of a 100,000-node chain:", deepest)
+
+    # Path index and parent pointers
+    aarav = tree.find("Company/IT/Aarav")
+    print("Found:", aarav.data, "| path:", tree.path_of(aarav),
+          "| ancestors:", [node.data for node in tree.ancestors(aarav)])
+    print("IT's child 'Diya':", it_department.child_index["Diya"].data)
+    tree.move(aarav, ai_department)
+    print("After move:", tree.find("Company/IT/Aarav"), "->", tree.path_of(tree.find("Company/AI/Aarav")))
+    tree.remove(hr_department)
+    print("HR removed; 'Company/HR/Karan' indexed?", "Company/HR/Karan" in tree.path_index)
+    print("Chain node 500 by path:", chain.find("/".join(map(str, range(501)))).data)
+
+    # Ancestor queries: the index is built on first use and after mutations
+    diya, isha = tree.find("Company/IT/Diya"), tree.find("Company/AI/Isha")
+    print("Is Diya under IT?", tree.is_ancestor(it_department, diya))
+    print("Nearest common manager of Aarav and Isha:", tree.lowest_common_ancestor(aarav, isha).data)
+    print("Nearest common manager of Diya and Isha:", tree.lowest_common_ancestor(diya, isha).data)
+    print("2nd ancestor of chain node 99999:", chain.kth_ancestor(node, 2).data)
+
+    # Subtree aggregates: directory sizes kept current on every change
+    def file_size(entry):
+        return entry[1]
+
+    disk = GeneralTree(("/", 0), aggregates={
+        "files": SUBTREE_SIZE,
+        "bytes": Aggregate(file_size, operator.add, operator.sub),
+        "largest": Aggregate(file_size, max),
+    })
+    home = disk.add_child(disk.root, ("home", 0))
+    logs = disk.add_child(disk.root, ("var", 0))
+    disk.add_child(home, ("notes.txt", 1200))
+    disk.add_child(home, ("photo.jpg", 350000))
+    syslog = disk.add_child(logs, ("syslog", 90000))
+    print("Total bytes:", disk.aggregate(disk.root, "bytes"),
+          "| largest file:", disk.aggregate(disk.root, "largest"),
+          "| entries under /home:", disk.aggregate(home, "files"))
+    disk.move(syslog, home)
+    print("Bytes under /home after moving syslog:", disk.aggregate(home, "bytes"),
+          "| under /var:", disk.aggregate(logs, "bytes"))
+
+    # Bulk loading from edges; "e2" arrives before its parent "e1"
+    edges = [(None, "c", "Company"), ("e1", "e2", "Diya"), ("c", "d1", "IT"), ("d1", "e1", "Aarav")]
+    loaded = GeneralTree.from_edges(edges, aggregates={"size": SUBTREE_SIZE})
+    loaded.print_tree()
+    print("Headcount:", loaded.aggregate(loaded.root, "size"), "| path lookup:",
+          loaded.find("Company/IT/Aarav/Diya").data)
\ No newline at end of file
@@ -0,0 +1,105 @@
+# ===============================
+# Streaming Edge Readers for GeneralTree Bulk Loading
+# ===============================
+
+import csv
+import json
+
+from general_tree import GeneralTree
+
+
+def read_edges_csv(path, parent_field="parent_id", child_field="child_id", data_field="data"):
+    """
+    Stream (parent_id, child_id, data) edges from a CSV file with a header row.
+
+    An empty parent_id marks the root. Values are yielded as strings.
+
+    Time Complexity:
+        - O(n) for n rows.
+    Space Complexity:
+        - O(1): one row at a time.
+
+    Args:
+        path (str): CSV file to read.
+        parent_field, child_field, data_field (str, optional): Column names.
+
+    Yields:
+        tuple: (parent_id or None, child_id, data)
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            yield row[parent_field] or None, row[child_field], row[data_field]
+
+
+def read_edges_jsonl(path, parent_field="parent_id", child_field="child_id", data_field="data"):
+    """
+    Stream (parent_id, child_id, data) edges from a JSON-lines file.
+
+    Each non-blank line is one object; a null or missing parent_id marks the
+    root, and data may be any JSON value.
+
+    Time Complexity:
+        - O(n) for n lines.
+    Space Complexity:
+        - O(1): one line at a time.
+
+    Yields:
+        tuple: (parent_id or None, child_id, data)
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get(parent_field), record[child_field], record.get(data_field)
+
+
+def load_tree(path, index_paths=True, aggregates=None, **fields):
+    """
+    Build a GeneralTree from an edge file, chosen by extension (.csv, .jsonl
+    or .ndjson), in one streaming pass.
+
+    Args:
+        path (str): Edge file.
+        index_paths (bool, optional): See GeneralTree. Defaults to True.
+        aggregates (dict, optional): See GeneralTree.
+        **fields: Column names passed to the reader.
+
+    Returns:
+        GeneralTree: The loaded tree.
+
+    Raises:
+        ValueError: For an unknown extension or invalid edges.
+    """
+    if path.endswith(".csv"):
+        edges = read_edges_csv(path, **fields)
+    elif path.endswith((".jsonl", ".ndjson")):
+        edges = read_edges_jsonl(path, **fields)
+    else:
+        raise ValueError(f"unsupported edge file '{path}' (expected .csv, .jsonl or .ndjson)")
+    return GeneralTree.from_edges(edges, index_paths=index_paths, aggregates=aggregates)
+
+
+# ===============================
+# DEMO USAGE
+# ===============================
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "org.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["parent_id", "child_id", "data"])
+            writer.writerow(["2", "5", "Aarav"])  # Parent 2 appears later
+            writer.writerow(["", "1", "Company"])
+            writer.writerow(["1", "2", "IT"])
+            writer.writerow(["1", "3", "HR"])
+            writer.writerow(["3", "4", "Karan"])
+        load_tree(csv_path).print_tree()
+
+        jsonl_path = os.path.join(directory, "org.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as file:
+            for parent_id, child_id, data in read_edges_csv(csv_path):
+                file.write(json.dumps({"parent_id": parent_id, "child_id": child_id, "data": data}) + "\n")
+        print("JSON lines path lookup:", load_tree(jsonl_path).find("Company/HR/Karan").data)
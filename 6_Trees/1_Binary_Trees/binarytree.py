@@ -2,6 +2,11 @@
 # Binary Tree Implementation
 # ===============================
 
+from collections import deque
+
+EMPTY = object()  # Marks a missing position in an ArrayBinaryTree
+
+
 class TreeNode:
     """
     TreeNode represents a single node in a Binary Tree.
@@ -34,6 +39,8 @@ class BinaryTree:
 
     Complexity Overview:
         - Insertion: O(1) (places node in first available child position).
+        - Level-order insertion (insert/extend): O(1) amortized with a
+          maintained frontier of nodes that still have a free child slot.
         - Deletion:
             - Leaf node: O(1)
             - Node with children: O(h), where h is the height of the subtree 
@@ -44,6 +51,10 @@ class BinaryTree:
     def __init__(self, data):
         # Initialize tree with root node
         self.root = TreeNode(data)
+        # (position, node) pairs with a free child slot, sorted by level-order
+        # position: inserted nodes, and gaps found by the last rebuild
+        self._frontier = deque([(0, self.root)])  # None = rebuild on next insert
+        self._gaps = deque()
     
     # ===============================
     # INSERTION METHOD
@@ -72,9 +83,114 @@ class BinaryTree:
             parent_node.right = child_node
         elif parent_node.left is None:
             parent_node.left = child_node
+        self._frontier = None
 
         return child_node
-    
+
+    def _rebuild_frontier(self):
+        """
+        Collect the nodes with a free child slot, as (position, node) pairs
+        sorted by level-order position, in one level-order pass.
+        """
+        gaps = deque()
+        queue = deque([(0, self.root)])
+        while queue:
+            position, node = queue.popleft()
+            if node.left is None or node.right is None:
+                gaps.append((position, node))
+            if node.left:
+                queue.append((2 * position + 1, node.left))
+            if node.right:
+                queue.append((2 * position + 2, node.right))
+        self._gaps = gaps
+        self._frontier = deque()
+        return self._frontier
+
+    def insert(self, value):
+        """
+        Add a node at the first free position in level order (left before
+        right), so a tree built only with insert stays complete.
+
+        Theory:
+            - Positions are numbered in level order as in ArrayBinaryTree: the
+              root is 0 and the children of position p are 2p+1 and 2p+2.
+              The first free position is the left or right slot of the node
+              with the smallest position that still has a free slot.
+            - Each insert takes the smallest free position, and the new slots
+              it opens are larger, so the positions of inserted nodes only
+              grow. Appending them to the frontier queue therefore keeps it
+              sorted, and the next parent is always at its front.
+            - add_child and the removal methods invalidate the frontier; the
+              next insert rebuilds it with one O(n) level-order pass that
+              collects the nodes with a free slot (the gaps) into a second
+              sorted queue. The parent is the smaller of the two queue heads,
+              so gaps are filled in level order, interleaved with the slots
+              of newly inserted nodes. Nodes linked by hand (node.left = ...)
+              are not seen until the frontier is rebuilt.
+
+        Time Complexity:
+            - O(1) amortized (O(n) once after add_child or a removal).
+        Space Complexity:
+            - O(w) for the frontier, where w is the width of the last levels.
+
+        Args:
+            value (Any): Value to be inserted.
+
+        Returns:
+            TreeNode: Newly created node.
+        """
+        frontier = self._frontier
+        if frontier is None:
+            frontier = self._rebuild_frontier()
+        gaps = self._gaps
+        queue = gaps if gaps and (not frontier or gaps[0][0] < frontier[0][0]) else frontier
+        position, parent = queue[0]
+        node = TreeNode(value)
+        if parent.left is None:
+            parent.left = node
+            position = 2 * position + 1
+            if parent.right is not None:
+                queue.popleft()
+        else:
+            parent.right = node
+            position = 2 * position + 2
+            queue.popleft()
+        frontier.append((position, node))
+        return node
+
+    def extend(self, values):
+        """
+        Insert every value of an iterable in level order (bulk build).
+
+        Time Complexity:
+            - O(k) for k values.
+
+        Args:
+            values (Iterable): Values to be inserted.
+        """
+        if self._frontier is None:
+            self._rebuild_frontier()
+        values = iter(values)
+        if self._gaps:
+            for value in values:
+                self.insert(value)
+                if not self._gaps:
+                    break
+        frontier = self._frontier
+        append, popleft = frontier.append, frontier.popleft
+        for value in values:  # Inlined insert once no gaps are left (hot path)
+            position, parent = frontier[0]
+            node = TreeNode(value)
+            if parent.left is None:
+                parent.left = node
+                append((2 * position + 1, node))
+                if parent.right is not None:
+                    popleft()
+            else:
+                parent.right = node
+                append((2 * position + 2, node))
+                popleft()
+
     # ===============================
     # TRAVERSAL METHOD
     # ===============================
@@ -123,9 +239,11 @@ class BinaryTree:
         """
         if parent_node.left == child_node:
             parent_node.left = None
+            self._frontier = None  # Removal may open gaps; rebuild on next insert
             return True
         elif parent_node.right == child_node:
             parent_node.right = None
+            self._frontier = None
             return True
         else:
             return False
@@ -173,6 +291,7 @@ class BinaryTree:
             else:
                 # Case: Leaf node
                 parent_node.left = None
+            self._frontier = None
             return True
 
         # If child_node is parent's right
@@ -191,11 +310,272 @@ class BinaryTree:
                 parent_node.right = child_node.right
             else:
                 parent_node.right = None
+            self._frontier = None
             return True
 
         return False
 
 
+class ArrayBinaryTree:
+    """
+    Implicit (array-backed) Binary Tree: nodes live in one flat list in level
+    order, with no TreeNode objects and no child references.
+
+    Theory:
+        - The root is slot 0; the children of slot i are slots 2i+1 (left) and
+          2i+2 (right), and its parent is slot (i-1)//2. All navigation is
+          O(1) arithmetic.
+        - A complete tree (every level full except the last, filled from the
+          left) uses exactly n slots. Other shapes need EMPTY placeholders for
+          missing positions, up to 2^h slots for height h, so this form is
+          meant for complete or nearly complete trees.
+        - Level order is a plain scan of the list; depth-first traversals use
+          an explicit stack of slot indices (no recursion).
+        - Memory: one list reference (8 bytes) per node, versus a TreeNode
+          object with data, left and right (~100+ bytes) in the linked form.
+
+    Real-world Usage:
+        - Binary heaps and priority queues.
+        - Segment trees and Fenwick-style layouts.
+        - Complete tournament/bracket trees.
+
+    Complexity Overview:
+        - parent / left / right index: O(1)
+        - append (next level-order position): O(1) amortized
+        - Traversals: O(slots) time; depth-first ones use O(h) stack space.
+        - Space Complexity: O(slots) = O(n) for complete trees.
+    """
+    def __init__(self, values=()):
+        """
+        Initialize the tree from values in level order (EMPTY for holes).
+
+        Args:
+            values (Iterable, optional): Slot contents in level order.
+
+        Raises:
+            ValueError: If a value sits under an EMPTY parent slot.
+        """
+        self.slots = list(values)
+        self.count = 0
+        for i, value in enumerate(self.slots):
+            if value is not EMPTY:
+                self._check_parent(i)
+                self.count += 1
+
+    def _check_parent(self, i):
+        """Reject a node in slot i whose parent slot is EMPTY (an orphan)."""
+        if i and self.slots[(i - 1) // 2] is EMPTY:
+            raise ValueError(f"slot {i} holds a value but its parent slot {(i - 1) // 2} is EMPTY")
+
+    def __len__(self):
+        """Return the number of nodes (EMPTY slots excluded)."""
+        return self.count
+
+    # ===============================
+    # NAVIGATION METHODS
+    # ===============================
+    @staticmethod
+    def parent_index(i):
+        """Slot of the parent of slot i (-1 for the root)."""
+        return (i - 1) // 2 if i else -1
+
+    @staticmethod
+    def left_index(i):
+        return 2 * i + 1
+
+    @staticmethod
+    def right_index(i):
+        return 2 * i + 2
+
+    @staticmethod
+    def depth(i):
+        """Depth of slot i (root = 0)."""
+        return (i + 1).bit_length() - 1
+
+    def has_node(self, i):
+        """True if slot i holds a node."""
+        return 0 <= i < len(self.slots) and self.slots[i] is not EMPTY
+
+    def is_complete(self):
+        """True if there are no EMPTY holes (a complete binary tree)."""
+        return self.count == len(self.slots)
+
+    # ===============================
+    # INSERTION METHOD
+    # ===============================
+    def append(self, value):
+        """
+        Add a node at the next level-order position, keeping a complete tree
+        complete. Appending EMPTY leaves a hole.
+
+        Time Complexity:
+            - O(1) amortized.
+
+        Returns:
+            int: The slot of the new node.
+
+        Raises:
+            ValueError: If the parent of the next slot is EMPTY.
+        """
+        i = len(self.slots)
+        if value is not EMPTY:
+            self._check_parent(i)
+            self.count += 1
+        self.slots.append(value)
+        return i
+
+    # ===============================
+    # TRAVERSAL METHODS
+    # ===============================
+    def level_order(self):
+        """
+        Yield values in level order: a sequential scan of the slots.
+
+        Time Complexity:
+            - O(slots)
+        Space Complexity:
+            - O(1)
+        """
+        for value in self.slots:
+            if value is not EMPTY:
+                yield value
+
+    def _preorder_indices(self):
+        if not self.has_node(0):
+            return
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            yield i
+            if self.has_node(2 * i + 2):
+                stack.append(2 * i + 2)
+            if self.has_node(2 * i + 1):
+                stack.append(2 * i + 1)
+
+    def preorder(self):
+        """
+        Yield values in pre-order (node, left subtree, right subtree).
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(h) explicit stack.
+        """
+        slots = self.slots
+        for i in self._preorder_indices():
+            yield slots[i]
+
+    def inorder(self):
+        """
+        Yield values in in-order (left subtree, node, right subtree).
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(h) explicit stack.
+        """
+        slots, stack = self.slots, []
+        i = 0
+        while stack or self.has_node(i):
+            if self.has_node(i):
+                stack.append(i)
+                i = 2 * i + 1
+            else:
+                i = stack.pop()
+                yield slots[i]
+                i = 2 * i + 2
+
+    def postorder(self):
+        """
+        Yield values in post-order (left subtree, right subtree, node).
+
+        Time Complexity:
+            - O(n)
+        Space Complexity:
+            - O(h) explicit stack.
+        """
+        if not self.has_node(0):
+            return
+        slots = self.slots
+        stack = [(0, False)]
+        while stack:
+            i, children_done = stack.pop()
+            if children_done:
+                yield slots[i]
+                continue
+            stack.append((i, True))
+            if self.has_node(2 * i + 2):
+                stack.append((2 * i + 2, False))
+            if self.has_node(2 * i + 1):
+                stack.append((2 * i + 1, False))
+
+    def print_tree(self):
+        """
+        Print the tree in the same layout as BinaryTree.print_tree, without recursion.
+
+        Time Complexity:
+            - O(n)
+        """
+        for i in self._preorder_indices():
+            print("   " * self.depth(i) + " -" + str(self.slots[i]))
+
+    # ===============================
+    # CONVERSION METHODS
+    # ===============================
+    @classmethod
+    def from_linked(cls, tree):
+        """
+        Build the array form of a linked BinaryTree with a level-order walk.
+
+        Time Complexity:
+            - O(slots): n for complete trees, up to 2^h for sparse ones.
+        Space Complexity:
+            - O(slots) for the list, O(w) for the queue.
+        """
+        result = cls()
+        if tree.root is None:
+            return result
+        slots = result.slots
+        queue = deque([(tree.root, 0)])
+        while queue:
+            node, i = queue.popleft()
+            if i >= len(slots):
+                slots.extend([EMPTY] * (i + 1 - len(slots)))
+            slots[i] = node.data
+            result.count += 1
+            if node.left is not None:
+                queue.append((node.left, 2 * i + 1))
+            if node.right is not None:
+                queue.append((node.right, 2 * i + 2))
+        return result
+
+    def to_linked(self):
+        """
+        Build the linked BinaryTree with the same shape.
+
+        Time Complexity:
+            - O(slots)
+
+        Raises:
+            ValueError: If the tree is empty.
+        """
+        if not self.has_node(0):
+            raise ValueError("cannot convert an empty tree")
+        tree = BinaryTree(self.slots[0])
+        nodes = [tree.root] + [None] * (len(self.slots) - 1)
+        for i in range(1, len(self.slots)):
+            value = self.slots[i]
+            parent = nodes[(i - 1) // 2]
+            if value is EMPTY or parent is None:
+                continue
+            node = nodes[i] = TreeNode(value)
+            if i % 2:
+                parent.left = node
+            else:
+                parent.right = node
+        return tree
+
+
 # ===============================
 # DEMO USAGE
 # ===============================
@@ -244,3 +624,58 @@ if __name__ == "__main__":
     print("After Removing 30:")
     tree.print_tree()
     print()
+
+    # ----------------------------
+    # Step 4: Implicit array form of the tree
+    # ----------------------------
+    array_tree = ArrayBinaryTree.from_linked(tree)
+    print("Array form:", ["_" if value is EMPTY else value for value in array_tree.slots])
+    print("In-order:", list(array_tree.inorder()))
+    print("Parent of slot 4:", array_tree.slots[ArrayBinaryTree.parent_index(4)])
+    print("Round trip matches?", list(ArrayBinaryTree.from_linked(array_tree.to_linked()).preorder())
+          == list(array_tree.preorder()))
+
+    # Level-order scan of a complete tree: array form versus linked nodes
+    import time
+
+    complete = ArrayBinaryTree(range(1000000))
+    linked = complete.to_linked()
+    start = time.perf_counter()
+    total = sum(complete.level_order())
+    array_time = time.perf_counter() - start
+    start = time.perf_counter()
+    linked_total, queue = 0, deque([linked.root])
+    while queue:
+        node = queue.popleft()
+        linked_total += node.data
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+    linked_time = time.perf_counter() - start
+    print(f"Level-order sum of 10^6 nodes: array {array_time:.3f}s, linked {linked_time:.3f}s, "
+          f"same result: {total == linked_total}")
+
+    # ----------------------------
+    # Step 5: Level-order insertion
+    # ----------------------------
+    tree.insert(160)  # Fills the first gap left by the removals
+    tree.insert(170)
+    print("After inserting 160 and 170:")
+    tree.print_tree()
+
+    # Removing a whole branch: the refilled branch gets its children before
+    # the deeper nodes on the other side
+    small_tree = BinaryTree(0)
+    small_tree.extend(range(1, 7))
+    small_tree.remove_full_branch(small_tree.root, small_tree.root.left)
+    for value in (7, 8, 9):
+        small_tree.insert(value)
+    print("Insert after removal fills level order?",
+          ArrayBinaryTree.from_linked(small_tree).slots == [0, 7, 2, 8, 9, 5, 6])
+
+    complete_tree = BinaryTree(0)
+    start = time.perf_counter()
+    complete_tree.extend(range(1, 1000000))
+    print(f"extend built 10^6 nodes in {time.perf_counter() - start:.2f}s, "
+          f"complete: {ArrayBinaryTree.from_linked(complete_tree).is_complete()}")